@@ -0,0 +1,181 @@
+"""
+Discovery Benchmark Suite
+Runs ScraperOrchestrator.run_all_agents against a replayed fixture archive and
+reports pages/s, items/s, parse ms/page and peak RSS.
+
+Usage:
+    python -m benchmarks.bench_discovery                         # synthetic fixtures
+    python -m benchmarks.bench_discovery data/fixtures.json.gz   # recorded fixtures
+
+Author: Manus AI
+Date: October 20, 2025
+"""
+
+import argparse
+import asyncio
+import json
+import resource
+import sys
+import time
+from typing import Dict, List
+from urllib.parse import urlparse
+
+from components.discovery.http_fixtures import FixtureArchive, ReplayTransport
+from components.discovery.web_scraper import (
+    BaseScraperAgent,
+    GitHubScraperAgent,
+    RedditScraperAgent,
+    ScraperOrchestrator
+)
+
+
+def github_trending_page(rows: int, seed: str) -> str:
+    """Synthetic GitHub trending page in the live markup"""
+    articles = []
+    for i in range(rows):
+        topic = "workflow automation bot" if i % 2 == 0 else "image editor"
+        articles.append(
+            f'<article class="Box-row"><h2 class="h3 lh-condensed">'
+            f'<a href="/dev{i}/{seed}-repo-{i}">dev{i} / <span>{seed}-repo-{i}</span></a></h2>'
+            f'<p class="col-9 color-fg-muted my-1 pr-4">A {topic} written in Python ({seed} #{i})</p>'
+            f'<span class="d-inline-block float-sm-right">{i * 13} stars today</span></article>'
+        )
+    return f"<html><body><div class='Box'>{''.join(articles)}</div></body></html>"
+
+
+def reddit_listing_page(subreddit: str, page: int, rows: int, has_next: bool) -> str:
+    """Synthetic old.reddit listing page with a next-button cursor"""
+    things = []
+    for i in range(rows):
+        post = f"{page}_{i}"
+        title = "How to automate my workflow with a python script" if i % 3 else "Weekly thread"
+        things.append(
+            f'<div class="thing id-t3_{post} odd link"><div class="score unvoted">{i * 7}</div>'
+            f'<a class="title may-blank" href="/r/{subreddit}/comments/{post}/">{title} {post}</a>'
+            f'<a class="author may-blank">user{i}</a><a class="subreddit hover">r/{subreddit}</a></div>'
+        )
+    next_link = (
+        f'<span class="next-button"><a href="https://old.reddit.com/r/{subreddit}/?count={rows * page}&amp;after=t3_{page}">next</a></span>'
+        if has_next else ""
+    )
+    return f"<html><body><div id='siteTable'>{''.join(things)}</div>{next_link}</body></html>"
+
+
+def synthetic_archive(github_rows: int = 25, reddit_rows: int = 25, reddit_pages: int = 4) -> FixtureArchive:
+    """Fixture archive covering every default agent target and its pagination"""
+    archive = FixtureArchive()
+    headers = {"Content-Type": "text/html; charset=utf-8"}
+
+    for url in GitHubScraperAgent().target_urls:
+        seed = urlparse(url).query or "default"
+        archive.add(url, 200, headers, github_trending_page(github_rows, seed).encode())
+
+    for url in RedditScraperAgent().target_urls:
+        subreddit = urlparse(url).path.split("/")[2]
+        page_url = url
+        for page in range(1, reddit_pages + 1):
+            body = reddit_listing_page(subreddit, page, reddit_rows, has_next=page < reddit_pages)
+            archive.add(page_url, 200, headers, body.encode())
+            page_url = f"https://old.reddit.com/r/{subreddit}/?count={reddit_rows * page}&after=t3_{page}"
+
+    return archive
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process plus its parse workers (MB)"""
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    children = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return (usage + children) / divisor
+
+
+def bench_parse(archive: FixtureArchive, agents: List[BaseScraperAgent], repeat: int) -> Dict:
+    """Time the pure parse phase over every archived page"""
+    pages = []
+    for agent in agents:
+        hosts = {urlparse(url).netloc for url in agent.target_urls}
+        pages.extend((agent, url) for url in archive.responses if urlparse(url).netloc in hosts)
+
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for agent, url in pages:
+            agent.parse(url, archive.body(url))
+    elapsed = time.perf_counter() - start
+
+    parsed = len(pages) * repeat
+    return {
+        "pages": parsed,
+        "parse_ms_per_page": elapsed * 1000 / parsed if parsed else 0.0
+    }
+
+
+def bench_orchestrator(archive: FixtureArchive, parse_workers: int, latency: float, repeat: int) -> Dict:
+    """Time the full ScraperOrchestrator.run_all_agents path over replayed responses"""
+    pages = items = bytes_served = 0
+    elapsed = 0.0
+
+    for _ in range(repeat):
+        transport = ReplayTransport(archive, latency=latency)
+        orchestrator = ScraperOrchestrator(parse_workers=parse_workers, transport=transport)
+        orchestrator.scheduler = None  # replayed hosts need no politeness delays
+
+        start = time.perf_counter()
+        discoveries = asyncio.run(orchestrator.run_all_agents())
+        elapsed += time.perf_counter() - start
+
+        pages += transport.requests
+        items += len(discoveries)
+        bytes_served += transport.bytes_served
+
+    return {
+        "runs": repeat,
+        "pages": pages,
+        "items": items,
+        "seconds": elapsed,
+        "pages_per_second": pages / elapsed if elapsed else 0.0,
+        "items_per_second": items / elapsed if elapsed else 0.0,
+        "mb_served": bytes_served / (1024 * 1024)
+    }
+
+
+def main(argv: List[str] = None) -> Dict:
+    parser = argparse.ArgumentParser(description="Benchmark the discovery hot path")
+    parser.add_argument("archive", nargs="?", help="fixture archive recorded with http_fixtures (default: synthetic)")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--parse-workers", type=int, default=None)
+    parser.add_argument("--latency", type=float, default=0.0, help="simulated per-request latency in seconds")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    archive = FixtureArchive.load(args.archive) if args.archive else synthetic_archive()
+    parse_workers = args.parse_workers
+    if parse_workers is None:
+        parse_workers = ScraperOrchestrator(parse_workers=None).parse_workers
+
+    results = {
+        "fixtures": len(archive),
+        "parse": bench_parse(archive, [GitHubScraperAgent(), RedditScraperAgent()], args.repeat),
+        "orchestrator": bench_orchestrator(archive, parse_workers, args.latency, args.repeat),
+        "parse_workers": parse_workers,
+        "peak_rss_mb": peak_rss_mb()
+    }
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        run = results["orchestrator"]
+        print(f"\n{'='*60}")
+        print("DISCOVERY BENCHMARK")
+        print(f"{'='*60}")
+        print(f"Fixtures:        {results['fixtures']} pages ({parse_workers} parse workers)")
+        print(f"Pages/s:         {run['pages_per_second']:.1f}")
+        print(f"Items/s:         {run['items_per_second']:.1f}")
+        print(f"Parse ms/page:   {results['parse']['parse_ms_per_page']:.2f}")
+        print(f"Peak RSS:        {results['peak_rss_mb']:.1f} MB")
+        print(f"{'='*60}\n")
+
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -4,29 +4,51 @@ Curation Component - Zone 2 of AGI OS (The Automation Flywheel)
 Responsible for analyzing and scoring discovered loops:
 - Feature extraction (code analysis, text analysis)
 - Quality scoring (heuristic v1, RL-based v2 in Phase 2)
-- Redundancy detection (Phase 1 Day 3)
+- Redundancy detection (MinHash LSH)
 """
 
 from .feature_extractor import (
     ExtractedFeatures,
+    CodeMetrics,
     CodeAnalyzer,
     TextAnalyzer,
     QualityScorer as FeatureQualityScorer,
     FeatureExtractor
 )
 
+from .feature_cache import FeatureCache
+from .loop_ids import make_loop_id, loop_id_of
+
 from .quality_scorer import (
     QualityScore,
     HeuristicQualityScorer
 )
 
+from .rescoring import ScoreState, RescoreReport, rescore
+
+from .redundancy_detector import (
+    RedundancyResult,
+    MinHasher,
+    RedundancyDetector
+)
+
 __all__ = [
     'ExtractedFeatures',
+    'CodeMetrics',
     'CodeAnalyzer',
     'TextAnalyzer',
     'FeatureQualityScorer',
     'FeatureExtractor',
+    'FeatureCache',
+    'make_loop_id',
+    'loop_id_of',
     'QualityScore',
-    'HeuristicQualityScorer'
+    'HeuristicQualityScorer',
+    'ScoreState',
+    'RescoreReport',
+    'rescore',
+    'RedundancyResult',
+    'MinHasher',
+    'RedundancyDetector'
 ]
 
@@ -0,0 +1,134 @@
+"""
+Feature Cache - Component 2
+Content-addressed store of extracted features, so discoveries whose inputs
+are unchanged since an earlier run are never re-extracted.
+
+Author: Manus AI
+Date: October 21, 2025
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Discovery fields features are computed from. discovery_timestamp is left
+# out: it changes on every crawl and no feature depends on it yet (bump the
+# extractor version if one starts to).
+KEY_FIELDS = ('source_url', 'source_type', 'raw_content', 'metadata')
+
+
+class FeatureCache:
+    """Extracted features keyed by a digest of their inputs, stored in SQLite
+
+    Entries are evicted least recently used first once there are more than
+    max_entries. Hits only touch memory until commit(), so lookups stay
+    cheap on the streaming path.
+    """
+
+    def __init__(self, path: str, max_entries: int = 200_000):
+        self.max_entries = max_entries
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS features (
+                key TEXT PRIMARY KEY,
+                features TEXT NOT NULL,
+                last_used REAL NOT NULL
+            )
+            """
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS features_last_used ON features (last_used)")
+        self.conn.commit()
+        self.size = self.conn.execute("SELECT COUNT(*) FROM features").fetchone()[0]
+        self.hits = 0
+        self.misses = 0
+        self._touched: Dict[str, float] = {}
+
+    @staticmethod
+    def key(discovery: Dict, version: int) -> str:
+        """Stable digest of a discovery's feature inputs and the extractor version"""
+        inputs = {name: discovery.get(name) for name in KEY_FIELDS}
+        payload = json.dumps([version, inputs], sort_keys=True, separators=(',', ':'))
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict]:
+        row = self.conn.execute("SELECT features FROM features WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._touched[key] = time.time()
+        return json.loads(row[0])
+
+    def get_many(self, keys: List[str]) -> Dict[str, Dict]:
+        """Cached features for whichever keys are present"""
+        found = {}
+        unique = list(dict.fromkeys(keys))
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(unique), 500):
+            batch = unique[start:start + 500]
+            rows = self.conn.execute(
+                f"SELECT key, features FROM features WHERE key IN ({','.join('?' * len(batch))})", batch
+            )
+            found.update((key, json.loads(features)) for key, features in rows)
+
+        now = time.time()
+        self._touched.update((key, now) for key in found)
+        self.hits += sum(1 for key in keys if key in found)
+        self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def put(self, key: str, features: Dict):
+        self.put_many([(key, features)], commit=False)
+
+    def put_many(self, items: Iterable[Tuple[str, Dict]], commit: bool = True):
+        now = time.time()
+        rows = [(key, json.dumps(features), now) for key, features in items]
+        self.conn.executemany("INSERT OR REPLACE INTO features VALUES (?, ?, ?)", rows)
+        self.size += len(rows)
+        if self.size > self.max_entries:
+            self.evict()
+        if commit:
+            self.commit()
+
+    def evict(self):
+        """Drop least recently used entries down to 90% of max_entries"""
+        self._flush_touched()
+        self.size = self.conn.execute("SELECT COUNT(*) FROM features").fetchone()[0]
+        excess = self.size - int(self.max_entries * 0.9)
+        if excess <= 0:
+            return
+        self.conn.execute(
+            "DELETE FROM features WHERE key IN (SELECT key FROM features ORDER BY last_used, rowid LIMIT ?)",
+            (excess,)
+        )
+        self.size -= excess
+        logger.info(f"Feature cache evicted {excess} entries")
+
+    def _flush_touched(self):
+        self.conn.executemany(
+            "UPDATE features SET last_used = ? WHERE key = ?",
+            [(used, key) for key, used in self._touched.items()]
+        )
+        self._touched.clear()
+
+    def commit(self):
+        """Persist new entries and recency updates"""
+        self._flush_touched()
+        self.conn.commit()
+
+    def close(self):
+        self.commit()
+        self.conn.close()
@@ -9,11 +9,18 @@ Date: October 17, 2025
 import ast
 import json
 import logging
+import os
 import re
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
 from collections import Counter
 
+from .feature_cache import FeatureCache
+from .feature_store import save_features
+from .keyword_matcher import KeywordMatcher
+from .loop_ids import loop_id_of
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -33,6 +40,10 @@ class ExtractedFeatures:
     code_language: Optional[str]
     code_complexity: float  # 0-1 scale
     code_lines: int
+    code_cyclomatic: int  # McCabe complexity; 0 unless the code is Python that parses
+    code_max_depth: int
+    code_calls: int
+    code_imports: List[str]  # top-level modules imported, sorted
     
     # Text features
     title_length: int
@@ -65,6 +76,10 @@ class ExtractedFeatures:
             "code_language": self.code_language,
             "code_complexity": self.code_complexity,
             "code_lines": self.code_lines,
+            "code_cyclomatic": self.code_cyclomatic,
+            "code_max_depth": self.code_max_depth,
+            "code_calls": self.code_calls,
+            "code_imports": self.code_imports,
             "title_length": self.title_length,
             "description_length": self.description_length,
             "has_tutorial": self.has_tutorial,
@@ -81,6 +96,117 @@ class ExtractedFeatures:
         }
 
 
+@dataclass
+class CodeMetrics:
+    """Metrics vector collected from one pass over a Python AST"""
+    
+    functions: int = 0
+    classes: int = 0
+    loops: int = 0
+    conditionals: int = 0
+    try_blocks: int = 0
+    comprehensions: int = 0
+    bool_ops: int = 0
+    calls: int = 0
+    cyclomatic: int = 1  # McCabe: 1 + decision points
+    max_depth: int = 0
+    imports: Set[str] = field(default_factory=set)
+    
+    @property
+    def weighted_complexity(self) -> float:
+        """Weighted complexity score (normalized by calculate_complexity)"""
+        return (
+            self.functions * 2 +
+            self.classes * 3 +
+            (self.loops + self.comprehensions) * 1.5 +
+            (self.conditionals + self.bool_ops) * 1 +
+            self.try_blocks * 2
+        )
+
+
+class ComplexityVisitor(ast.NodeVisitor):
+    """Collects CodeMetrics in a single traversal"""
+    
+    def __init__(self):
+        self.metrics = CodeMetrics()
+        self.depth = 0
+    
+    def nested(self, node: ast.AST):
+        """Visit the children of a block statement one level deeper"""
+        self.depth += 1
+        self.metrics.max_depth = max(self.metrics.max_depth, self.depth)
+        self.generic_visit(node)
+        self.depth -= 1
+    
+    def visit_FunctionDef(self, node: ast.AST):
+        self.metrics.functions += 1
+        self.nested(node)
+    
+    visit_AsyncFunctionDef = visit_FunctionDef
+    
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self.metrics.classes += 1
+        self.nested(node)
+    
+    def visit_For(self, node: ast.AST):
+        self.metrics.loops += 1
+        self.metrics.cyclomatic += 1
+        self.nested(node)
+    
+    visit_AsyncFor = visit_For
+    visit_While = visit_For
+    
+    def visit_If(self, node: ast.If):
+        self.metrics.conditionals += 1
+        self.metrics.cyclomatic += 1
+        self.nested(node)
+    
+    def visit_IfExp(self, node: ast.IfExp):
+        self.metrics.conditionals += 1
+        self.metrics.cyclomatic += 1
+        self.generic_visit(node)
+    
+    def visit_Try(self, node: ast.AST):
+        self.metrics.try_blocks += 1
+        self.metrics.cyclomatic += len(node.handlers)
+        self.nested(node)
+    
+    visit_TryStar = visit_Try
+    
+    def visit_With(self, node: ast.AST):
+        self.nested(node)
+    
+    visit_AsyncWith = visit_With
+    
+    def visit_comprehension(self, node: ast.comprehension):
+        self.metrics.comprehensions += 1
+        self.metrics.cyclomatic += 1 + len(node.ifs)
+        self.generic_visit(node)
+    
+    def visit_BoolOp(self, node: ast.BoolOp):
+        # Each extra operand short-circuits: one more path
+        self.metrics.bool_ops += 1
+        self.metrics.cyclomatic += len(node.values) - 1
+        self.generic_visit(node)
+    
+    def visit_match_case(self, node: ast.AST):
+        self.metrics.conditionals += 1
+        self.metrics.cyclomatic += 1
+        self.nested(node)
+    
+    def visit_Call(self, node: ast.Call):
+        self.metrics.calls += 1
+        self.generic_visit(node)
+    
+    def visit_Import(self, node: ast.Import):
+        self.metrics.imports.update(alias.name.split('.')[0] for alias in node.names)
+    
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        # Relative imports (from . import x) name no external module
+        if node.module and not node.level:
+            self.metrics.imports.add(node.module.split('.')[0])
+
+
 class CodeAnalyzer:
     """Analyzes code snippets using AST parsing"""
     
@@ -100,44 +226,50 @@ class CodeAnalyzer:
             return 'unknown'
     
     @staticmethod
-    def calculate_complexity(code: str, language: str) -> float:
-        """Calculate code complexity (0-1 scale)"""
-        if language != 'python':
-            # Simple line-based complexity for non-Python
-            lines = [l for l in code.split('\n') if l.strip()]
-            return min(len(lines) / 100.0, 1.0)
-        
+    def code_metrics(code: str) -> Optional[CodeMetrics]:
+        """Metrics vector of a Python snippet; None if it does not parse"""
         try:
             tree = ast.parse(code)
-            
-            # Count various complexity indicators
-            num_functions = sum(1 for node in ast.walk(tree) if isinstance(node, ast.FunctionDef))
-            num_classes = sum(1 for node in ast.walk(tree) if isinstance(node, ast.ClassDef))
-            num_loops = sum(1 for node in ast.walk(tree) if isinstance(node, (ast.For, ast.While)))
-            num_conditionals = sum(1 for node in ast.walk(tree) if isinstance(node, ast.If))
-            num_try_except = sum(1 for node in ast.walk(tree) if isinstance(node, ast.Try))
-            
-            # Weighted complexity score
-            complexity = (
-                num_functions * 2 +
-                num_classes * 3 +
-                num_loops * 1.5 +
-                num_conditionals * 1 +
-                num_try_except * 2
-            )
-            
-            # Normalize to 0-1 scale
-            return min(complexity / 50.0, 1.0)
-        
-        except SyntaxError:
-            # If parsing fails, use simple line count
-            lines = [l for l in code.split('\n') if l.strip()]
-            return min(len(lines) / 100.0, 1.0)
+        except (SyntaxError, ValueError):
+            return None
+        
+        visitor = ComplexityVisitor()
+        visitor.visit(tree)
+        return visitor.metrics
+    
+    @staticmethod
+    def calculate_complexity(
+        code: str,
+        language: str,
+        metrics: Optional[CodeMetrics] = None,
+        num_lines: Optional[int] = None
+    ) -> float:
+        """Calculate code complexity (0-1 scale); metrics and num_lines skip recomputing them"""
+        if language == 'python' and metrics is None:
+            metrics = CodeAnalyzer.code_metrics(code)
+        
+        if language != 'python' or metrics is None:
+            # Simple line-based complexity for non-Python, or Python that does not parse
+            if num_lines is None:
+                num_lines = CodeAnalyzer.count_lines(code)
+            return min(num_lines / 100.0, 1.0)
+        
+        # Normalize to 0-1 scale
+        return min(metrics.weighted_complexity / 50.0, 1.0)
     
     @staticmethod
     def count_lines(code: str) -> int:
         """Count non-empty lines of code"""
         return len([l for l in code.split('\n') if l.strip()])
+    
+    @staticmethod
+    def analyze(code: str) -> Tuple[str, float, int, Optional[CodeMetrics]]:
+        """Language, complexity, line count and metrics, counting lines once and parsing once"""
+        language = CodeAnalyzer.detect_language(code)
+        num_lines = CodeAnalyzer.count_lines(code)
+        metrics = CodeAnalyzer.code_metrics(code) if language == 'python' else None
+        complexity = CodeAnalyzer.calculate_complexity(code, language, metrics, num_lines)
+        return language, complexity, num_lines, metrics
 
 
 class TextAnalyzer:
@@ -163,6 +295,9 @@ class TextAnalyzer:
         'advanced': ['advanced', 'complex', 'production', 'scalable', 'enterprise']
     }
     
+    TUTORIAL_KEYWORDS = ['tutorial', 'how to', 'guide', 'step by step', 'learn', 'walkthrough']
+    DOC_KEYWORDS = ['documentation', 'docs', 'readme', 'api reference', 'manual']
+    
     @staticmethod
     def extract_keywords(text: str, max_keywords: int = 10) -> List[str]:
         """Extract important keywords from text"""
@@ -180,13 +315,18 @@ class TextAnalyzer:
         return [word for word, count in word_counts.most_common(max_keywords)]
     
     @staticmethod
-    def categorize(text: str) -> Tuple[str, List[str]]:
+    def keyword_hits(text: str) -> Dict[Tuple[str, str], Set[str]]:
+        """Single pass over the text: (section, group) -> keywords found"""
+        return TEXT_KEYWORDS.group_hits(text)
+    
+    @staticmethod
+    def categorize(text: str, hits: Optional[Dict] = None) -> Tuple[str, List[str]]:
         """Categorize text into primary and secondary categories"""
-        text_lower = text.lower()
+        hits = TextAnalyzer.keyword_hits(text) if hits is None else hits
         
         category_scores = {}
-        for category, keywords in TextAnalyzer.CATEGORIES.items():
-            score = sum(1 for keyword in keywords if keyword in text_lower)
+        for category in TextAnalyzer.CATEGORIES:
+            score = len(hits.get(('category', category), ()))
             if score > 0:
                 category_scores[category] = score
         
@@ -202,29 +342,36 @@ class TextAnalyzer:
         return primary, secondary
     
     @staticmethod
-    def detect_complexity_level(text: str) -> str:
+    def detect_complexity_level(text: str, hits: Optional[Dict] = None) -> str:
         """Detect complexity level from text"""
-        text_lower = text.lower()
+        hits = TextAnalyzer.keyword_hits(text) if hits is None else hits
         
-        for level, keywords in TextAnalyzer.COMPLEXITY_KEYWORDS.items():
-            if any(keyword in text_lower for keyword in keywords):
+        for level in TextAnalyzer.COMPLEXITY_KEYWORDS:
+            if ('complexity', level) in hits:
                 return level
         
         return 'intermediate'  # Default
     
     @staticmethod
-    def has_tutorial_indicators(text: str) -> bool:
+    def has_tutorial_indicators(text: str, hits: Optional[Dict] = None) -> bool:
         """Check if text indicates a tutorial"""
-        tutorial_keywords = ['tutorial', 'how to', 'guide', 'step by step', 'learn', 'walkthrough']
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in tutorial_keywords)
+        hits = TextAnalyzer.keyword_hits(text) if hits is None else hits
+        return ('indicator', 'tutorial') in hits
     
     @staticmethod
-    def has_documentation_indicators(text: str) -> bool:
+    def has_documentation_indicators(text: str, hits: Optional[Dict] = None) -> bool:
         """Check if text indicates documentation"""
-        doc_keywords = ['documentation', 'docs', 'readme', 'api reference', 'manual']
-        text_lower = text.lower()
-        return any(keyword in text_lower for keyword in doc_keywords)
+        hits = TextAnalyzer.keyword_hits(text) if hits is None else hits
+        return ('indicator', 'documentation') in hits
+
+
+# All TextAnalyzer keyword tables compiled into one automaton
+TEXT_KEYWORDS = KeywordMatcher.from_groups({
+    **{('category', name): words for name, words in TextAnalyzer.CATEGORIES.items()},
+    **{('complexity', level): words for level, words in TextAnalyzer.COMPLEXITY_KEYWORDS.items()},
+    ('indicator', 'tutorial'): TextAnalyzer.TUTORIAL_KEYWORDS,
+    ('indicator', 'documentation'): TextAnalyzer.DOC_KEYWORDS
+})
 
 
 class QualityScorer:
@@ -284,16 +431,47 @@ class QualityScorer:
 class FeatureExtractor:
     """Main feature extraction engine"""
     
-    def __init__(self):
+    # Bump whenever extraction logic changes, so cached features are recomputed
+    VERSION = 2
+    
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 64, cache: Optional[FeatureCache] = None):
         self.code_analyzer = CodeAnalyzer()
         self.text_analyzer = TextAnalyzer()
         self.quality_scorer = QualityScorer()
+        # Batch worker processes (one per core by default); 0 extracts inline
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        # Discoveries per task sent to a worker
+        self.chunk_size = chunk_size
+        # Optional content-addressed cache: unchanged discoveries are not re-extracted
+        self.cache = cache
+    
+    @staticmethod
+    def loop_id(discovery: Dict) -> str:
+        return loop_id_of(discovery)
+    
+    def from_cached(self, features: Dict, discovery: Dict) -> Dict:
+        # loop_id is the discovery's, not part of the cached content
+        return {**features, 'loop_id': self.loop_id(discovery)}
     
     def extract_features(self, discovery: Dict) -> ExtractedFeatures:
+        """Extract all features from a discovery, from the cache when its inputs are unchanged"""
+        if self.cache is None:
+            return self.compute_features(discovery)
+        
+        key = self.cache.key(discovery, self.VERSION)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return ExtractedFeatures(**self.from_cached(cached, discovery))
+        
+        features = self.compute_features(discovery)
+        self.cache.put(key, features.to_dict())
+        return features
+    
+    def compute_features(self, discovery: Dict) -> ExtractedFeatures:
         """Extract all features from a discovery"""
         
         # Basic identifiers
-        loop_id = f"{discovery['source_type']}_{hash(discovery['source_url']) % 1000000}"
+        loop_id = self.loop_id(discovery)
         source_url = discovery['source_url']
         source_type = discovery['source_type']
         
@@ -304,18 +482,21 @@ class FeatureExtractor:
         
         # Code analysis
         has_code = len(description) > 100 and any(indicator in description for indicator in ['def ', 'import ', 'class ', 'function'])
-        code_language = self.code_analyzer.detect_language(description) if has_code else None
-        code_complexity = self.code_analyzer.calculate_complexity(description, code_language or 'unknown') if has_code else 0.0
-        code_lines = self.code_analyzer.count_lines(description) if has_code else 0
+        if has_code:
+            code_language, code_complexity, code_lines, metrics = self.code_analyzer.analyze(description)
+        else:
+            code_language, code_complexity, code_lines, metrics = None, 0.0, 0, None
+        metrics = metrics or CodeMetrics(cyclomatic=0)
         
         # Text analysis
         title_length = len(title)
         description_length = len(description)
-        has_tutorial = self.text_analyzer.has_tutorial_indicators(full_text)
-        has_documentation = self.text_analyzer.has_documentation_indicators(full_text)
+        hits = self.text_analyzer.keyword_hits(full_text)
+        has_tutorial = self.text_analyzer.has_tutorial_indicators(full_text, hits)
+        has_documentation = self.text_analyzer.has_documentation_indicators(full_text, hits)
         keywords = self.text_analyzer.extract_keywords(full_text)
-        primary_category, secondary_categories = self.text_analyzer.categorize(full_text)
-        complexity_level = self.text_analyzer.detect_complexity_level(full_text)
+        primary_category, secondary_categories = self.text_analyzer.categorize(full_text, hits)
+        complexity_level = self.text_analyzer.detect_complexity_level(full_text, hits)
         
         # Quality scoring
         popularity_score = self.quality_scorer.calculate_popularity_score(discovery['metadata'], source_type)
@@ -343,6 +524,10 @@ class FeatureExtractor:
             code_language=code_language,
             code_complexity=code_complexity,
             code_lines=code_lines,
+            code_cyclomatic=metrics.cyclomatic,
+            code_max_depth=metrics.max_depth,
+            code_calls=metrics.calls,
+            code_imports=sorted(metrics.imports),
             title_length=title_length,
             description_length=description_length,
             has_tutorial=has_tutorial,
@@ -360,6 +545,66 @@ class FeatureExtractor:
         
         return features
     
+    def extract_batch(self, discoveries: List[Dict], offset: int = 0) -> Tuple[List[Optional[Dict]], int]:
+        """Extract features of each discovery; failed items become None. Returns (features, errors)"""
+        extracted, errors = [], 0
+        for i, discovery in enumerate(discoveries, offset):
+            try:
+                extracted.append(self.compute_features(discovery).to_dict())
+            except Exception as e:
+                logger.error(f"Error processing discovery {i} ({discovery.get('source_url')}): {e}")
+                extracted.append(None)
+                errors += 1
+        return extracted, errors
+    
+    def extract_all(self, discoveries: List[Dict]) -> List[Dict]:
+        """Features of every discovery that extracts cleanly, in input order"""
+        if self.cache is None:
+            return [features for features in self.compute_all(discoveries) if features is not None]
+        
+        keys = [self.cache.key(discovery, self.VERSION) for discovery in discoveries]
+        cached = self.cache.get_many(keys)
+        pending = [i for i, key in enumerate(keys) if key not in cached]
+        logger.info(f"Feature cache: {len(discoveries) - len(pending)} hits, {len(pending)} to extract")
+        
+        computed = dict(zip(pending, self.compute_all([discoveries[i] for i in pending])))
+        self.cache.put_many((keys[i], features) for i, features in computed.items() if features is not None)
+        
+        extracted = []
+        for i, discovery in enumerate(discoveries):
+            features = computed[i] if i in computed else self.from_cached(cached[keys[i]], discovery)
+            if features is not None:
+                extracted.append(features)
+        return extracted
+    
+    def compute_all(self, discoveries: List[Dict]) -> List[Optional[Dict]]:
+        """Extract every discovery (None where extraction failed), in chunks, across the worker pool"""
+        starts = range(0, len(discoveries), self.chunk_size)
+        chunks = {}
+        processed = errors = 0
+        
+        def collect(start: int, result: Tuple[List[Optional[Dict]], int]):
+            nonlocal processed, errors
+            chunks[start], chunk_errors = result
+            processed += len(chunks[start])
+            errors += chunk_errors
+            logger.info(f"Processed {processed}/{len(discoveries)} discoveries ({errors} errors)...")
+        
+        if self.workers <= 1 or len(starts) <= 1:
+            for start in starts:
+                collect(start, self.extract_batch(discoveries[start:start + self.chunk_size], start))
+        else:
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(starts))) as pool:
+                futures = {
+                    pool.submit(_extract_chunk, discoveries[start:start + self.chunk_size], start): start
+                    for start in starts
+                }
+                for future in as_completed(futures):
+                    collect(futures[future], future.result())
+        
+        # Chunks finish in any order: reassemble by offset
+        return [features for start in sorted(chunks) for features in chunks[start]]
+    
     def process_discoveries(self, discoveries_file: str, output_file: str):
         """Process all discoveries and extract features"""
         logger.info(f"Loading discoveries from {discoveries_file}...")
@@ -369,28 +614,27 @@ class FeatureExtractor:
         
         logger.info(f"Processing {len(discoveries)} discoveries...")
         
-        extracted_features = []
-        for i, discovery in enumerate(discoveries):
-            try:
-                features = self.extract_features(discovery)
-                extracted_features.append(features.to_dict())
-                
-                if (i + 1) % 10 == 0:
-                    logger.info(f"Processed {i + 1}/{len(discoveries)} discoveries...")
-            
-            except Exception as e:
-                logger.error(f"Error processing discovery {i}: {e}")
-                continue
+        extracted_features = self.extract_all(discoveries)
         
         logger.info(f"Saving extracted features to {output_file}...")
-        with open(output_file, 'w') as f:
-            json.dump(extracted_features, f, indent=2)
+        save_features(output_file, extracted_features)
         
         logger.info(f"Feature extraction complete. Processed {len(extracted_features)}/{len(discoveries)} discoveries.")
         
         return extracted_features
 
 
+def _extract_chunk(discoveries: List[Dict], offset: int) -> Tuple[List[Optional[Dict]], int]:
+    """Worker-process entry point: one extractor per process, reused across chunks"""
+    global _worker_extractor
+    if _worker_extractor is None:
+        _worker_extractor = FeatureExtractor(workers=0)
+    return _worker_extractor.extract_batch(discoveries, offset)
+
+
+_worker_extractor: Optional[FeatureExtractor] = None
+
+
 # Main execution
 if __name__ == "__main__":
     extractor = FeatureExtractor()
@@ -0,0 +1,200 @@
+"""
+Columnar Feature Store - Component 2
+Extracted features in Parquet with a typed schema, written in row groups
+and read back by column projection and predicate pushdown, so curation
+stages only load the columns and rows they use. Needs pyarrow; without it
+features fall back to a JSON list.
+
+Author: Manus AI
+Date: October 21, 2025
+"""
+
+import json
+import logging
+import operator
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = pq = None
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+HAS_PYARROW = pa is not None
+
+# Column name and type of every ExtractedFeatures field, in field order
+FEATURE_COLUMNS = (
+    ('loop_id', 'string'),
+    ('source_url', 'string'),
+    ('source_type', 'string'),
+    ('has_code', 'bool'),
+    ('code_language', 'string'),
+    ('code_complexity', 'float64'),
+    ('code_lines', 'int64'),
+    ('code_cyclomatic', 'int64'),
+    ('code_max_depth', 'int64'),
+    ('code_calls', 'int64'),
+    ('code_imports', 'list<string>'),
+    ('title_length', 'int64'),
+    ('description_length', 'int64'),
+    ('has_tutorial', 'bool'),
+    ('has_documentation', 'bool'),
+    ('popularity_score', 'float64'),
+    ('author_reputation', 'float64'),
+    ('recency_score', 'float64'),
+    ('primary_category', 'string'),
+    ('secondary_categories', 'list<string>'),
+    ('keywords', 'list<string>'),
+    ('automation_type', 'string'),
+    ('complexity_level', 'string'),
+    ('estimated_value', 'float64')
+)
+
+# Low-cardinality columns are dictionary encoded
+DICTIONARY_COLUMNS = ['source_type', 'code_language', 'primary_category', 'automation_type', 'complexity_level']
+
+# (column, op, value) predicates, all of which must hold
+Filters = Sequence[Tuple[str, str, object]]
+
+FILTER_OPS = {
+    '=': operator.eq,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+    'in': lambda value, options: value in options,
+    'not in': lambda value, options: value not in options
+}
+
+
+def _require_pyarrow():
+    if not HAS_PYARROW:
+        raise ImportError("The columnar feature store needs pyarrow (pip install pyarrow)")
+
+
+def feature_schema() -> "pa.Schema":
+    """Arrow schema of the ExtractedFeatures fields"""
+    _require_pyarrow()
+    types = {
+        'string': pa.string(),
+        'bool': pa.bool_(),
+        'float64': pa.float64(),
+        'int64': pa.int64(),
+        'list<string>': pa.list_(pa.string())
+    }
+    return pa.schema([(name, types[type_name]) for name, type_name in FEATURE_COLUMNS])
+
+
+def is_parquet(path: Union[str, Path]) -> bool:
+    return Path(path).suffix == '.parquet'
+
+
+class FeatureStoreWriter:
+    """Appends feature dicts to a Parquet file, one row group per row_group_size rows"""
+
+    def __init__(self, path: Union[str, Path], row_group_size: int = 10_000, compression: str = 'zstd'):
+        _require_pyarrow()
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.schema = feature_schema()
+        self.row_group_size = row_group_size
+        self.writer = pq.ParquetWriter(
+            str(self.path),
+            self.schema,
+            compression=compression,
+            use_dictionary=DICTIONARY_COLUMNS
+        )
+        self.rows: List[Dict] = []
+        self.count = 0
+
+    def write(self, features: Dict):
+        self.rows.append(features)
+        self.count += 1
+        if len(self.rows) >= self.row_group_size:
+            self.flush()
+
+    def write_all(self, features: Iterable[Dict]):
+        for row in features:
+            self.write(row)
+
+    def flush(self):
+        """Write buffered rows as one row group"""
+        if self.rows:
+            self.writer.write_table(pa.Table.from_pylist(self.rows, schema=self.schema))
+            self.rows = []
+
+    def close(self):
+        self.flush()
+        self.writer.close()
+
+    def __enter__(self) -> "FeatureStoreWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class FeatureStore:
+    """Reads a Parquet feature file, loading only the requested columns and matching row groups"""
+
+    def __init__(self, path: Union[str, Path]):
+        _require_pyarrow()
+        self.path = Path(path)
+
+    @property
+    def num_rows(self) -> int:
+        return pq.ParquetFile(str(self.path)).metadata.num_rows
+
+    @property
+    def num_row_groups(self) -> int:
+        return pq.ParquetFile(str(self.path)).metadata.num_row_groups
+
+    def read_table(self, columns: Optional[List[str]] = None, filters: Optional[Filters] = None) -> "pa.Table":
+        """Arrow table of the given columns; filters skip row groups by their statistics"""
+        return pq.read_table(str(self.path), columns=columns, filters=list(filters) if filters else None)
+
+    def read(self, columns: Optional[List[str]] = None, filters: Optional[Filters] = None) -> List[Dict]:
+        return self.read_table(columns, filters).to_pylist()
+
+    def iter_batches(self, columns: Optional[List[str]] = None, batch_size: int = 10_000) -> Iterator[List[Dict]]:
+        """Stream rows batch by batch without loading the whole file"""
+        for batch in pq.ParquetFile(str(self.path)).iter_batches(batch_size=batch_size, columns=columns):
+            yield batch.to_pylist()
+
+
+def save_features(path: Union[str, Path], features: Iterable[Dict]):
+    """Write features to Parquet for .parquet paths, to a JSON list otherwise"""
+    if is_parquet(path):
+        with FeatureStoreWriter(path) as writer:
+            writer.write_all(features)
+    else:
+        with open(path, 'w') as f:
+            json.dump(list(features), f, indent=2)
+
+
+def load_features(
+    path: Union[str, Path],
+    columns: Optional[List[str]] = None,
+    filters: Optional[Filters] = None
+) -> List[Dict]:
+    """Features from a Parquet or JSON file, projected to columns and filtered by (column, op, value)"""
+    if is_parquet(path):
+        return FeatureStore(path).read(columns, filters)
+
+    with open(path, 'r') as f:
+        rows = json.load(f)
+    for column, op, value in filters or ():
+        if op in ('in', 'not in'):
+            value = frozenset(value)  # one hash lookup per row, not a list scan
+        rows = [row for row in rows if FILTER_OPS[op](row.get(column), value)]
+    if columns is not None:
+        rows = [{column: row.get(column) for column in columns} for row in rows]
+    return rows
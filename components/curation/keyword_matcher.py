@@ -0,0 +1,125 @@
+"""
+Keyword Matcher - Component 2
+Aho-Corasick automaton that finds every keyword of a list (or of named
+keyword groups) in a single pass over the text. Uses the pyahocorasick C
+automaton when installed, and an equivalent pure-Python one otherwise.
+
+Author: Manus AI
+Date: October 21, 2025
+"""
+
+from collections import deque
+from typing import Dict, Hashable, Iterable, Iterator, List, Mapping, Optional, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - optional speedup
+    ahocorasick = None
+
+
+class KeywordMatcher:
+    """Case-insensitive multi-keyword matcher, compiled once and reused"""
+
+    def __init__(self, keywords: Iterable[str], word_boundary: bool = False):
+        self.groups: Dict[str, List[Hashable]] = {}
+        for keyword in keywords:
+            self.groups.setdefault(keyword.lower(), [])
+        self.word_boundary = word_boundary
+        self._compile()
+
+    @classmethod
+    def from_groups(cls, groups: Mapping[Hashable, Iterable[str]], word_boundary: bool = False) -> "KeywordMatcher":
+        """Matcher over named keyword groups (a keyword may belong to several)"""
+        matcher = cls([], word_boundary)
+        for group, keywords in groups.items():
+            for keyword in keywords:
+                matcher.groups.setdefault(keyword.lower(), []).append(group)
+        matcher._compile()
+        return matcher
+
+    def _compile(self):
+        """Build the automaton (C if available, else trie + failure links + transition table)"""
+        self.keywords = [k for k in self.groups if k]
+        self._automaton = None
+        if ahocorasick is not None:
+            if self.keywords:
+                self._automaton = ahocorasick.Automaton()
+                for index, keyword in enumerate(self.keywords):
+                    self._automaton.add_word(keyword, index)
+                self._automaton.make_automaton()
+            return
+
+        trie: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for index, keyword in enumerate(self.keywords):
+            state = 0
+            for char in keyword:
+                if char not in trie[state]:
+                    trie.append({})
+                    outputs.append([])
+                    trie[state][char] = len(trie) - 1
+                state = trie[state][char]
+            outputs[state].append(index)
+
+        # Breadth-first: each state inherits the transitions and outputs of its failure state
+        fail = [0] * len(trie)
+        self._delta: List[Dict[str, int]] = [dict(trie[0])] + [{} for _ in trie[1:]]
+        queue = deque(trie[0].values())
+        while queue:
+            state = queue.popleft()
+            self._delta[state] = {**self._delta[fail[state]], **trie[state]}
+            outputs[state] = outputs[state] + outputs[fail[state]]
+            for char, child in trie[state].items():
+                fail[child] = self._delta[fail[state]].get(char, 0) if state else 0
+                queue.append(child)
+        self._outputs = [tuple(out) for out in outputs]
+
+    @staticmethod
+    def _is_word_char(char: str) -> bool:
+        return char.isalnum() or char == '_'
+
+    def _scan(self, text: str) -> Iterator[Tuple[int, int]]:
+        """(end, keyword index) of every occurrence in lowercased text, end exclusive"""
+        if ahocorasick is not None:
+            if self._automaton is not None:
+                for last, index in self._automaton.iter(text):
+                    yield last + 1, index
+            return
+
+        delta, outputs = self._delta, self._outputs
+        state = 0
+        for end, char in enumerate(text, 1):
+            state = delta[state].get(char, 0)
+            for index in outputs[state]:
+                yield end, index
+
+    def finditer(self, text: str, word_boundary: Optional[bool] = None) -> Iterator[Tuple[int, str]]:
+        """Yield (start, keyword) for every occurrence, overlapping ones included"""
+        if word_boundary is None:
+            word_boundary = self.word_boundary
+        text = text.lower()
+        for end, index in self._scan(text):
+            keyword = self.keywords[index]
+            start = end - len(keyword)
+            if word_boundary and (
+                (start > 0 and self._is_word_char(text[start - 1]))
+                or (end < len(text) and self._is_word_char(text[end]))
+            ):
+                continue
+            yield start, keyword
+
+    def find_all(self, text: str, word_boundary: Optional[bool] = None) -> Set[str]:
+        """Distinct keywords present in the text"""
+        return {keyword for _, keyword in self.finditer(text, word_boundary)}
+
+    def search(self, text: str, word_boundary: Optional[bool] = None) -> bool:
+        """Whether any keyword is present (stops at the first hit)"""
+        return next(self.finditer(text, word_boundary), None) is not None
+
+    def group_hits(self, text: str, word_boundary: Optional[bool] = None) -> Dict[Hashable, Set[str]]:
+        """Group -> distinct keywords of that group present in the text"""
+        hits: Dict[Hashable, Set[str]] = {}
+        for keyword in self.find_all(text, word_boundary):
+            for group in self.groups[keyword]:
+                hits.setdefault(group, set()).add(keyword)
+        return hits
@@ -0,0 +1,26 @@
+"""
+Loop IDs - Component 2
+Stable, content-addressed identifiers shared by discoveries, features and
+scores, reproducible across processes and runs.
+
+Author: Manus AI
+Date: October 21, 2025
+"""
+
+import hashlib
+from typing import Dict
+
+
+def make_loop_id(source_type: str, source_url: str) -> str:
+    """"<source_type>_<80-bit blake2b of the URL>", e.g. "github_3f1c9a0b2d4e6f8a1c3e"
+
+    Unlike hash(), the digest does not depend on PYTHONHASHSEED, and at
+    80 bits collisions are negligible for any corpus we will crawl.
+    """
+    digest = hashlib.blake2b(source_url.encode('utf-8'), digest_size=10).hexdigest()
+    return f"{source_type}_{digest}"
+
+
+def loop_id_of(discovery: Dict) -> str:
+    """The loop ID a discovery dict carries, or the one its URL maps to"""
+    return discovery.get('loop_id') or make_loop_id(discovery['source_type'], discovery['source_url'])
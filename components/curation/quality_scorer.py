@@ -9,21 +9,57 @@ Date: October 17, 2025
 
 import json
 import logging
-from typing import Dict, List
-from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from .feature_store import load_features
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Text of each reason code; fields come from the score's components and evidence
+REASONS = {
+    'high_popularity': "High popularity (score: {popularity:.2f})",
+    'low_popularity': "Low popularity (score: {popularity:.2f})",
+    'has_code': "Contains code (complexity: {code_complexity:.2f})",
+    'no_code': "No code detected",
+    'detailed_description': "Detailed description",
+    'short_description': "Very short description",
+    'has_tutorial': "Has tutorial content",
+    'has_documentation': "Has documentation",
+    'high_value_category': "High-value category: {primary_category}",
+    'general_category': "General category (unclear automation value)"
+}
+
+
 @dataclass
 class QualityScore:
-    """Quality score for a loop"""
+    """Quality score for a loop
+    
+    Stores component subscores and reason codes; the human-readable
+    reasoning is only rendered when someone asks for it (explain()).
+    """
     loop_id: str
     overall_score: float  # 0-1 scale
     approval_decision: str  # approved, rejected, needs_review
     confidence: float  # 0-1 scale
-    reasoning: List[str]  # Explanation of score
+    components: Dict[str, float] = field(default_factory=dict)  # 0-1 subscore per WEIGHTS key
+    reason_codes: List[str] = field(default_factory=list)  # keys of REASONS
+    evidence: Dict[str, Any] = field(default_factory=dict)  # feature values the reasons quote
+    
+    def explain(self) -> List[str]:
+        """Human-readable explanation of the score"""
+        values = {**self.components, **self.evidence}
+        lines = [REASONS[code].format(**values) for code in self.reason_codes]
+        lines.append(f"Overall score: {self.overall_score:.2f} → {self.approval_decision}")
+        return lines
+    
+    @property
+    def reasoning(self) -> List[str]:
+        return self.explain()
     
     def to_dict(self) -> Dict:
         return {
@@ -31,8 +67,43 @@ class QualityScore:
             "overall_score": self.overall_score,
             "approval_decision": self.approval_decision,
             "confidence": self.confidence,
-            "reasoning": self.reasoning
+            "components": self.components,
+            "reason_codes": self.reason_codes,
+            "evidence": self.evidence
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "QualityScore":
+        return cls(
+            loop_id=data["loop_id"],
+            overall_score=data["overall_score"],
+            approval_decision=data["approval_decision"],
+            confidence=data["confidence"],
+            components=data.get("components", {}),
+            reason_codes=data.get("reason_codes", []),
+            evidence=data.get("evidence", {})
+        )
+
+
+# Decision codes used by BatchScores
+DECISIONS = ('approved', 'rejected', 'needs_review')
+
+
+@dataclass
+class BatchScores:
+    """Column-oriented scores of a feature batch (one array element per loop)"""
+    loop_id: np.ndarray
+    components: Dict[str, np.ndarray]  # 0-1 subscore per WEIGHTS key
+    overall_score: np.ndarray
+    decision_code: np.ndarray  # index into DECISIONS
+    confidence: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.overall_score)
+    
+    @property
+    def approval_decision(self) -> np.ndarray:
+        return np.array(DECISIONS, dtype=object)[self.decision_code]
 
 
 class HeuristicQualityScorer:
@@ -53,6 +124,15 @@ class HeuristicQualityScorer:
     REJECTION_THRESHOLD = 0.35  # Score < 0.35 = rejected
     # Between 0.35 and 0.60 = needs_review
     
+    HIGH_VALUE_CATEGORIES = ['automation', 'web_scraping', 'api_wrapper', 'bot', 'data_processing']
+    
+    # Feature columns score_loop reads (all that is loaded from a columnar store)
+    FEATURE_COLUMNS = [
+        'loop_id', 'popularity_score', 'has_code', 'code_complexity', 'code_lines',
+        'description_length', 'has_tutorial', 'has_documentation', 'primary_category',
+        'recency_score', 'author_reputation'
+    ]
+    
     def __init__(self):
         self.approved_count = 0
         self.rejected_count = 0
@@ -62,16 +142,17 @@ class HeuristicQualityScorer:
         """Score a single loop based on extracted features"""
         
         loop_id = features['loop_id']
-        reasoning = []
+        reasons = []
+        evidence = {}
         
         # 1. Popularity Score (25%)
         popularity_score = features['popularity_score']
         popularity_weight = self.WEIGHTS['popularity'] * popularity_score
         
         if popularity_score >= 0.7:
-            reasoning.append(f"High popularity (score: {popularity_score:.2f})")
+            reasons.append('high_popularity')
         elif popularity_score <= 0.2:
-            reasoning.append(f"Low popularity (score: {popularity_score:.2f})")
+            reasons.append('low_popularity')
         
         # 2. Code Quality Score (20%)
         code_quality_score = 0.0
@@ -81,10 +162,11 @@ class HeuristicQualityScorer:
                 min(features['code_lines'] / 100.0, 1.0) * 0.4,
                 1.0
             )
-            reasoning.append(f"Contains code (complexity: {features['code_complexity']:.2f})")
+            reasons.append('has_code')
+            evidence['code_complexity'] = features['code_complexity']
         else:
             code_quality_score = 0.3  # Text-only loops get lower score
-            reasoning.append("No code detected")
+            reasons.append('no_code')
         
         code_weight = self.WEIGHTS['code_quality'] * code_quality_score
         
@@ -94,21 +176,21 @@ class HeuristicQualityScorer:
         # Length indicators
         if features['description_length'] >= 200:
             content_quality_score += 0.4
-            reasoning.append("Detailed description")
+            reasons.append('detailed_description')
         elif features['description_length'] < 50:
             content_quality_score += 0.1
-            reasoning.append("Very short description")
+            reasons.append('short_description')
         else:
             content_quality_score += 0.25
         
         # Tutorial/documentation bonus
         if features['has_tutorial']:
             content_quality_score += 0.3
-            reasoning.append("Has tutorial content")
+            reasons.append('has_tutorial')
         
         if features['has_documentation']:
             content_quality_score += 0.3
-            reasoning.append("Has documentation")
+            reasons.append('has_documentation')
         
         content_quality_score = min(content_quality_score, 1.0)
         content_weight = self.WEIGHTS['content_quality'] * content_quality_score
@@ -117,13 +199,13 @@ class HeuristicQualityScorer:
         categorization_score = 0.0
         
         # Prefer specific automation categories
-        high_value_categories = ['automation', 'web_scraping', 'api_wrapper', 'bot', 'data_processing']
-        if features['primary_category'] in high_value_categories:
+        if features['primary_category'] in self.HIGH_VALUE_CATEGORIES:
             categorization_score = 0.8
-            reasoning.append(f"High-value category: {features['primary_category']}")
+            reasons.append('high_value_category')
+            evidence['primary_category'] = features['primary_category']
         elif features['primary_category'] == 'general':
             categorization_score = 0.3
-            reasoning.append("General category (unclear automation value)")
+            reasons.append('general_category')
         else:
             categorization_score = 0.5
         
@@ -161,22 +243,120 @@ class HeuristicQualityScorer:
             self.review_count += 1
             confidence = 0.5
         
-        reasoning.append(f"Overall score: {overall_score:.2f} → {decision}")
-        
         return QualityScore(
             loop_id=loop_id,
             overall_score=overall_score,
             approval_decision=decision,
             confidence=confidence,
-            reasoning=reasoning
+            components={
+                'popularity': popularity_score,
+                'code_quality': code_quality_score,
+                'content_quality': content_quality_score,
+                'categorization': categorization_score,
+                'recency': recency_score,
+                'author': author_score
+            },
+            reason_codes=reasons,
+            evidence=evidence
+        )
+    
+    @classmethod
+    def feature_batch(cls, features: Iterable[Dict]) -> Dict[str, np.ndarray]:
+        """Column arrays of FEATURE_COLUMNS from feature dicts, as score_batch takes them"""
+        rows = list(features)
+        return {column: np.array([row[column] for row in rows]) for column in cls.FEATURE_COLUMNS}
+    
+    def score_batch(self, batch: Mapping[str, Sequence]) -> BatchScores:
+        """Score a column-oriented batch with array operations
+        
+        Mirrors score_loop branch for branch, with the same float operations
+        in the same order, so every score and decision matches it exactly.
+        Reason codes are not derived; score_loop gives them for loops that
+        need explaining.
+        """
+        popularity = np.asarray(batch['popularity_score'], dtype=np.float64)
+        has_code = np.asarray(batch['has_code'], dtype=bool)
+        code_complexity = np.asarray(batch['code_complexity'], dtype=np.float64)
+        code_lines = np.asarray(batch['code_lines'], dtype=np.float64)
+        description_length = np.asarray(batch['description_length'])
+        primary_category = np.asarray(batch['primary_category'], dtype=object)
+        
+        code_quality = np.where(
+            has_code,
+            np.minimum(code_complexity * 0.6 + np.minimum(code_lines / 100.0, 1.0) * 0.4, 1.0),
+            0.3
+        )
+        
+        content_quality = np.where(
+            description_length >= 200, 0.4, np.where(description_length < 50, 0.1, 0.25)
+        )
+        content_quality = content_quality + np.where(np.asarray(batch['has_tutorial'], dtype=bool), 0.3, 0.0)
+        content_quality = content_quality + np.where(np.asarray(batch['has_documentation'], dtype=bool), 0.3, 0.0)
+        content_quality = np.minimum(content_quality, 1.0)
+        
+        categorization = np.where(
+            np.isin(primary_category, self.HIGH_VALUE_CATEGORIES),
+            0.8,
+            np.where(primary_category == 'general', 0.3, 0.5)
+        )
+        
+        components = {
+            'popularity': popularity,
+            'code_quality': code_quality,
+            'content_quality': content_quality,
+            'categorization': categorization,
+            'recency': np.asarray(batch['recency_score'], dtype=np.float64),
+            'author': np.asarray(batch['author_reputation'], dtype=np.float64)
+        }
+        
+        overall = self.weighted_sum(components)
+        decision_code = self.decide(overall)
+        confidence = self.confidence(overall, decision_code)
+        
+        counts = np.bincount(decision_code, minlength=len(DECISIONS))
+        self.approved_count += int(counts[0])
+        self.rejected_count += int(counts[1])
+        self.review_count += int(counts[2])
+        
+        return BatchScores(
+            loop_id=np.asarray(batch['loop_id'], dtype=object),
+            components=components,
+            overall_score=overall,
+            decision_code=decision_code,
+            confidence=confidence
+        )
+    
+    def weighted_sum(self, components: Mapping[str, np.ndarray]) -> np.ndarray:
+        """Overall scores from component arrays, summed in score_loop's order"""
+        names = list(self.WEIGHTS)
+        overall = self.WEIGHTS[names[0]] * components[names[0]]
+        for name in names[1:]:
+            overall = overall + self.WEIGHTS[name] * components[name]
+        return overall
+    
+    def decide(self, overall: np.ndarray) -> np.ndarray:
+        """Decision codes (indexes into DECISIONS) for overall scores"""
+        approved = overall >= self.APPROVAL_THRESHOLD
+        rejected = ~approved & (overall < self.REJECTION_THRESHOLD)
+        return np.where(approved, 0, np.where(rejected, 1, 2)).astype(np.int8)
+    
+    def confidence(self, overall: np.ndarray, decision_code: np.ndarray) -> np.ndarray:
+        """Confidence of each decision, as score_loop computes it"""
+        return np.where(
+            decision_code == 0,
+            np.minimum((overall - self.APPROVAL_THRESHOLD) / (1.0 - self.APPROVAL_THRESHOLD), 1.0),
+            np.where(
+                decision_code == 1,
+                np.minimum((self.REJECTION_THRESHOLD - overall) / self.REJECTION_THRESHOLD, 1.0),
+                0.5
+            )
         )
     
     def score_all_loops(self, features_file: str, output_file: str) -> List[QualityScore]:
         """Score all loops from extracted features"""
         
         logger.info(f"Loading features from {features_file}...")
-        with open(features_file, 'r') as f:
-            all_features = json.load(f)
+        all_features = load_features(features_file, columns=self.FEATURE_COLUMNS)
         
         logger.info(f"Scoring {len(all_features)} loops...")
         
@@ -195,7 +375,11 @@ class HeuristicQualityScorer:
         
         logger.info(f"Saving scores to {output_file}...")
         with open(output_file, 'w') as f:
-            json.dump([s.to_dict() for s in scores], f, indent=2)
+            f.write('[')
+            for i, score in enumerate(scores):
+                f.write(',\n' if i else '\n')
+                f.write(json.dumps(score.to_dict()))
+            f.write('\n]\n')
         
         logger.info(f"Quality scoring complete.")
         
@@ -244,7 +428,7 @@ if __name__ == "__main__":
             print(f"\n  Loop ID: {loop.loop_id}")
             print(f"  Score: {loop.overall_score:.2f}")
             print(f"  Confidence: {loop.confidence:.2f}")
-            print(f"  Reasoning: {'; '.join(loop.reasoning[:3])}")
+            print(f"  Reasoning: {'; '.join(loop.explain()[:3])}")
     
     print(f"\nResults saved to: data/quality_scores.json")
     print(f"{'='*60}\n")
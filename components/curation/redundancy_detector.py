@@ -0,0 +1,192 @@
+"""
+Redundancy Detector - Component 2c
+Finds near-duplicate loops (forks, reposts, cross-posts) with MinHash
+signatures and a persistent LSH index, before they reach scoring.
+
+Author: Manus AI
+Date: October 20, 2025
+"""
+
+import hashlib
+import logging
+import re
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RedundancyResult:
+    """Outcome of checking one loop against the index"""
+    item_id: str
+    duplicate_of: Optional[str]  # canonical item of the cluster, None if unique
+    similarity: float  # estimated Jaccard similarity to duplicate_of
+
+    @property
+    def is_duplicate(self) -> bool:
+        return self.duplicate_of is not None
+
+
+class MinHasher:
+    """MinHash signatures over word shingles"""
+
+    MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+    MAX_HASH = np.uint64((1 << 32) - 1)
+
+    def __init__(self, num_perm: int = 64, shingle_size: int = 3, seed: int = 1):
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        generator = np.random.RandomState(seed)
+        self.a = generator.randint(1, (1 << 32) - 1, size=num_perm, dtype=np.uint64)
+        self.b = generator.randint(0, (1 << 32) - 1, size=num_perm, dtype=np.uint64)
+
+    def shingles(self, text: str) -> Set[str]:
+        """Word n-grams of normalized text (the words themselves for short texts)"""
+        words = re.findall(r'\w+', text.lower())
+        if len(words) < self.shingle_size:
+            return set(words)
+        return {' '.join(words[i:i + self.shingle_size]) for i in range(len(words) - self.shingle_size + 1)}
+
+    def signature(self, text: str) -> np.ndarray:
+        """MinHash signature; all-max for empty text"""
+        shingles = self.shingles(text)
+        if not shingles:
+            return np.full(self.num_perm, self.MAX_HASH, dtype=np.uint64)
+
+        hashes = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=4).digest(), 'little') for s in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+        # Universal hashing, one row per permutation (uint64 wrap-around is intended)
+        with np.errstate(over='ignore'):
+            permuted = (np.outer(hashes, self.a) + self.b) % self.MERSENNE_PRIME & self.MAX_HASH
+        return permuted.min(axis=0)
+
+    @staticmethod
+    def similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return float(np.mean(sig_a == sig_b))
+
+
+class RedundancyDetector:
+    """Persistent MinHash-LSH index for near-duplicate detection"""
+
+    def __init__(
+        self,
+        index_path: str,
+        threshold: float = 0.8,
+        num_perm: int = 64,
+        bands: int = 16
+    ):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.hasher = MinHasher(num_perm=num_perm)
+
+        self.index_path = Path(index_path)
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.index_path))
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS signatures (item_id TEXT PRIMARY KEY, cluster_id TEXT NOT NULL, signature BLOB NOT NULL)"
+        )
+        self.conn.execute("CREATE TABLE IF NOT EXISTS buckets (bucket BLOB NOT NULL, item_id TEXT NOT NULL)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_bucket ON buckets (bucket)")
+        self.conn.commit()
+
+        self.duplicates_found = 0
+
+    @staticmethod
+    def text_of(discovery: Dict) -> str:
+        """Text fingerprinted for a discovery: title + raw_content"""
+        return f"{discovery.get('metadata', {}).get('title', '')} {discovery.get('raw_content', '')}"
+
+    def band_keys(self, signature: np.ndarray) -> List[bytes]:
+        """One bucket key per LSH band"""
+        keys = []
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            keys.append(bytes([band]) + hashlib.blake2b(chunk, digest_size=8).digest())
+        return keys
+
+    def query(self, signature: np.ndarray) -> Tuple[Optional[str], float]:
+        """Best-matching indexed item above the threshold (candidates from shared buckets only)"""
+        keys = self.band_keys(signature)
+        placeholders = ','.join('?' * len(keys))
+        rows = self.conn.execute(
+            f"""
+            SELECT s.item_id, s.cluster_id, s.signature FROM signatures s
+            WHERE s.item_id IN (SELECT DISTINCT item_id FROM buckets WHERE bucket IN ({placeholders}))
+            """,
+            keys
+        ).fetchall()
+
+        best, best_similarity = None, 0.0
+        for item_id, cluster_id, blob in rows:
+            similarity = self.hasher.similarity(signature, np.frombuffer(blob, dtype=np.uint64))
+            if similarity >= self.threshold and similarity > best_similarity:
+                best, best_similarity = cluster_id, similarity
+        return best, best_similarity
+
+    def add(self, item_id: str, signature: np.ndarray, cluster_id: Optional[str] = None):
+        """Index an item as the canonical member (or a member) of a cluster"""
+        cluster_id = cluster_id or item_id
+        self.conn.execute(
+            "INSERT OR REPLACE INTO signatures VALUES (?, ?, ?)",
+            (item_id, cluster_id, signature.tobytes())
+        )
+        if cluster_id == item_id:
+            self.conn.executemany(
+                "INSERT INTO buckets VALUES (?, ?)",
+                [(key, item_id) for key in self.band_keys(signature)]
+            )
+
+    def check(self, item_id: str, text: str) -> RedundancyResult:
+        """Check an item against the index and record it"""
+        row = self.conn.execute("SELECT cluster_id FROM signatures WHERE item_id = ?", (item_id,)).fetchone()
+        if row is not None:
+            # Already indexed: duplicates stay in their cluster, canonical items stay unique
+            duplicate_of = row[0] if row[0] != item_id else None
+            return RedundancyResult(item_id, duplicate_of, 1.0 if duplicate_of else 0.0)
+
+        signature = self.hasher.signature(text)
+        duplicate_of, similarity = self.query(signature)
+        self.add(item_id, signature, duplicate_of)
+        if duplicate_of:
+            self.duplicates_found += 1
+        return RedundancyResult(item_id, duplicate_of, similarity)
+
+    def check_discovery(self, discovery: Dict) -> RedundancyResult:
+        return self.check(discovery['source_url'], self.text_of(discovery))
+
+    def filter_discoveries(self, discoveries: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+        """Split discoveries into unique ones and duplicates (annotated with duplicate_of)"""
+        unique, duplicates = [], []
+        for discovery in discoveries:
+            result = self.check_discovery(discovery)
+            if result.is_duplicate:
+                duplicates.append({
+                    'discovery': discovery,
+                    'duplicate_of': result.duplicate_of,
+                    'similarity': result.similarity
+                })
+            else:
+                unique.append(discovery)
+        self.commit()
+        return unique, duplicates
+
+    def commit(self):
+        self.conn.commit()
+
+    def close(self):
+        self.conn.commit()
+        self.conn.close()
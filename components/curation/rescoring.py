@@ -0,0 +1,213 @@
+"""
+Incremental Rescoring - Component 2b
+Persists each loop's component subscores so a WEIGHTS change is one
+weighted sum over a matrix, and a threshold change only re-buckets the
+loops whose scores fall between the old and new thresholds. Each rescore
+reports the decisions that moved.
+
+Author: Manus AI
+Date: October 21, 2025
+"""
+
+import json
+import logging
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+
+from .quality_scorer import DECISIONS, BatchScores, HeuristicQualityScorer, QualityScore
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ScoreState:
+    """Per-loop component vectors plus the scores and decisions they produced"""
+    loop_id: np.ndarray
+    components: np.ndarray  # (loops, components), column-major; columns follow `names`
+    names: Tuple[str, ...]
+    overall_score: np.ndarray
+    decision_code: np.ndarray  # index into DECISIONS
+    confidence: np.ndarray
+    weights: Dict[str, float]
+    approval_threshold: float
+    rejection_threshold: float
+
+    def __len__(self) -> int:
+        return len(self.overall_score)
+
+    def column(self, name: str) -> np.ndarray:
+        return self.components[:, self.names.index(name)]
+
+    @classmethod
+    def _build(cls, loop_ids, matrix, overall, decision_code, confidence, scorer: HeuristicQualityScorer) -> "ScoreState":
+        return cls(
+            loop_id=np.asarray(loop_ids, dtype=str),
+            components=np.asfortranarray(matrix, dtype=np.float64).reshape(len(overall), len(scorer.WEIGHTS)),
+            names=tuple(scorer.WEIGHTS),
+            overall_score=np.asarray(overall, dtype=np.float64),
+            decision_code=np.asarray(decision_code, dtype=np.int8),
+            confidence=np.asarray(confidence, dtype=np.float64),
+            weights=dict(scorer.WEIGHTS),
+            approval_threshold=scorer.APPROVAL_THRESHOLD,
+            rejection_threshold=scorer.REJECTION_THRESHOLD
+        )
+
+    @classmethod
+    def from_scores(cls, scores: Iterable[QualityScore], scorer: HeuristicQualityScorer) -> "ScoreState":
+        scores = list(scores)
+        return cls._build(
+            [s.loop_id for s in scores],
+            [[s.components[name] for name in scorer.WEIGHTS] for s in scores],
+            [s.overall_score for s in scores],
+            [DECISIONS.index(s.approval_decision) for s in scores],
+            [s.confidence for s in scores],
+            scorer
+        )
+
+    @classmethod
+    def from_batch(cls, batch: BatchScores, scorer: HeuristicQualityScorer) -> "ScoreState":
+        return cls._build(
+            batch.loop_id,
+            np.column_stack([batch.components[name] for name in scorer.WEIGHTS]),
+            batch.overall_score,
+            batch.decision_code,
+            batch.confidence,
+            scorer
+        )
+
+    def save(self, path: Union[str, Path]):
+        """Write to an .npz file (uncompressed, so loading is a straight read)"""
+        np.savez(
+            path,
+            loop_id=self.loop_id,
+            components=self.components,
+            names=np.asarray(self.names),
+            overall_score=self.overall_score,
+            decision_code=self.decision_code,
+            confidence=self.confidence,
+            settings=np.asarray(json.dumps({
+                'weights': self.weights,
+                'approval_threshold': self.approval_threshold,
+                'rejection_threshold': self.rejection_threshold
+            }))
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ScoreState":
+        with np.load(path) as data:
+            settings = json.loads(str(data['settings']))
+            return cls(
+                loop_id=data['loop_id'],
+                components=np.asfortranarray(data['components']),
+                names=tuple(data['names'].tolist()),
+                overall_score=data['overall_score'],
+                decision_code=data['decision_code'],
+                confidence=data['confidence'],
+                weights=settings['weights'],
+                approval_threshold=settings['approval_threshold'],
+                rejection_threshold=settings['rejection_threshold']
+            )
+
+
+@dataclass
+class RescoreReport:
+    """Decisions that moved in a rescore"""
+    weights_changed: bool
+    thresholds_changed: bool
+    loops: int
+    rebucketed: int  # loops whose decision was re-evaluated
+    transitions: Dict[str, int] = field(default_factory=dict)  # "approved -> needs_review": count
+    moved: List[Dict] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return {
+            "weights_changed": self.weights_changed,
+            "thresholds_changed": self.thresholds_changed,
+            "loops": self.loops,
+            "rebucketed": self.rebucketed,
+            "transitions": self.transitions,
+            "moved": self.moved
+        }
+
+    def save(self, path: Union[str, Path]):
+        with open(path, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+
+
+def rescore(state: ScoreState, scorer: HeuristicQualityScorer) -> Tuple[ScoreState, RescoreReport]:
+    """Bring a ScoreState up to the scorer's current WEIGHTS and thresholds"""
+    if set(scorer.WEIGHTS) != set(state.names):
+        raise ValueError(f"Stored components {state.names} do not match WEIGHTS {tuple(scorer.WEIGHTS)}")
+
+    weights_changed = dict(scorer.WEIGHTS) != state.weights
+    thresholds_changed = (scorer.APPROVAL_THRESHOLD, scorer.REJECTION_THRESHOLD) != (
+        state.approval_threshold, state.rejection_threshold
+    )
+
+    overall = state.overall_score
+    decision_code = state.decision_code
+    if weights_changed:
+        # The weighted sum over the component matrix, in score_loop's summation order
+        # (a BLAS product would reassociate it and disagree with score_loop in the last bit)
+        overall = scorer.weighted_sum({name: state.column(name) for name in state.names})
+        touched = np.ones(len(state), dtype=bool)
+    elif thresholds_changed:
+        # Only scores between an old and a new threshold can change bucket
+        touched = np.zeros(len(state), dtype=bool)
+        for old, new in (
+            (state.approval_threshold, scorer.APPROVAL_THRESHOLD),
+            (state.rejection_threshold, scorer.REJECTION_THRESHOLD)
+        ):
+            low, high = min(old, new), max(old, new)
+            touched |= (overall >= low) & (overall < high)
+    else:
+        touched = np.zeros(len(state), dtype=bool)
+
+    if touched.any():
+        decision_code = decision_code.copy()
+        decision_code[touched] = scorer.decide(overall[touched])
+    confidence = scorer.confidence(overall, decision_code) if weights_changed or thresholds_changed else state.confidence
+
+    new_state = ScoreState(
+        loop_id=state.loop_id,
+        components=state.components,
+        names=state.names,
+        overall_score=overall,
+        decision_code=decision_code,
+        confidence=confidence,
+        weights=dict(scorer.WEIGHTS),
+        approval_threshold=scorer.APPROVAL_THRESHOLD,
+        rejection_threshold=scorer.REJECTION_THRESHOLD
+    )
+
+    moved = np.flatnonzero(decision_code != state.decision_code)
+    report = RescoreReport(
+        weights_changed=weights_changed,
+        thresholds_changed=thresholds_changed,
+        loops=len(state),
+        rebucketed=int(touched.sum()),
+        transitions={
+            f"{DECISIONS[old]} -> {DECISIONS[new]}": count
+            for (old, new), count in Counter(
+                zip(state.decision_code[moved].tolist(), decision_code[moved].tolist())
+            ).most_common()
+        },
+        moved=[
+            {
+                "loop_id": str(state.loop_id[i]),
+                "old_decision": DECISIONS[state.decision_code[i]],
+                "new_decision": DECISIONS[decision_code[i]],
+                "old_score": float(state.overall_score[i]),
+                "new_score": float(overall[i])
+            }
+            for i in moved
+        ]
+    )
+    logger.info(f"Rescored {len(state)} loops: {len(moved)} decisions moved {report.transitions}")
+    return new_state, report
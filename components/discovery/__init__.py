@@ -14,12 +14,63 @@ from .web_scraper import (
     RedditScraperAgent,
     ScraperOrchestrator
 )
+from .feed_scraper import FeedScraperAgent, RedditFeedAgent
+from .http_engine import AsyncFetchEngine
+from .http_cache import HTTPCache
+from .politeness import TokenBucket, PolitenessScheduler
+from .frontier import BloomFilter, CrawlFrontier
+from .metrics import ScraperMetrics
+from .ndjson_io import NDJSONWriter, read_ndjson, load_records, save_records
+from .recrawl import RecrawlScheduler
+from .enrichment import EnrichmentCache, DetailEnricher
+from .distributed import (
+    InMemoryBroker,
+    SQLiteBroker,
+    RabbitMQBroker,
+    CrawlWorker,
+    run_distributed
+)
+from .http_fixtures import FixtureArchive, RecordingTransport, ReplayTransport
+from .html_parsers import (
+    ParserBackend,
+    SoupParserBackend,
+    LxmlParserBackend,
+    get_parser_backend
+)
 
 __all__ = [
     'LoopDiscovery',
     'BaseScraperAgent',
     'GitHubScraperAgent',
     'RedditScraperAgent',
-    'ScraperOrchestrator'
+    'ScraperOrchestrator',
+    'FeedScraperAgent',
+    'RedditFeedAgent',
+    'AsyncFetchEngine',
+    'HTTPCache',
+    'TokenBucket',
+    'PolitenessScheduler',
+    'ParserBackend',
+    'SoupParserBackend',
+    'LxmlParserBackend',
+    'get_parser_backend',
+    'BloomFilter',
+    'CrawlFrontier',
+    'ScraperMetrics',
+    'NDJSONWriter',
+    'read_ndjson',
+    'load_records',
+    'save_records',
+    'RecrawlScheduler',
+    'EnrichmentCache',
+    'DetailEnricher',
+    'InMemoryBroker',
+    'SQLiteBroker',
+    'RabbitMQBroker',
+    'CrawlWorker',
+    'run_distributed',
+    'FixtureArchive',
+    'RecordingTransport',
+    'ReplayTransport'
 ]
 
@@ -0,0 +1,193 @@
+"""
+Detail Enrichment - Component 1
+Fetches each discovery's detail page (GitHub README, Reddit post body) and
+its code blocks, so feature extraction sees more than a one-line summary.
+
+Author: Manus AI
+Date: October 21, 2025
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+import weakref
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+from .html_parsers import FieldSpec, Selector, get_parser_backend
+from .http_engine import AsyncFetchEngine
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Where the long-form text lives on each source's detail page
+BODY_FIELDS = {
+    'github': FieldSpec((Selector('article', 'markdown-body'),)),
+    'reddit': FieldSpec((Selector('div', 'expando'), Selector('div', 'md')))
+}
+
+
+def extract_details(
+    source_type: str,
+    content: bytes,
+    max_chars: int,
+    max_code_blocks: int,
+    parser_name: Optional[str] = None
+) -> Dict:
+    """Pure parse step: body text and code blocks of a detail page"""
+    parser = get_parser_backend(parser_name)
+    body = parser.extract_first(content, BODY_FIELDS[source_type]) or ""
+    code_blocks = parser.extract_code_blocks(content)[:max_code_blocks]
+    return {"body": body[:max_chars], "code_blocks": code_blocks}
+
+
+class EnrichmentCache:
+    """Extracted details keyed by (URL, revision), stored in SQLite"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS details (
+                url TEXT NOT NULL,
+                revision TEXT NOT NULL,
+                details TEXT NOT NULL,
+                created REAL NOT NULL,
+                PRIMARY KEY (url, revision)
+            )
+            """
+        )
+        self.conn.commit()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, url: str, revision: str) -> Optional[Dict]:
+        row = self.conn.execute(
+            "SELECT details FROM details WHERE url = ? AND revision = ?", (url, revision)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(row[0])
+
+    def put(self, url: str, revision: str, details: Dict):
+        # Only the latest revision of a URL is worth keeping
+        self.conn.execute("DELETE FROM details WHERE url = ?", (url,))
+        self.conn.execute(
+            "INSERT INTO details VALUES (?, ?, ?, ?)",
+            (url, revision, json.dumps(details), time.time())
+        )
+        self.conn.commit()
+
+
+class DetailEnricher:
+    """Adds detail-page text and code blocks to discoveries with bounded concurrency"""
+
+    def __init__(
+        self,
+        cache_path: Optional[str] = None,
+        max_concurrency: int = 8,
+        max_bytes: int = 512 * 1024,
+        max_chars: int = 20000,
+        max_code_blocks: int = 5
+    ):
+        self.cache = EnrichmentCache(cache_path) if cache_path else None
+        self.max_concurrency = max_concurrency
+        self.max_bytes = max_bytes
+        self.max_chars = max_chars
+        self.max_code_blocks = max_code_blocks
+        self.parse_executor: Optional[Executor] = None
+        # One semaphore per event loop: an asyncio.Semaphore only works in the loop it was first used in
+        self._semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.enriched = 0
+
+    @staticmethod
+    def detail_url(discovery) -> Optional[str]:
+        """Detail page for a discovery, or None if there is nothing to fetch"""
+        parsed = urlparse(discovery.source_url)
+        parts = [p for p in parsed.path.split('/') if p]
+        if discovery.source_type == 'github' and parsed.netloc == 'github.com' and len(parts) == 2:
+            return discovery.source_url
+        if discovery.source_type == 'reddit' and parsed.netloc.endswith('reddit.com') and 'comments' in parts:
+            return discovery.source_url
+        return None
+
+    @staticmethod
+    def revision_of(response, body: bytes, validators: Dict[str, str]) -> str:
+        """Revision of a page: its validator, or a digest of the body"""
+        etag = response.headers.get('ETag') or validators.get('If-None-Match')
+        last_modified = response.headers.get('Last-Modified') or validators.get('If-Modified-Since')
+        if etag or last_modified:
+            return etag or last_modified
+        return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+    async def fetch_details(self, engine: AsyncFetchEngine, discovery, url: str) -> Optional[Dict]:
+        validators = engine.cache.validators(url) if engine.cache is not None else {}
+        response = await engine.fetch(url, max_bytes=self.max_bytes)
+
+        if response.status_code == 304 and engine.cache is not None:
+            body = engine.cache.get(url) or b""
+        else:
+            response.raise_for_status()
+            body = response.content
+
+        revision = self.revision_of(response, body, validators)
+        if self.cache is not None:
+            details = self.cache.get(url, revision)
+            if details is not None:
+                return details
+
+        args = (discovery.source_type, body, self.max_chars, self.max_code_blocks)
+        if self.parse_executor is None:
+            details = extract_details(*args)
+        else:
+            loop = asyncio.get_running_loop()
+            details = await loop.run_in_executor(self.parse_executor, extract_details, *args)
+
+        if self.cache is not None:
+            self.cache.put(url, revision, details)
+        return details
+
+    async def enrich(self, engine: AsyncFetchEngine, discovery):
+        """Fetch a discovery's detail page and fold it into raw_content and metadata"""
+        url = self.detail_url(discovery)
+        if url is None:
+            return discovery
+
+        loop = asyncio.get_running_loop()
+        if loop not in self._semaphores:
+            self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+
+        try:
+            async with self._semaphores[loop]:
+                details = await self.fetch_details(engine, discovery, url)
+        except Exception as e:
+            logger.error(f"Error enriching {url}: {e}")
+            return discovery
+
+        parts = [discovery.raw_content, details['body']] + details['code_blocks']
+        discovery.raw_content = "\n\n".join(part for part in parts if part)
+        discovery.metadata['code_blocks'] = len(details['code_blocks'])
+        discovery.metadata['enriched'] = True
+        if details['code_blocks']:
+            discovery.content_type = "code_snippet"
+        self.enriched += 1
+        return discovery
+
+    async def enrich_all(self, engine: AsyncFetchEngine, discoveries: List) -> List:
+        """Enrich every discovery concurrently (bounded by max_concurrency)"""
+        await asyncio.gather(*(self.enrich(engine, d) for d in discoveries))
+        logger.info(f"Enriched {self.enriched} discoveries")
+        return discoveries
@@ -0,0 +1,192 @@
+"""
+Feed Scraper Agents - Component 1
+Feed-based agents (JSON listings, RSS, Atom) that build the same
+LoopDiscovery objects as the HTML agents from a fraction of the bytes.
+
+Author: Manus AI
+Date: October 21, 2025
+"""
+
+import json
+import logging
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+from xml.etree.ElementTree import Element, XMLPullParser
+
+from .web_scraper import BaseScraperAgent, LoopDiscovery
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def local_name(tag: str) -> str:
+    """Tag without its XML namespace"""
+    return tag.rsplit('}', 1)[-1]
+
+
+def with_query(url: str, **params: str) -> str:
+    """URL with query parameters added or replaced"""
+    parsed = urlparse(url)
+    query = dict(parse_qsl(parsed.query))
+    query.update(params)
+    return urlunparse(parsed._replace(query=urlencode(query)))
+
+
+class FeedScraperAgent(BaseScraperAgent):
+    """Base class for agents that read JSON or XML (RSS/Atom) feeds instead of HTML"""
+
+    FORMATS = ('json', 'rss')
+
+    # XML is fed to the pull parser in chunks of this size
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, name: str, target_urls: List[str], keywords: List[str], format: str = 'json', **kwargs):
+        if format not in self.FORMATS:
+            raise ValueError(f"Unknown feed format: {format}")
+        super().__init__(name, target_urls, keywords, **kwargs)
+        self.format = format
+
+    @property
+    def mode(self) -> str:
+        return self.format
+
+    def parse(self, url: str, content: bytes) -> Tuple[List[LoopDiscovery], Optional[str]]:
+        """Parse a feed into discoveries and its next-page link in one pass"""
+        if self.format == 'json':
+            data = json.loads(content)
+            entries, next_url = self.json_entries(data), self.json_next_url(url, data)
+        else:
+            entries, links = self.xml_entries(content)
+            next_url = links.get('next')
+
+        discoveries = []
+        timestamp = datetime.utcnow().isoformat()
+        for entry in entries:
+            try:
+                discovery = self.entry_to_discovery(entry, timestamp)
+            except Exception as e:
+                logger.error(f"[{self.name}] Error processing entry: {e}")
+                continue
+            if discovery is not None:
+                discoveries.append(discovery)
+                logger.info(f"[{self.name}] Discovered: {discovery.metadata['title'][:50]}...")
+        return discoveries, next_url
+
+    def parse_page(self, url: str, content: bytes) -> List[LoopDiscovery]:
+        return self.parse(url, content)[0]
+
+    def next_page_url(self, url: str, content: bytes) -> Optional[str]:
+        return self.parse(url, content)[1]
+
+    def json_entries(self, data) -> List[Dict]:
+        """Entries of a JSON listing - to be implemented by JSON feed subclasses"""
+        raise NotImplementedError("JSON feeds must implement json_entries()")
+
+    def json_next_url(self, url: str, data) -> Optional[str]:
+        return None
+
+    def xml_entries(self, content: bytes) -> Tuple[List[Dict], Dict[str, str]]:
+        """Entries of an RSS or Atom feed (parsed incrementally) and its rel links"""
+        parser = XMLPullParser(events=('end',))
+        entries, links = [], {}
+        for start in range(0, len(content), self.CHUNK_SIZE):
+            parser.feed(content[start:start + self.CHUNK_SIZE])
+            self._drain(parser, entries, links)
+        parser.close()
+        self._drain(parser, entries, links)
+        return entries, links
+
+    def _drain(self, parser: XMLPullParser, entries: List[Dict], links: Dict[str, str]):
+        for _, element in parser.read_events():
+            tag = local_name(element.tag)
+            if tag in ('item', 'entry'):
+                entries.append(self.xml_entry(element))
+                # Entries are done with: drop their subtrees to keep memory flat
+                element.clear()
+            elif tag == 'link' and element.get('rel') == 'next' and element.get('href'):
+                links.setdefault('next', element.get('href'))
+
+    @staticmethod
+    def xml_entry(element: Element) -> Dict:
+        """Flatten an RSS <item> or Atom <entry> into a dict of common fields"""
+        entry = {}
+        for child in element:
+            tag = local_name(child.tag)
+            if tag == 'link':
+                if child.get('rel', 'alternate') == 'alternate':
+                    entry['link'] = child.get('href') or (child.text or '').strip()
+            elif tag in ('author', 'creator'):
+                name = next((c.text for c in child if local_name(c.tag) == 'name'), None)
+                entry['author'] = (name or child.text or '').strip()
+            elif tag == 'category':
+                entry.setdefault('category', child.get('term') or (child.text or '').strip())
+            elif tag in ('description', 'summary', 'content'):
+                entry.setdefault('summary', (child.text or '').strip())
+            else:
+                entry[tag] = (child.text or '').strip()
+        return entry
+
+    def entry_to_discovery(self, entry: Dict, timestamp: str) -> Optional[LoopDiscovery]:
+        """Turn one feed entry into a discovery (None if it does not match)"""
+        raise NotImplementedError("Subclasses must implement entry_to_discovery()")
+
+
+class RedditFeedAgent(FeedScraperAgent):
+    """Reddit agent reading the .json or .rss listings of the same subreddits"""
+
+    SOURCE = 'reddit'
+    SUBREDDITS = ["Python", "learnpython", "automation", "AutomateYourself"]
+
+    def __init__(self, format: str = 'json'):
+        super().__init__(
+            name="Reddit Feed Scraper",
+            target_urls=[f"https://old.reddit.com/r/{sub}/.{format}" for sub in self.SUBREDDITS],
+            keywords=[
+                "script", "automation", "automate", "bot", "workflow",
+                "how to", "tutorial", "code", "python"
+            ],
+            format=format,
+            max_pages=4,
+            max_items=100
+        )
+
+    def json_entries(self, data) -> List[Dict]:
+        # Same page size as the HTML listing
+        return [child['data'] for child in data['data']['children'][:25]]
+
+    def json_next_url(self, url: str, data) -> Optional[str]:
+        after = data['data'].get('after')
+        return with_query(url, after=after) if after else None
+
+    def entry_to_discovery(self, entry: Dict, timestamp: str) -> Optional[LoopDiscovery]:
+        title = entry.get('title')
+        if not title or not self.matches_keywords(title):
+            return None
+
+        if self.format == 'json':
+            post_url = f"https://old.reddit.com{entry['permalink']}"
+            upvotes = str(entry.get('score', 0))
+            author = entry.get('author') or "unknown"
+            subreddit = entry.get('subreddit_name_prefixed') or ""
+        else:
+            # Atom feeds carry no score
+            post_url = entry.get('link', '').replace("://www.reddit.com", "://old.reddit.com")
+            upvotes = "0"
+            author = entry.get('author', '').removeprefix('/u/') or "unknown"
+            subreddit = f"r/{entry['category']}" if entry.get('category') else ""
+
+        return LoopDiscovery(
+            source_url=post_url,
+            source_type="reddit",
+            content_type="text_description",
+            raw_content=title,
+            metadata={
+                "title": title,
+                "author": author,
+                "upvotes": upvotes,
+                "subreddit": subreddit
+            },
+            discovery_timestamp=timestamp
+        )
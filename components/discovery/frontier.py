@@ -0,0 +1,134 @@
+"""
+Crawl Frontier - Component 1
+Persistent seen-set for incremental crawling: a Bloom filter in front of an
+exact SQLite store, so already-seen URLs are skipped across runs.
+
+Author: Manus AI
+Date: October 19, 2025
+"""
+
+import hashlib
+import logging
+import math
+import sqlite3
+import struct
+import time
+from pathlib import Path
+from typing import Iterable, List
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter using double hashing over a blake2b digest"""
+
+    HEADER = struct.Struct('<QQQ')  # num_bits, num_hashes, count
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1, h2 = struct.unpack('<QQ', digest)
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    def save(self, path: Path):
+        """Write the filter atomically"""
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(self.HEADER.pack(self.num_bits, self.num_hashes, self.count))
+            f.write(self.bits)
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> "BloomFilter":
+        with open(path, 'rb') as f:
+            num_bits, num_hashes, count = cls.HEADER.unpack(f.read(cls.HEADER.size))
+            bloom = cls.__new__(cls)
+            bloom.num_bits = num_bits
+            bloom.num_hashes = num_hashes
+            bloom.count = count
+            bloom.bits = bytearray(f.read())
+        return bloom
+
+
+class CrawlFrontier:
+    """Persistent record of every source URL already handed downstream"""
+
+    def __init__(self, directory: str, capacity: int = 1_000_000, error_rate: float = 0.001):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.bloom_path = self.directory / "seen.bloom"
+        self.capacity = capacity
+        self.error_rate = error_rate
+
+        if self.bloom_path.exists():
+            self.bloom = BloomFilter.load(self.bloom_path)
+        else:
+            self.bloom = BloomFilter(capacity, error_rate)
+
+        # Exact store, consulted only when the Bloom filter says "maybe"
+        self.conn = sqlite3.connect(str(self.directory / "seen.db"))
+        self.conn.execute("CREATE TABLE IF NOT EXISTS seen (url TEXT PRIMARY KEY, first_seen REAL NOT NULL)")
+        self.conn.commit()
+
+        self.skipped = 0
+
+    def __contains__(self, url: str) -> bool:
+        if url not in self.bloom:
+            return False
+        return self.conn.execute("SELECT 1 FROM seen WHERE url = ?", (url,)).fetchone() is not None
+
+    def add(self, url: str):
+        """Mark a URL as seen"""
+        self.conn.execute("INSERT OR IGNORE INTO seen VALUES (?, ?)", (url, time.time()))
+        self.bloom.add(url)
+
+    def check_and_add(self, url: str) -> bool:
+        """Mark a URL as seen; returns True if it was new"""
+        if url in self:
+            self.skipped += 1
+            return False
+        self.add(url)
+        return True
+
+    def filter_new(self, discoveries: List) -> List:
+        """Keep only discoveries whose source_url has not been seen before"""
+        return [d for d in discoveries if self.check_and_add(d.source_url)]
+
+    def commit(self):
+        """Persist the seen-set so it survives restarts
+
+        Call once the discoveries marked as seen have been handled downstream:
+        until then a failed run can roll them back and see them again.
+        """
+        self.conn.commit()
+        self.bloom.save(self.bloom_path)
+        logger.info(f"Frontier saved: {self.bloom.count} URLs seen, {self.skipped} skipped this run")
+
+    def rollback(self):
+        """Forget URLs marked as seen since the last commit"""
+        self.conn.rollback()
+        if self.bloom_path.exists():
+            self.bloom = BloomFilter.load(self.bloom_path)
+        else:
+            self.bloom = BloomFilter(self.capacity, self.error_rate)
+        self.skipped = 0
+
+    def close(self):
+        self.commit()
+        self.conn.close()
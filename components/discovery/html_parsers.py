@@ -0,0 +1,233 @@
+"""
+HTML Parser Backends - Component 1
+Pluggable row extraction for scraper agents: a fast lxml/XPath path and a
+BeautifulSoup fallback that only parses the needed subtrees.
+
+Author: Manus AI
+Date: October 18, 2025
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    import lxml.html
+    from lxml import etree
+except ImportError:  # pragma: no cover - lxml is optional at runtime
+    lxml = None
+    etree = None
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class Selector:
+    """One tag/class step, matched like BeautifulSoup's find(tag, class_=...)"""
+    tag: str
+    class_: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class FieldSpec:
+    """Path of selectors from a row to a field; reads text unless attr is set"""
+    path: Tuple[Selector, ...]
+    attr: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class RowSpec:
+    """Repeated rows on a listing page and the fields to pull from each"""
+    row: Selector
+    fields: Tuple[Tuple[str, FieldSpec], ...]
+
+
+class ParserBackend:
+    """Base class for HTML parser backends"""
+
+    name = "base"
+
+    def extract_rows(self, content: Union[bytes, str], spec: RowSpec, limit: Optional[int] = None) -> List[Dict[str, Optional[str]]]:
+        """Extract one dict of fields per row; missing fields are None"""
+        raise NotImplementedError("Backends must implement extract_rows()")
+
+    def extract_first(self, content: Union[bytes, str], field: FieldSpec) -> Optional[str]:
+        """Extract a single field from the whole page (e.g. a next-page link)"""
+        raise NotImplementedError("Backends must implement extract_first()")
+
+    def extract_code_blocks(self, content: Union[bytes, str], min_length: int = 50) -> List[str]:
+        """Extract <pre>/<code> text longer than min_length"""
+        raise NotImplementedError("Backends must implement extract_code_blocks()")
+
+
+class SoupParserBackend(ParserBackend):
+    """BeautifulSoup fallback; parses only the row subtrees via SoupStrainer"""
+
+    name = "bs4"
+
+    @staticmethod
+    def _find(node, path: Tuple[Selector, ...]):
+        for step in path:
+            if step.class_:
+                node = node.find(step.tag, class_=step.class_)
+            else:
+                node = node.find(step.tag)
+            if node is None:
+                return None
+        return node
+
+    @staticmethod
+    def _class_filter(class_: Optional[str]):
+        """Token-based class matcher; SoupStrainer sees the raw attribute string"""
+        if not class_:
+            return None
+        tokens = class_.split()
+
+        def match(value) -> bool:
+            if not value:
+                return False
+            if isinstance(value, str):
+                value = value.split()
+            return all(token in value for token in tokens)
+
+        return match
+
+    def extract_rows(self, content: Union[bytes, str], spec: RowSpec, limit: Optional[int] = None) -> List[Dict[str, Optional[str]]]:
+        strainer = SoupStrainer(spec.row.tag, class_=self._class_filter(spec.row.class_))
+        soup = BeautifulSoup(content, 'html.parser', parse_only=strainer)
+        rows = soup.find_all(spec.row.tag, class_=spec.row.class_)
+
+        results = []
+        for row in rows[:limit]:
+            results.append({name: self._read(row, field) for name, field in spec.fields})
+        return results
+
+    def _read(self, node, field: FieldSpec) -> Optional[str]:
+        node = self._find(node, field.path)
+        if node is None:
+            return None
+        if field.attr:
+            return node.get(field.attr)
+        return node.get_text(strip=True)
+
+    def extract_first(self, content: Union[bytes, str], field: FieldSpec) -> Optional[str]:
+        first = field.path[0]
+        strainer = SoupStrainer(first.tag, class_=self._class_filter(first.class_))
+        return self._read(BeautifulSoup(content, 'html.parser', parse_only=strainer), field)
+
+    def extract_code_blocks(self, content: Union[bytes, str], min_length: int = 50) -> List[str]:
+        soup = BeautifulSoup(content, 'html.parser', parse_only=SoupStrainer(['pre', 'code']))
+        code_blocks = []
+        for tag in soup.find_all(['pre', 'code']):
+            code = tag.get_text(strip=True)
+            if code and len(code) > min_length:
+                code_blocks.append(code)
+        return code_blocks
+
+
+class LxmlParserBackend(ParserBackend):
+    """lxml backend with XPath expressions compiled once per RowSpec"""
+
+    name = "lxml"
+
+    def __init__(self):
+        self._compiled: Dict[Union[RowSpec, FieldSpec], object] = {}
+        self._text = etree.XPath('.//text()[not(parent::script or parent::style)]')
+        self._code = etree.XPath('//pre | //code')
+
+    @staticmethod
+    def _predicate(selector: Selector) -> str:
+        if not selector.class_:
+            return selector.tag
+        if ' ' in selector.class_:
+            # Multi-class strings match the whole attribute, as in BeautifulSoup
+            return f"{selector.tag}[normalize-space(@class)='{' '.join(selector.class_.split())}']"
+        return f"{selector.tag}[contains(concat(' ', normalize-space(@class), ' '), ' {selector.class_} ')]"
+
+    def compile(self, spec: RowSpec) -> Tuple:
+        """Compile (and memoize) the row and field XPath expressions"""
+        if spec not in self._compiled:
+            row_xpath = etree.XPath(f".//{self._predicate(spec.row)}")
+            fields = [(name, field.attr, self.compile_field(field)) for name, field in spec.fields]
+            self._compiled[spec] = (row_xpath, fields)
+        return self._compiled[spec]
+
+    def compile_field(self, field: FieldSpec):
+        """Compile (and memoize) the XPath selecting a field's first match"""
+        if field not in self._compiled:
+            expr = "."
+            for step in field.path:
+                expr = f"({expr}//{self._predicate(step)})[1]"
+            self._compiled[field] = etree.XPath(expr)
+        return self._compiled[field]
+
+    def _get_text(self, node) -> str:
+        return ''.join(text.strip() for text in self._text(node))
+
+    def _document(self, content: Union[bytes, str]):
+        if not content or not content.strip():
+            return None
+        return lxml.html.document_fromstring(content)
+
+    def extract_rows(self, content: Union[bytes, str], spec: RowSpec, limit: Optional[int] = None) -> List[Dict[str, Optional[str]]]:
+        document = self._document(content)
+        if document is None:
+            return []
+
+        row_xpath, fields = self.compile(spec)
+        results = []
+        for row in row_xpath(document)[:limit]:
+            results.append({name: self._read(row, xpath, attr) for name, attr, xpath in fields})
+        return results
+
+    def _read(self, node, xpath, attr: Optional[str]) -> Optional[str]:
+        nodes = xpath(node)
+        if not nodes:
+            return None
+        if attr:
+            return nodes[0].get(attr)
+        return self._get_text(nodes[0])
+
+    def extract_first(self, content: Union[bytes, str], field: FieldSpec) -> Optional[str]:
+        document = self._document(content)
+        if document is None:
+            return None
+        return self._read(document, self.compile_field(field), field.attr)
+
+    def extract_code_blocks(self, content: Union[bytes, str], min_length: int = 50) -> List[str]:
+        document = self._document(content)
+        if document is None:
+            return []
+
+        code_blocks = []
+        for node in self._code(document):
+            code = self._get_text(node)
+            if code and len(code) > min_length:
+                code_blocks.append(code)
+        return code_blocks
+
+
+# One backend per name and process, so compiled selectors are reused
+_BACKENDS: Dict[str, ParserBackend] = {}
+
+
+def get_parser_backend(name: Optional[str] = None) -> ParserBackend:
+    """Get a parser backend by name; defaults to lxml when it is installed"""
+    if name is None:
+        name = "lxml" if etree is not None else "bs4"
+
+    if name not in _BACKENDS:
+        if name == "lxml":
+            if etree is None:
+                logger.warning("lxml is not installed, falling back to BeautifulSoup")
+                return get_parser_backend("bs4")
+            _BACKENDS[name] = LxmlParserBackend()
+        elif name == "bs4":
+            _BACKENDS[name] = SoupParserBackend()
+        else:
+            raise ValueError(f"Unknown parser backend: {name}")
+    return _BACKENDS[name]
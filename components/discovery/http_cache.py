@@ -0,0 +1,111 @@
+"""
+HTTP Response Cache - Component 1
+Persistent conditional-GET cache (ETag / Last-Modified) for the scrapers.
+
+Author: Manus AI
+Date: October 18, 2025
+"""
+
+import logging
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+import httpx
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class HTTPCache:
+    """SQLite-backed response cache with validators and size-based eviction"""
+
+    def __init__(self, path: str, max_bytes: int = 50 * 1024 * 1024):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.conn = sqlite3.connect(str(self.path))
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON responses (last_access)")
+        self.conn.commit()
+
+    def validators(self, url: str) -> Dict[str, str]:
+        """Get conditional request headers for a cached URL"""
+        row = self.conn.execute(
+            "SELECT etag, last_modified FROM responses WHERE url = ?", (url,)
+        ).fetchone()
+        if row is None:
+            return {}
+
+        headers = {}
+        if row[0]:
+            headers['If-None-Match'] = row[0]
+        if row[1]:
+            headers['If-Modified-Since'] = row[1]
+        return headers
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Get the cached body for a URL"""
+        row = self.conn.execute("SELECT body FROM responses WHERE url = ?", (url,)).fetchone()
+        return row[0] if row else None
+
+    def update(self, url: str, response: httpx.Response):
+        """Record a response: refresh on 304, store on a cacheable 200"""
+        if response.status_code == 304:
+            self.hits += 1
+            self.conn.execute(
+                "UPDATE responses SET last_access = ? WHERE url = ?", (time.time(), url)
+            )
+            self.conn.commit()
+            return
+
+        self.misses += 1
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if response.status_code != 200 or not (etag or last_modified):
+            return
+
+        body = response.content
+        self.conn.execute(
+            "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+            (url, etag, last_modified, body, len(body), time.time())
+        )
+        self.evict()
+        self.conn.commit()
+
+    def total_size(self) -> int:
+        """Total cached body size in bytes"""
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def evict(self):
+        """Drop least recently used entries until the cache fits max_bytes"""
+        excess = self.total_size() - self.max_bytes
+        if excess <= 0:
+            return
+
+        rows = self.conn.execute("SELECT url, size FROM responses ORDER BY last_access").fetchall()
+        for url, size in rows:
+            if excess <= 0:
+                break
+            self.conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+            excess -= size
+            logger.info(f"Evicted cached response: {url}")
+
+    def close(self):
+        """Close the cache database"""
+        self.conn.close()
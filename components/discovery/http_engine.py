@@ -0,0 +1,158 @@
+"""
+Async HTTP Fetch Engine - Component 1
+Shared, pooled HTTP client used by all scraper agents.
+
+Author: Manus AI
+Date: October 18, 2025
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional, Union
+from urllib.parse import urlparse
+
+import httpx
+
+from .http_cache import HTTPCache
+from .politeness import PolitenessScheduler
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class AsyncFetchEngine:
+    """Pooled asyncio HTTP client with global and per-host concurrency limits"""
+
+    DEFAULT_HEADERS = {
+        'User-Agent': 'Mozilla/5.0 (compatible; AGI-OS-Bot/1.0; +https://loopfactory.ai)'
+    }
+
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_per_host: int = 4,
+        timeout: float = 10.0,
+        headers: Optional[Dict[str, str]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[HTTPCache] = None,
+        scheduler: Optional[PolitenessScheduler] = None
+    ):
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.timeout = timeout
+        self.headers = dict(self.DEFAULT_HEADERS)
+        self.headers.update(headers or {})
+        self.transport = transport
+        self.cache = cache
+        self.scheduler = scheduler
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Lazily create the shared client (keep-alive connection pool)"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=self.timeout,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                ),
+                transport=self.transport
+            )
+        return self._client
+
+    def host_limit(self, url: str) -> asyncio.Semaphore:
+        """Get the concurrency limiter for the host of a URL"""
+        host = urlparse(url).netloc
+        if host not in self._host_limits:
+            self._host_limits[host] = asyncio.Semaphore(self.max_per_host)
+        return self._host_limits[host]
+
+    async def fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        max_bytes: Optional[int] = None
+    ) -> httpx.Response:
+        """Fetch a single URL, waiting for a free per-host slot; bodies are cut at max_bytes"""
+        request_headers = dict(headers or {})
+        if self.cache is not None:
+            request_headers.update(self.cache.validators(url))
+
+        async with self.host_limit(url):
+            response = await self.get_with_retries(url, request_headers, max_bytes)
+
+        if self.cache is not None:
+            self.cache.update(url, response)
+        return response
+
+    async def get(self, url: str, headers: Dict[str, str], max_bytes: Optional[int] = None) -> httpx.Response:
+        """Issue a GET, streaming and stopping after max_bytes when set"""
+        if max_bytes is None:
+            return await self.client.get(url, headers=headers)
+
+        chunks, size = [], 0
+        async with self.client.stream('GET', url, headers=headers) as response:
+            async for chunk in response.aiter_bytes():
+                chunks.append(chunk)
+                size += len(chunk)
+                if size >= max_bytes:
+                    break
+
+        # The body is already decoded, so drop the transfer headers
+        headers = [
+            (name, value) for name, value in response.headers.items()
+            if name.lower() not in ('content-encoding', 'content-length', 'transfer-encoding')
+        ]
+        return httpx.Response(
+            response.status_code,
+            headers=headers,
+            content=b''.join(chunks)[:max_bytes],
+            request=response.request
+        )
+
+    async def get_with_retries(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        max_bytes: Optional[int] = None
+    ) -> httpx.Response:
+        """Issue a GET through the politeness scheduler, retrying on 429/503"""
+        if self.scheduler is None:
+            return await self.get(url, headers, max_bytes)
+
+        attempt = 0
+        while True:
+            await self.scheduler.acquire(url)
+            response = await self.get(url, headers, max_bytes)
+            if not self.scheduler.is_throttled(response):
+                self.scheduler.record_success(url)
+                return response
+
+            self.scheduler.penalize(url, self.scheduler.retry_after(response, attempt))
+            attempt += 1
+            if attempt > self.scheduler.max_retries:
+                return response
+
+    async def fetch_all(self, urls: List[str]) -> List[Union[httpx.Response, Exception]]:
+        """Fetch all URLs concurrently; failures are returned in place"""
+        return await asyncio.gather(
+            *(self.fetch(url) for url in urls),
+            return_exceptions=True
+        )
+
+    async def aclose(self):
+        """Close the pooled connections"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def __aenter__(self) -> "AsyncFetchEngine":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
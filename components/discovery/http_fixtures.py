@@ -0,0 +1,133 @@
+"""
+HTTP Fixtures - Component 1
+Record real scraper responses into a fixture archive and replay them offline,
+so agents and benchmarks can run without hitting the live sites.
+
+Author: Manus AI
+Date: October 20, 2025
+"""
+
+import asyncio
+import base64
+import gzip
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Dict, Optional
+
+import httpx
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+class FixtureArchive:
+    """URL -> recorded response, stored as gzipped JSON"""
+
+    # Bodies are stored decoded, so transfer headers no longer apply
+    DROPPED_HEADERS = {'content-encoding', 'content-length', 'transfer-encoding', 'connection'}
+
+    def __init__(self, responses: Optional[Dict[str, Dict]] = None):
+        self.responses = responses or {}
+
+    def __len__(self) -> int:
+        return len(self.responses)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.responses
+
+    def add(self, url: str, status_code: int, headers: Dict[str, str], body: bytes):
+        """Record a response"""
+        self.responses[url] = {
+            "status_code": status_code,
+            "headers": {k: v for k, v in headers.items() if k.lower() not in self.DROPPED_HEADERS},
+            "body": base64.b64encode(body).decode('ascii')
+        }
+
+    def body(self, url: str) -> bytes:
+        return base64.b64decode(self.responses[url]["body"])
+
+    def response(self, url: str, request: Optional[httpx.Request] = None) -> httpx.Response:
+        """Build an httpx response for a recorded URL"""
+        entry = self.responses[url]
+        return httpx.Response(
+            entry["status_code"],
+            headers=entry["headers"],
+            content=self.body(url),
+            request=request
+        )
+
+    def save(self, path: str):
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            json.dump({"version": 1, "responses": self.responses}, f)
+        logger.info(f"Saved {len(self)} fixtures to {path}")
+
+    @classmethod
+    def load(cls, path: str) -> "FixtureArchive":
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return cls(json.load(f)["responses"])
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Passes requests to a real transport and records every response"""
+
+    def __init__(self, archive: FixtureArchive, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.archive = archive
+        self.transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.transport.handle_async_request(request)
+        body = await response.aread()
+        await response.aclose()
+
+        url = str(request.url)
+        self.archive.add(url, response.status_code, dict(response.headers), body)
+        return self.archive.response(url, request)
+
+    async def aclose(self):
+        await self.transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Serves recorded responses; unknown URLs get a 404"""
+
+    def __init__(self, archive: FixtureArchive, latency: float = 0.0):
+        self.archive = archive
+        self.latency = latency
+        self.requests = 0
+        self.misses = 0
+        self.bytes_served = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+
+        url = str(request.url)
+        if url not in self.archive:
+            self.misses += 1
+            logger.warning(f"No fixture recorded for {url}")
+            return httpx.Response(404, request=request)
+
+        response = self.archive.response(url, request)
+        self.bytes_served += len(response.content)
+        return response
+
+
+async def record(output_path: str):
+    """Run every agent against the live sites and save what they fetched"""
+    from .web_scraper import ScraperOrchestrator
+
+    archive = FixtureArchive()
+    orchestrator = ScraperOrchestrator(transport=RecordingTransport(archive))
+    discoveries = await orchestrator.run_all_agents()
+    archive.save(output_path)
+    print(f"Recorded {len(archive)} responses ({len(discoveries)} discoveries) to {output_path}")
+
+
+# Main execution
+if __name__ == "__main__":
+    output = sys.argv[1] if len(sys.argv) > 1 else str(Path("data") / "fixtures.json.gz")
+    asyncio.run(record(output))
@@ -0,0 +1,136 @@
+"""
+Scraper Metrics - Component 1
+Prometheus metrics for the scrape hot path: fetch latency and bytes, parse
+time, items per page, keyword-match ratio, errors and in-flight requests,
+all labelled by agent, plus a per-run summary for pipeline_stats.json.
+
+Author: Manus AI
+Date: October 21, 2025
+"""
+
+import logging
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, generate_latest, start_http_server, write_to_textfile
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+# Summary field for each exported sample (errors are keyed by stage instead)
+SUMMARY_FIELDS = {
+    'scraper_fetch_seconds_count': 'fetches',
+    'scraper_fetch_seconds_sum': 'fetch_seconds',
+    'scraper_fetch_bytes_total': 'bytes',
+    'scraper_parse_seconds_count': 'pages_parsed',
+    'scraper_parse_seconds_sum': 'parse_seconds',
+    'scraper_items_per_page_sum': 'items',
+    'scraper_keyword_checks_total': 'keyword_checks',
+    'scraper_keyword_matches_total': 'keyword_matches',
+    'scraper_new_discoveries_total': 'new_discoveries'
+}
+
+
+class ScraperMetrics:
+    """Per-agent scrape metrics in their own Prometheus registry
+
+    Each instance owns a CollectorRegistry, so orchestrators, workers and
+    tests never collide on metric names. Counters are cumulative as
+    Prometheus expects; begin_run() marks a baseline and run_summary()
+    reports what happened since.
+    """
+
+    LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+    ITEM_BUCKETS = (0, 1, 5, 10, 25, 50, 100)
+
+    def __init__(self, registry: Optional[CollectorRegistry] = None):
+        self.registry = registry or CollectorRegistry()
+        labels = ['agent']
+
+        # Fetch latency includes time queued for a per-host slot and politeness delays
+        self.fetch_seconds = Histogram(
+            'scraper_fetch_seconds', 'Page fetch latency', labels,
+            buckets=self.LATENCY_BUCKETS, registry=self.registry
+        )
+        self.fetch_bytes = Counter('scraper_fetch_bytes', 'Response body bytes fetched', labels, registry=self.registry)
+        self.pages = Counter('scraper_pages', 'Fetched pages by HTTP status', labels + ['status'], registry=self.registry)
+        self.parse_seconds = Histogram(
+            'scraper_parse_seconds', 'Page parse time, including the hop to a parse worker', labels,
+            buckets=self.LATENCY_BUCKETS, registry=self.registry
+        )
+        self.items_per_page = Histogram(
+            'scraper_items_per_page', 'Discoveries parsed per page', labels,
+            buckets=self.ITEM_BUCKETS, registry=self.registry
+        )
+        self.keyword_checks = Counter('scraper_keyword_checks', 'Candidates checked against keywords', labels, registry=self.registry)
+        self.keyword_matches = Counter('scraper_keyword_matches', 'Candidates that matched a keyword', labels, registry=self.registry)
+        self.new_discoveries = Counter('scraper_new_discoveries', 'Discoveries not seen in earlier runs', labels, registry=self.registry)
+        self.errors = Counter('scraper_errors', 'Scrape errors by stage (fetch, http, parse)', labels + ['stage'], registry=self.registry)
+        self.in_flight = Gauge('scraper_in_flight_requests', 'Page fetches in progress', labels, registry=self.registry)
+
+        self._baseline: Dict[str, Dict[str, float]] = {}
+
+    def observe_fetch(self, agent: str, seconds: float, status: int, size: int):
+        self.fetch_seconds.labels(agent).observe(seconds)
+        self.fetch_bytes.labels(agent).inc(size)
+        self.pages.labels(agent, str(status)).inc()
+
+    def observe_parse(self, agent: str, seconds: float, items: int, checked: int, matched: int):
+        self.parse_seconds.labels(agent).observe(seconds)
+        self.items_per_page.labels(agent).observe(items)
+        self.keyword_checks.labels(agent).inc(checked)
+        self.keyword_matches.labels(agent).inc(matched)
+
+    def record_error(self, agent: str, stage: str):
+        self.errors.labels(agent, stage).inc()
+
+    def totals(self) -> Dict[str, Dict[str, float]]:
+        """Cumulative summary fields per agent"""
+        totals: Dict[str, Dict[str, float]] = {}
+        for family in self.registry.collect():
+            for sample in family.samples:
+                if sample.name == 'scraper_errors_total':
+                    field = f"{sample.labels['stage']}_errors"
+                elif sample.name in SUMMARY_FIELDS:
+                    field = SUMMARY_FIELDS[sample.name]
+                else:
+                    continue
+                agent = totals.setdefault(sample.labels['agent'], {})
+                agent[field] = agent.get(field, 0.0) + sample.value
+        return totals
+
+    def begin_run(self):
+        """Start a new run: run_summary() reports from here"""
+        self._baseline = self.totals()
+
+    def run_summary(self) -> Dict[str, Dict[str, float]]:
+        """What each agent spent and produced since begin_run()"""
+        summary = {}
+        for agent, fields in self.totals().items():
+            baseline = self._baseline.get(agent, {})
+            run = {field: value - baseline.get(field, 0.0) for field, value in fields.items()}
+            if not any(run.values()):
+                continue
+            run['keyword_match_ratio'] = run['keyword_matches'] / run['keyword_checks'] if run.get('keyword_checks') else None
+            run['mean_fetch_seconds'] = run['fetch_seconds'] / run['fetches'] if run.get('fetches') else None
+            run['fetch_seconds_per_new_discovery'] = (
+                run.get('fetch_seconds', 0.0) / run['new_discoveries'] if run.get('new_discoveries') else None
+            )
+            summary[agent] = run
+        return summary
+
+    def exposition(self) -> bytes:
+        """Metrics in the Prometheus text format"""
+        return generate_latest(self.registry)
+
+    def write_textfile(self, path: Union[str, Path]):
+        """Dump the metrics for node_exporter's textfile collector (written atomically)"""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        write_to_textfile(str(path), self.registry)
+
+    def serve(self, port: int, addr: str = '0.0.0.0'):
+        """Serve /metrics over HTTP from a background thread"""
+        start_http_server(port, addr=addr, registry=self.registry)
+        logger.info(f"Serving scraper metrics on {addr}:{port}")
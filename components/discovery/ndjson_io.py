@@ -0,0 +1,126 @@
+"""
+NDJSON Serialization - Component 1
+Append-only, one-object-per-line files for discoveries, optionally gzip
+compressed, written as items are produced and read back lazily.
+
+Author: Manus AI
+Date: October 21, 2025
+"""
+
+import gzip
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def is_ndjson(path: Union[str, Path]) -> bool:
+    """Whether a path names an NDJSON file (.ndjson / .jsonl, optionally .gz)"""
+    suffixes = Path(path).suffixes
+    if suffixes[-1:] == ['.gz']:
+        suffixes = suffixes[:-1]
+    return suffixes[-1:] in (['.ndjson'], ['.jsonl'])
+
+
+def _open(path: Path, mode: str, compress: Optional[bool]):
+    if compress is None:
+        compress = path.suffix == '.gz'
+    if compress:
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+class NDJSONWriter:
+    """Appends one compact JSON object per line, flushing every flush_every items"""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        append: bool = True,
+        compress: Optional[bool] = None,
+        flush_every: int = 1
+    ):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Gzip members concatenate, so appending to a compressed file stays readable
+        self.file = _open(self.path, 'a' if append else 'w', compress)
+        self.flush_every = flush_every
+        self.count = 0
+
+    def write(self, item):
+        """Write a dict, or any object with to_dict() (e.g. LoopDiscovery)"""
+        record = item.to_dict() if hasattr(item, 'to_dict') else item
+        self.file.write(json.dumps(record, separators=(',', ':')))
+        self.file.write('\n')
+        self.count += 1
+        if self.flush_every and self.count % self.flush_every == 0:
+            self.file.flush()
+
+    def write_all(self, items: Iterable):
+        for item in items:
+            self.write(item)
+
+    def flush(self):
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+    def __enter__(self) -> "NDJSONWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_ndjson(path: Union[str, Path], compress: Optional[bool] = None) -> Iterator[Dict]:
+    """Yield each record; a truncated last line (interrupted writer) is skipped"""
+    path = Path(path)
+    try:
+        with _open(path, 'r', compress) as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    if line.endswith('\n'):
+                        raise
+                    logger.warning(f"Skipping truncated record at {path}:{line_number}")
+    except EOFError:
+        # Compressed stream cut off mid-member
+        logger.warning(f"Compressed file {path} ends early; stopped reading")
+
+
+def load_records(path: Union[str, Path]) -> Iterator[Dict]:
+    """Records of an NDJSON file, or of a JSON array file"""
+    if is_ndjson(path):
+        return read_ndjson(path)
+    with open(path, 'r') as f:
+        return iter(json.load(f))
+
+
+def save_records(path: Union[str, Path], records: Iterable) -> int:
+    """Write records as NDJSON, or for other paths as a JSON array with one compact object per line
+
+    Records are encoded one at a time, so the whole file never exists as one string.
+    """
+    if is_ndjson(path):
+        with NDJSONWriter(path, append=False, flush_every=0) as writer:
+            writer.write_all(records)
+            return writer.count
+
+    count = 0
+    with open(path, 'w') as f:
+        f.write('[')
+        for record in records:
+            record = record.to_dict() if hasattr(record, 'to_dict') else record
+            f.write(',\n' if count else '\n')
+            f.write(json.dumps(record))
+            count += 1
+        f.write('\n]\n')
+    return count
@@ -9,13 +9,31 @@ Date: October 15, 2025
 import asyncio
 import json
 import logging
+import os
 import re
+import sys
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import partial
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse
 
-import requests
-from bs4 import BeautifulSoup
+import httpx
+
+from components.curation.keyword_matcher import KeywordMatcher
+from components.curation.loop_ids import make_loop_id
+
+from .enrichment import DetailEnricher
+from .frontier import CrawlFrontier
+from .html_parsers import FieldSpec, ParserBackend, RowSpec, Selector, get_parser_backend
+from .http_cache import HTTPCache
+from .http_engine import AsyncFetchEngine
+from .metrics import ScraperMetrics
+from .ndjson_io import NDJSONWriter, save_records
+from .politeness import PolitenessScheduler
+from .recrawl import RecrawlScheduler
 # Selenium imports (for Phase 4 - Desktop Observation)
 # from selenium import webdriver
 # from selenium.webdriver.chrome.options import Options
@@ -28,24 +46,36 @@ logger = logging.getLogger(__name__)
 class LoopDiscovery:
     """Data class for discovered loops"""
     
+    # No per-instance __dict__: runs hold hundreds of thousands of these
+    __slots__ = ('source_url', 'discovery_timestamp', 'source_type', 'content_type', 'raw_content', 'metadata')
+    
     def __init__(
         self,
         source_url: str,
         source_type: str,
         content_type: str,
         raw_content: str,
-        metadata: Dict
+        metadata: Dict,
+        discovery_timestamp: Optional[str] = None
     ):
         self.source_url = source_url
-        self.discovery_timestamp = datetime.utcnow().isoformat()
-        self.source_type = source_type
-        self.content_type = content_type
+        # Parsers pass one timestamp per page, shared by all of its items
+        self.discovery_timestamp = discovery_timestamp or datetime.utcnow().isoformat()
+        # A handful of distinct values: intern them so every item shares one string
+        self.source_type = sys.intern(source_type)
+        self.content_type = sys.intern(content_type)
         self.raw_content = raw_content
         self.metadata = metadata
     
+    @property
+    def loop_id(self) -> str:
+        """Stable ID carried through features and scores"""
+        return make_loop_id(self.source_type, self.source_url)
+    
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
         return {
+            "loop_id": self.loop_id,
             "source_url": self.source_url,
             "discovery_timestamp": self.discovery_timestamp,
             "source_type": self.source_type,
@@ -57,41 +87,254 @@ class LoopDiscovery:
     def to_json(self) -> str:
         """Convert to JSON string"""
         return json.dumps(self.to_dict(), indent=2)
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> "LoopDiscovery":
+        """Rebuild a discovery from to_dict() output, keeping its timestamp"""
+        return cls(
+            source_url=data["source_url"],
+            source_type=data["source_type"],
+            content_type=data["content_type"],
+            raw_content=data["raw_content"],
+            metadata=data["metadata"],
+            discovery_timestamp=data["discovery_timestamp"]
+        )
 
 
 class BaseScraperAgent:
     """Base class for all scraper agents"""
     
-    def __init__(self, name: str, target_urls: List[str], keywords: List[str]):
+    # Source key, as accepted by ScraperOrchestrator.create_agent
+    SOURCE: Optional[str] = None
+    
+    # Link to the next listing page, for cursor-paginated sources
+    NEXT_LINK: Optional[FieldSpec] = None
+    
+    def __init__(
+        self,
+        name: str,
+        target_urls: List[str],
+        keywords: List[str],
+        parser: Optional[ParserBackend] = None,
+        max_pages: int = 1,
+        max_items: Optional[int] = None
+    ):
         self.name = name
         self.target_urls = target_urls
         self.keywords = keywords
+        self.keyword_matcher = KeywordMatcher(keywords)
         self.discovered_loops = []
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (compatible; AGI-OS-Bot/1.0; +https://loopfactory.ai)'
-        })
+        self.parser = parser or get_parser_backend()
+        self.max_pages = max_pages
+        self.max_items = max_items
+        self.parse_executor: Optional[Executor] = None
+        # Last HTTP status per fetched URL (0 for network errors)
+        self.page_status: Dict[str, int] = {}
+        # Shared with the orchestrator's registry when run by one
+        self.metrics = ScraperMetrics()
+        # Keyword checks / matches made by the current parse
+        self.keyword_checks = 0
+        self.keyword_matches = 0
+    
+    def __getstate__(self) -> Dict:
+        # Agents are shipped to parse workers: send config only, not results
+        state = self.__dict__.copy()
+        state['parser'] = self.parser.name
+        state['discovered_loops'] = []
+        state['parse_executor'] = None
+        state['page_status'] = {}
+        state['metrics'] = None
+        return state
+    
+    def __setstate__(self, state: Dict):
+        state['parser'] = get_parser_backend(state['parser'])
+        self.__dict__.update(state)
+    
+    @property
+    def mode(self) -> str:
+        """Ingestion mode, as accepted by ScraperOrchestrator.create_agent"""
+        return 'html'
     
     def matches_keywords(self, text: str) -> bool:
         """Check if text contains any of the target keywords"""
-        text_lower = text.lower()
-        return any(keyword.lower() in text_lower for keyword in self.keywords)
+        matched = self.keyword_matcher.search(text)
+        self.keyword_checks += 1
+        self.keyword_matches += matched
+        return matched
+    
+    def extract_code_blocks(self, content: Union[bytes, str]) -> List[str]:
+        """Extract code blocks (<pre> and <code> tags) from HTML"""
+        return self.parser.extract_code_blocks(content, min_length=50)
+    
+    def parse_page(self, url: str, content: bytes) -> List[LoopDiscovery]:
+        """Parse one fetched page - to be implemented by subclasses"""
+        raise NotImplementedError("Subclasses must implement parse_page()")
+    
+    def parse(self, url: str, content: bytes) -> Tuple[List[LoopDiscovery], Optional[str]]:
+        """Pure parse phase: a page's discoveries and its next-page link"""
+        return self.parse_page(url, content), self.next_page_url(url, content)
+    
+    def parse_counted(self, url: str, content: bytes) -> Tuple[List[LoopDiscovery], Optional[str], int, int]:
+        """parse() plus its keyword checks and matches, returned so they survive a parse worker"""
+        self.keyword_checks = self.keyword_matches = 0
+        discoveries, next_url = self.parse(url, content)
+        return discoveries, next_url, self.keyword_checks, self.keyword_matches
+    
+    async def run_parse(self, url: str, content: bytes) -> Tuple[List[LoopDiscovery], Optional[str]]:
+        """Run the parse phase, in the parse executor when one is attached"""
+        start = time.perf_counter()
+        if self.parse_executor is None:
+            discoveries, next_url, checked, matched = self.parse_counted(url, content)
+        else:
+            loop = asyncio.get_running_loop()
+            discoveries, next_url, checked, matched = await loop.run_in_executor(
+                self.parse_executor, self.parse_counted, url, content
+            )
+        self.metrics.observe_parse(self.name, time.perf_counter() - start, len(discoveries), checked, matched)
+        return discoveries, next_url
+    
+    def next_page_url(self, url: str, content: bytes) -> Optional[str]:
+        """Find the next listing page by following NEXT_LINK"""
+        if self.NEXT_LINK is None:
+            return None
+        href = self.parser.extract_first(content, self.NEXT_LINK)
+        return urljoin(url, href) if href else None
+    
+    def page_urls(self, url: str) -> List[str]:
+        """Further page URLs known up front (numbered pagination); fetched concurrently"""
+        return []
+    
+    async def fetch_page(self, engine: AsyncFetchEngine, url: str) -> Optional[bytes]:
+        """Fetch a page body; None if it failed or is unchanged since last run"""
+        start = time.perf_counter()
+        try:
+            with self.metrics.in_flight.labels(self.name).track_inprogress():
+                response = await engine.fetch(url)
+            self.metrics.observe_fetch(self.name, time.perf_counter() - start, response.status_code, len(response.content))
+            self.page_status[url] = response.status_code
+            if response.status_code == 304:
+                logger.info(f"[{self.name}] Unchanged since last run: {url}")
+                return None
+            response.raise_for_status()
+            return response.content
+        
+        except Exception as e:
+            self.page_status.setdefault(url, 0)
+            self.metrics.record_error(self.name, 'http' if isinstance(e, httpx.HTTPStatusError) else 'fetch')
+            logger.error(f"[{self.name}] Error scraping {url}: {e}")
+            return None
+    
+    async def scrape_url(self, engine: AsyncFetchEngine, url: str) -> List[LoopDiscovery]:
+        """Fetch and parse a single page"""
+        content = await self.fetch_page(engine, url)
+        if content is None:
+            return []
+        
+        try:
+            discoveries, _ = await self.run_parse(url, content)
+            return discoveries
+        except Exception as e:
+            self.metrics.record_error(self.name, 'parse')
+            logger.error(f"[{self.name}] Error parsing {url}: {e}")
+            return []
     
-    def extract_code_blocks(self, soup: BeautifulSoup) -> List[str]:
-        """Extract code blocks from HTML"""
-        code_blocks = []
+    async def crawl_source(
+        self,
+        engine: AsyncFetchEngine,
+        url: str,
+        pages: Optional[List[str]] = None
+    ) -> AsyncIterator[List[LoopDiscovery]]:
+        """Yield each page's discoveries as it arrives, up to max_pages and max_items
+
+        Every page URL requested is appended to `pages`, if given.
+        """
+        remaining = self.max_items
+        if pages is None:
+            pages = []
+        
+        def take(discoveries: List[LoopDiscovery]) -> List[LoopDiscovery]:
+            nonlocal remaining
+            if remaining is None:
+                return discoveries
+            discoveries = discoveries[:remaining]
+            remaining -= len(discoveries)
+            return discoveries
+        
+        # Numbered pages: fetch them all at once and emit in arrival order
+        numbered = self.page_urls(url)[:self.max_pages - 1]
+        if numbered:
+            pages.extend([url] + numbered)
+            tasks = [asyncio.ensure_future(self.scrape_url(engine, u)) for u in [url] + numbered]
+            try:
+                for next_page in asyncio.as_completed(tasks):
+                    discoveries = take(await next_page)
+                    if discoveries:
+                        yield discoveries
+                    if remaining == 0:
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+            return
+        
+        # Cursor pages: each page holds the link to the next one
+        page_url = url
+        for depth in range(self.max_pages):
+            pages.append(page_url)
+            content = await self.fetch_page(engine, page_url)
+            if content is None:
+                break
+            
+            try:
+                discoveries, next_url = await self.run_parse(page_url, content)
+                discoveries = take(discoveries)
+            except Exception as e:
+                self.metrics.record_error(self.name, 'parse')
+                logger.error(f"[{self.name}] Error parsing {page_url}: {e}")
+                break
+            
+            if discoveries:
+                yield discoveries
+            if remaining == 0 or not next_url:
+                break
+            page_url = next_url
+    
+    async def crawl_source_all(
+        self,
+        engine: AsyncFetchEngine,
+        url: str,
+        pages: Optional[List[str]] = None
+    ) -> List[LoopDiscovery]:
+        """Collect every page of one source"""
+        discoveries = []
+        async for page in self.crawl_source(engine, url, pages):
+            discoveries.extend(page)
+        return discoveries
+    
+    async def scrape_async(
+        self,
+        engine: Optional[AsyncFetchEngine] = None,
+        urls: Optional[List[str]] = None
+    ) -> List[LoopDiscovery]:
+        """Fetch target URLs (all of them by default) concurrently over a shared connection pool"""
+        if engine is None:
+            async with AsyncFetchEngine() as own_engine:
+                return await self.scrape_async(own_engine, urls)
+        
+        logger.info(f"[{self.name}] Starting scraping cycle...")
         
-        # Find <pre> and <code> tags
-        for tag in soup.find_all(['pre', 'code']):
-            code = tag.get_text(strip=True)
-            if code and len(code) > 50:  # Minimum length filter
-                code_blocks.append(code)
+        results = await asyncio.gather(
+            *(self.crawl_source_all(engine, url) for url in (self.target_urls if urls is None else urls))
+        )
+        for discoveries in results:
+            self.discovered_loops.extend(discoveries)
         
-        return code_blocks
+        logger.info(f"[{self.name}] Scraping complete. Discovered {len(self.discovered_loops)} loops.")
+        return self.discovered_loops
     
     def scrape(self) -> List[LoopDiscovery]:
-        """Main scraping method - to be implemented by subclasses"""
-        raise NotImplementedError("Subclasses must implement scrape()")
+        """Main scraping method (blocking wrapper around scrape_async)"""
+        return asyncio.run(self.scrape_async())
 
 
 class GitHubScraperAgent(BaseScraperAgent):
@@ -108,73 +351,69 @@ class GitHubScraperAgent(BaseScraperAgent):
             keywords=[
                 "automation", "script", "bot", "workflow", "task",
                 "automate", "scheduler", "scraper", "api wrapper"
-            ]
+            ],
+            max_pages=3,
+            max_items=100
         )
     
-    def scrape(self) -> List[LoopDiscovery]:
-        """Scrape GitHub trending for automation-related repositories"""
-        logger.info(f"[{self.name}] Starting scraping cycle...")
+    SOURCE = 'github'
+    NEXT_LINK = FieldSpec((Selector('a', 'next_page'),), attr='href')
+    
+    ROW_SPEC = RowSpec(
+        row=Selector('article', 'Box-row'),
+        fields=(
+            ('title', FieldSpec((Selector('h2', 'h3'), Selector('a')))),
+            ('href', FieldSpec((Selector('h2', 'h3'), Selector('a')), attr='href')),
+            ('description', FieldSpec((Selector('p', 'col-9'),))),
+            ('stars', FieldSpec((Selector('span', 'd-inline-block float-sm-right'),)))
+        )
+    )
+    
+    def parse_page(self, url: str, content: bytes) -> List[LoopDiscovery]:
+        """Parse a GitHub trending page for automation-related repositories"""
+        discoveries = []
+        
+        # Find repository articles
+        repos = self.parser.extract_rows(content, self.ROW_SPEC)
+        timestamp = datetime.utcnow().isoformat()
         
-        for url in self.target_urls:
+        for repo in repos:
             try:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
+                # Extract repository information
+                repo_name = repo['title']
+                if repo_name is None or not repo['href']:
+                    continue
                 
-                # Find repository articles
-                repos = soup.find_all('article', class_='Box-row')
+                repo_url = urljoin("https://github.com", repo['href'])
+                description = repo['description'] or ""
                 
-                for repo in repos:
-                    try:
-                        # Extract repository information
-                        title_elem = repo.find('h2', class_='h3')
-                        if not title_elem:
-                            continue
-                        
-                        repo_link = title_elem.find('a')
-                        if not repo_link:
-                            continue
-                        
-                        repo_name = repo_link.get_text(strip=True)
-                        repo_url = urljoin("https://github.com", repo_link['href'])
-                        
-                        # Extract description
-                        desc_elem = repo.find('p', class_='col-9')
-                        description = desc_elem.get_text(strip=True) if desc_elem else ""
-                        
-                        # Check if matches keywords
-                        if self.matches_keywords(f"{repo_name} {description}"):
-                            # Extract stars
-                            stars_elem = repo.find('span', class_='d-inline-block float-sm-right')
-                            stars = stars_elem.get_text(strip=True) if stars_elem else "0"
-                            
-                            # Create discovery object
-                            discovery = LoopDiscovery(
-                                source_url=repo_url,
-                                source_type="github",
-                                content_type="text_description",
-                                raw_content=description,
-                                metadata={
-                                    "title": repo_name,
-                                    "author": repo_url.split('/')[3],
-                                    "stars": stars,
-                                    "language": "python"
-                                }
-                            )
-                            
-                            self.discovered_loops.append(discovery)
-                            logger.info(f"[{self.name}] Discovered: {repo_name}")
+                # Check if matches keywords
+                if self.matches_keywords(f"{repo_name} {description}"):
+                    stars = repo['stars'] if repo['stars'] is not None else "0"
                     
-                    except Exception as e:
-                        logger.error(f"[{self.name}] Error processing repo: {e}")
-                        continue
+                    # Create discovery object
+                    discovery = LoopDiscovery(
+                        source_url=repo_url,
+                        source_type="github",
+                        content_type="text_description",
+                        raw_content=description,
+                        metadata={
+                            "title": repo_name,
+                            "author": repo_url.split('/')[3],
+                            "stars": stars,
+                            "language": "python"
+                        },
+                        discovery_timestamp=timestamp
+                    )
+                    
+                    discoveries.append(discovery)
+                    logger.info(f"[{self.name}] Discovered: {repo_name}")
             
             except Exception as e:
-                logger.error(f"[{self.name}] Error scraping {url}: {e}")
+                logger.error(f"[{self.name}] Error processing repo: {e}")
                 continue
         
-        logger.info(f"[{self.name}] Scraping complete. Discovered {len(self.discovered_loops)} loops.")
-        return self.discovered_loops
+        return discoveries
 
 
 class RedditScraperAgent(BaseScraperAgent):
@@ -192,118 +431,356 @@ class RedditScraperAgent(BaseScraperAgent):
             keywords=[
                 "script", "automation", "automate", "bot", "workflow",
                 "how to", "tutorial", "code", "python"
-            ]
+            ],
+            max_pages=4,
+            max_items=100
         )
     
-    def scrape(self) -> List[LoopDiscovery]:
-        """Scrape Reddit for automation discussions and code snippets"""
-        logger.info(f"[{self.name}] Starting scraping cycle...")
+    SOURCE = 'reddit'
+    NEXT_LINK = FieldSpec((Selector('span', 'next-button'), Selector('a')), attr='href')
+    
+    ROW_SPEC = RowSpec(
+        row=Selector('div', 'thing'),
+        fields=(
+            ('title', FieldSpec((Selector('a', 'title'),))),
+            ('href', FieldSpec((Selector('a', 'title'),), attr='href')),
+            ('upvotes', FieldSpec((Selector('div', 'score'),))),
+            ('author', FieldSpec((Selector('a', 'author'),))),
+            ('subreddit', FieldSpec((Selector('a', 'subreddit'),)))
+        )
+    )
+    
+    def parse_page(self, url: str, content: bytes) -> List[LoopDiscovery]:
+        """Parse a Reddit listing for automation discussions and code snippets"""
+        discoveries = []
         
-        for url in self.target_urls:
+        # Find posts (limit to top 25 posts)
+        posts = self.parser.extract_rows(content, self.ROW_SPEC, limit=25)
+        timestamp = datetime.utcnow().isoformat()
+        
+        for post in posts:
             try:
-                response = self.session.get(url, timeout=10)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
+                # Extract post information
+                title = post['title']
+                if title is None:
+                    continue
+                
+                post_url = post['href'] or ''
                 
-                # Find posts
-                posts = soup.find_all('div', class_='thing')
+                # Make URL absolute
+                if post_url.startswith('/r/'):
+                    post_url = f"https://old.reddit.com{post_url}"
                 
-                for post in posts[:25]:  # Limit to top 25 posts
-                    try:
-                        # Extract post information
-                        title_elem = post.find('a', class_='title')
-                        if not title_elem:
-                            continue
-                        
-                        title = title_elem.get_text(strip=True)
-                        post_url = title_elem.get('href', '')
-                        
-                        # Make URL absolute
-                        if post_url.startswith('/r/'):
-                            post_url = f"https://old.reddit.com{post_url}"
-                        
-                        # Check if matches keywords
-                        if self.matches_keywords(title):
-                            # Extract upvotes
-                            score_elem = post.find('div', class_='score')
-                            upvotes = score_elem.get_text(strip=True) if score_elem else "0"
-                            
-                            # Extract author
-                            author_elem = post.find('a', class_='author')
-                            author = author_elem.get_text(strip=True) if author_elem else "unknown"
-                            
-                            # Extract subreddit
-                            subreddit_elem = post.find('a', class_='subreddit')
-                            subreddit = subreddit_elem.get_text(strip=True) if subreddit_elem else ""
-                            
-                            # Create discovery object
-                            discovery = LoopDiscovery(
-                                source_url=post_url,
-                                source_type="reddit",
-                                content_type="text_description",
-                                raw_content=title,
-                                metadata={
-                                    "title": title,
-                                    "author": author,
-                                    "upvotes": upvotes,
-                                    "subreddit": subreddit
-                                }
-                            )
-                            
-                            self.discovered_loops.append(discovery)
-                            logger.info(f"[{self.name}] Discovered: {title[:50]}...")
+                # Check if matches keywords
+                if self.matches_keywords(title):
+                    upvotes = post['upvotes'] if post['upvotes'] is not None else "0"
+                    author = post['author'] if post['author'] is not None else "unknown"
+                    subreddit = post['subreddit'] if post['subreddit'] is not None else ""
                     
-                    except Exception as e:
-                        logger.error(f"[{self.name}] Error processing post: {e}")
-                        continue
+                    # Create discovery object
+                    discovery = LoopDiscovery(
+                        source_url=post_url,
+                        source_type="reddit",
+                        content_type="text_description",
+                        raw_content=title,
+                        metadata={
+                            "title": title,
+                            "author": author,
+                            "upvotes": upvotes,
+                            "subreddit": subreddit
+                        },
+                        discovery_timestamp=timestamp
+                    )
+                    
+                    discoveries.append(discovery)
+                    logger.info(f"[{self.name}] Discovered: {title[:50]}...")
             
             except Exception as e:
-                logger.error(f"[{self.name}] Error scraping {url}: {e}")
+                logger.error(f"[{self.name}] Error processing post: {e}")
                 continue
         
-        logger.info(f"[{self.name}] Scraping complete. Discovered {len(self.discovered_loops)} loops.")
-        return self.discovered_loops
+        return discoveries
 
 
 class ScraperOrchestrator:
     """Orchestrates multiple scraper agents"""
     
-    def __init__(self):
-        self.agents = [
-            GitHubScraperAgent(),
-            RedditScraperAgent()
-        ]
+    # Ingestion mode per source: 'html' scrapes listing pages, 'json' / 'rss' read feeds
+    SOURCE_MODES = {
+        'github': 'html',
+        'reddit': 'html'
+    }
+    
+    def __init__(
+        self,
+        max_connections: int = 20,
+        max_per_host: int = 4,
+        cache_path: Optional[str] = None,
+        frontier_dir: Optional[str] = None,
+        parse_workers: Optional[int] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        enricher: Optional[DetailEnricher] = None,
+        source_modes: Optional[Dict[str, str]] = None,
+        recrawl: Optional[RecrawlScheduler] = None,
+        request_budget: Optional[int] = None,
+        sink: Optional[NDJSONWriter] = None,
+        metrics: Optional[ScraperMetrics] = None,
+        metrics_path: Optional[str] = None
+    ):
+        self.source_modes = {**self.SOURCE_MODES, **(source_modes or {})}
+        self.agents = [self.create_agent(source, mode) for source, mode in self.source_modes.items()]
+        # One registry for every agent; dumped to metrics_path (Prometheus text format) after each run
+        self.metrics = metrics or ScraperMetrics()
+        self.metrics_path = metrics_path
+        for agent in self.agents:
+            agent.metrics = self.metrics
         self.all_discoveries = []
+        self.max_connections = max_connections
+        self.max_per_host = max_per_host
+        self.cache = HTTPCache(cache_path) if cache_path else None
+        self.scheduler = PolitenessScheduler()
+        self.frontier = CrawlFrontier(frontier_dir) if frontier_dir else None
+        # Parse processes (one per core by default); 0 parses inline on the event loop
+        self.parse_workers = (os.cpu_count() or 1) if parse_workers is None else parse_workers
+        # Custom HTTP transport, e.g. a fixture ReplayTransport for offline runs
+        self.transport = transport
+        # Optional detail-page enrichment (README / post body) of new discoveries
+        self.enricher = enricher
+        # Optional change-rate scheduling: only due target URLs are crawled,
+        # at most request_budget of them per run
+        self.recrawl = recrawl
+        self.request_budget = request_budget
+        # Optional append-only NDJSON log that new discoveries are written to as they are produced
+        self.sink = sink
+    
+    @staticmethod
+    def create_agent(source: str, mode: str) -> BaseScraperAgent:
+        """Build the agent for a source in the given ingestion mode"""
+        from .feed_scraper import RedditFeedAgent
+        
+        if source == 'github' and mode == 'html':
+            return GitHubScraperAgent()
+        if source == 'reddit' and mode == 'html':
+            return RedditScraperAgent()
+        if source == 'reddit' and mode in RedditFeedAgent.FORMATS:
+            return RedditFeedAgent(format=mode)
+        raise ValueError(f"Unsupported mode {mode!r} for source {source!r}")
+    
+    def create_engine(self) -> AsyncFetchEngine:
+        """Create the fetch engine shared by all agents for one run"""
+        return AsyncFetchEngine(
+            max_connections=self.max_connections,
+            max_per_host=self.max_per_host,
+            cache=self.cache,
+            scheduler=self.scheduler,
+            transport=self.transport
+        )
+    
+    @asynccontextmanager
+    async def parse_pool(self):
+        """Attach a process pool for the CPU-bound parse phase to every agent"""
+        if self.parse_workers <= 0:
+            yield None
+            return
+        
+        pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+        for agent in self.agents:
+            agent.parse_executor = pool
+        if self.enricher is not None:
+            self.enricher.parse_executor = pool
+        try:
+            yield pool
+        finally:
+            for agent in self.agents:
+                agent.parse_executor = None
+            if self.enricher is not None:
+                self.enricher.parse_executor = None
+            # Waiting for the workers to exit must not stall the other coroutines on this loop
+            await asyncio.get_running_loop().run_in_executor(None, partial(pool.shutdown, cancel_futures=True))
+    
+    def commit_frontier(self):
+        """Persist the URLs handed downstream since the last commit; call once they are safely processed"""
+        if self.frontier is not None:
+            self.frontier.commit()
+    
+    def rollback_frontier(self):
+        """Let the next run rediscover the URLs handed downstream since the last commit"""
+        if self.frontier is not None:
+            self.frontier.rollback()
+    
+    def begin_run(self):
+        """Start a run's metrics; agents added after construction share the registry too"""
+        for agent in self.agents:
+            agent.metrics = self.metrics
+        self.metrics.begin_run()
     
-    async def run_agent(self, agent: BaseScraperAgent) -> List[LoopDiscovery]:
+    def end_run(self):
+        """Dump the metrics file, when one is configured"""
+        if self.metrics_path is not None:
+            self.metrics.write_textfile(self.metrics_path)
+    
+    def run_summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-agent fetch, parse and yield figures for the last run"""
+        return self.metrics.run_summary()
+    
+    def due_sources(self) -> Dict[BaseScraperAgent, List[str]]:
+        """Target URLs to crawl this run, per agent"""
+        if self.recrawl is None:
+            return {agent: agent.target_urls for agent in self.agents}
+        
+        due = set(self.recrawl.due(
+            [url for agent in self.agents for url in agent.target_urls],
+            budget=self.request_budget
+        ))
+        sources = {agent: [url for url in agent.target_urls if url in due] for agent in self.agents}
+        return {agent: urls for agent, urls in sources.items() if urls}
+    
+    def record_crawl(self, url: str, status: int, items: List[str]):
+        """Tell the recrawl scheduler whether a target URL's listing changed"""
+        if status == 304:
+            self.recrawl.record(url, None)
+        elif 200 <= status < 300:
+            self.recrawl.record(url, self.recrawl.fingerprint(items))
+        else:
+            self.recrawl.record_failure(url)
+    
+    async def crawl_target(self, agent: BaseScraperAgent, engine: AsyncFetchEngine, url: str) -> List[LoopDiscovery]:
+        """Crawl one target URL and record the outcome with the recrawl scheduler"""
+        discoveries = await agent.crawl_source_all(engine, url)
+        self.record_crawl(url, agent.page_status.pop(url, 0), [d.source_url for d in discoveries])
+        return discoveries
+    
+    async def run_agent(
+        self,
+        agent: BaseScraperAgent,
+        engine: Optional[AsyncFetchEngine] = None,
+        urls: Optional[List[str]] = None
+    ) -> List[LoopDiscovery]:
         """Run a single agent asynchronously"""
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, agent.scrape)
+        if self.recrawl is None:
+            return await agent.scrape_async(engine, urls)
+        if engine is None:
+            async with self.create_engine() as own_engine:
+                return await self.run_agent(agent, own_engine, urls)
+        
+        results = await asyncio.gather(
+            *(self.crawl_target(agent, engine, url) for url in (agent.target_urls if urls is None else urls))
+        )
+        return [discovery for discoveries in results for discovery in discoveries]
     
     async def run_all_agents(self) -> List[LoopDiscovery]:
         """Run all agents in parallel"""
         logger.info("Starting scraper orchestrator...")
+        self.begin_run()
         
-        tasks = [self.run_agent(agent) for agent in self.agents]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        async with self.parse_pool():
+            async with self.create_engine() as engine:
+                sources = self.due_sources()
+                tasks = [self.run_agent(agent, engine, urls) for agent, urls in sources.items()]
+                results = await asyncio.gather(*tasks, return_exceptions=True)
+                
+                new_discoveries = []
+                for agent, result in zip(sources, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"Agent failed with error: {result}")
+                        continue
+                    if self.frontier is not None:
+                        result = self.frontier.filter_new(result)
+                    self.metrics.new_discoveries.labels(agent.name).inc(len(result))
+                    new_discoveries.extend(result)
+                
+                if self.enricher is not None:
+                    await self.enricher.enrich_all(engine, new_discoveries)
+                if self.sink is not None:
+                    self.sink.write_all(new_discoveries)
+                self.all_discoveries.extend(new_discoveries)
         
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Agent failed with error: {result}")
-            else:
-                self.all_discoveries.extend(result)
+        for agent in self.agents:
+            agent.page_status.clear()
+        self.end_run()
         
         logger.info(f"All agents complete. Total discoveries: {len(self.all_discoveries)}")
         return self.all_discoveries
     
+    async def crawl_forever(
+        self,
+        max_sleep: float = 600.0,
+        cycles: Optional[int] = None,
+        crawl: Optional[Callable[[], Awaitable[List[LoopDiscovery]]]] = None
+    ) -> AsyncIterator[List[LoopDiscovery]]:
+        """Daemon loop: crawl whatever is due, yield each cycle's new discoveries,
+        then sleep until the next target URL falls due
+
+        Each cycle runs `crawl` (run_all_agents by default; e.g. a distributed run).
+        """
+        if self.recrawl is None:
+            raise ValueError("crawl_forever needs a RecrawlScheduler")
+        crawl = crawl or self.run_all_agents
+        
+        cycle = 0
+        while True:
+            self.all_discoveries = []
+            yield await crawl()
+            cycle += 1
+            if cycles is not None and cycle >= cycles:
+                break
+            
+            urls = [url for agent in self.agents for url in agent.target_urls]
+            delay = min(max(self.recrawl.seconds_until_due(urls), 1.0), max_sleep)
+            logger.info(f"Next recrawl in {delay:.0f}s")
+            await asyncio.sleep(delay)
+    
+    async def stream_discoveries(self, queue_size: int = 100) -> AsyncIterator[LoopDiscovery]:
+        """Yield discoveries as soon as each page is parsed"""
+        logger.info("Starting scraper orchestrator (streaming)...")
+        queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        done = object()
+        self.begin_run()
+        
+        async with self.parse_pool():
+            async with self.create_engine() as engine:
+                async def produce(agent: BaseScraperAgent, url: str):
+                    items = []
+                    async for page in agent.crawl_source(engine, url):
+                        items.extend(d.source_url for d in page)
+                        # Skip URLs already handed downstream in this or earlier runs
+                        new = [
+                            d for d in page
+                            if self.frontier is None or self.frontier.check_and_add(d.source_url)
+                        ]
+                        self.metrics.new_discoveries.labels(agent.name).inc(len(new))
+                        if self.enricher is not None:
+                            await self.enricher.enrich_all(engine, new)
+                        for discovery in new:
+                            if self.sink is not None:
+                                self.sink.write(discovery)
+                            await queue.put(discovery)
+                    if self.recrawl is not None:
+                        self.record_crawl(url, agent.page_status.pop(url, 0), items)
+                
+                async def produce_all():
+                    await asyncio.gather(
+                        *(produce(agent, url) for agent, urls in self.due_sources().items() for url in urls)
+                    )
+                    await queue.put(done)
+                
+                producer = asyncio.create_task(produce_all())
+                try:
+                    while True:
+                        item = await queue.get()
+                        if item is done:
+                            break
+                        yield item
+                finally:
+                    producer.cancel()
+                    await asyncio.gather(producer, return_exceptions=True)
+                    for agent in self.agents:
+                        agent.page_status.clear()
+                    self.end_run()
+    
     def save_discoveries(self, filepath: str = "discoveries.json"):
-        """Save all discoveries to a JSON file"""
-        with open(filepath, 'w') as f:
-            json.dump(
-                [d.to_dict() for d in self.all_discoveries],
-                f,
-                indent=2
-            )
+        """Save all discoveries to a JSON array file, or NDJSON for .ndjson/.jsonl(.gz) paths"""
+        save_records(filepath, self.all_discoveries)
         logger.info(f"Discoveries saved to {filepath}")
 
 
@@ -8,10 +8,16 @@ Date: October 17, 2025
 
 import json
 import os
+import sys
+from pathlib import Path
 from supabase import create_client, Client
 from datetime import datetime
 from typing import List, Dict
 
+# Scores store reason codes; the scorer renders them as text
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from components.curation.quality_scorer import QualityScore
+
 # Supabase credentials (will be set from environment)
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
@@ -20,6 +26,7 @@ SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 DATA_DIR = "/home/ubuntu/loopfactory-agi-os/data"
 DISCOVERIES_FILE = f"{DATA_DIR}/discoveries.json"
 FEATURES_FILE = f"{DATA_DIR}/extracted_features.json"
+FEATURES_PARQUET = f"{DATA_DIR}/extracted_features.parquet"
 SCORES_FILE = f"{DATA_DIR}/quality_scores.json"
 
 
@@ -33,6 +40,20 @@ def load_json(filepath: str) -> List[Dict]:
         return json.load(f)
 
 
+def render_reasoning(score: Dict) -> List[str]:
+    """Human-readable reasoning of a score (older score files store it as text already)"""
+    if score.get("reasoning"):
+        return score["reasoning"]
+    return QualityScore.from_dict(score).explain()
+
+
+def load_parquet(filepath: str) -> List[Dict]:
+    """Load rows of a Parquet file (the pipeline's columnar feature store)"""
+    import pyarrow.parquet as pq
+    
+    return pq.read_table(filepath).to_pylist()
+
+
 def migrate_discoveries(supabase: Client, discoveries: List[Dict]):
     """Migrate discoveries to loops table"""
     print(f"\nMigrating {len(discoveries)} discoveries to loops table...")
@@ -73,7 +94,7 @@ def migrate_features(supabase: Client, features: List[Dict]):
     for i, feature in enumerate(features):
         try:
             # Find corresponding loop_id
-            # Features have loop_id like "github_75149" which is a hash of the URL
+            # Features have loop_id like "github_3f1c9a0b2d4e6f8a1c3e", a digest of the URL
             # We need to match it back to the actual loop
             loop_id_str = feature["loop_id"]
             source_url = feature["source_url"]
@@ -91,6 +112,10 @@ def migrate_features(supabase: Client, features: List[Dict]):
                 "code_language": feature.get("code_language"),
                 "code_complexity": feature.get("code_complexity", 0.0),
                 "code_lines": feature.get("code_lines", 0),
+                "code_cyclomatic": feature.get("code_cyclomatic", 0),
+                "code_max_depth": feature.get("code_max_depth", 0),
+                "code_calls": feature.get("code_calls", 0),
+                "code_imports": feature.get("code_imports", []),
                 "title_length": feature.get("title_length", 0),
                 "description_length": feature.get("description_length", 0),
                 "has_tutorial": feature.get("has_tutorial", False),
@@ -155,7 +180,7 @@ def migrate_scores(supabase: Client, scores: List[Dict]):
                 "overall_score": score.get("overall_score", 0.0),
                 "approval_decision": score.get("approval_decision", "needs_review"),
                 "confidence": score.get("confidence", 0.0),
-                "reasoning": score.get("reasoning", [])
+                "reasoning": render_reasoning(score)
             }
             
             # Insert into Supabase
@@ -193,7 +218,7 @@ def main():
     # Load JSON data
     print(f"\nLoading JSON data from {DATA_DIR}...")
     discoveries = load_json(DISCOVERIES_FILE)
-    features = load_json(FEATURES_FILE)
+    features = load_parquet(FEATURES_PARQUET) if os.path.exists(FEATURES_PARQUET) else load_json(FEATURES_FILE)
     scores = load_json(SCORES_FILE)
     
     print(f"  Loaded {len(discoveries)} discoveries")
@@ -34,6 +34,10 @@ CREATE TABLE features (
     code_language TEXT,
     code_complexity REAL DEFAULT 0.0,
     code_lines INTEGER DEFAULT 0,
+    code_cyclomatic INTEGER DEFAULT 0,
+    code_max_depth INTEGER DEFAULT 0,
+    code_calls INTEGER DEFAULT 0,
+    code_imports TEXT[] DEFAULT '{}',
     title_length INTEGER DEFAULT 0,
     description_length INTEGER DEFAULT 0,
     has_tutorial BOOLEAN DEFAULT FALSE,
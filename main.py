@@ -9,13 +9,24 @@ Date: October 17, 2025
 import asyncio
 import json
 import logging
+import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Optional
 
 # Import components
 from components.discovery.web_scraper import ScraperOrchestrator
+from components.discovery.enrichment import DetailEnricher
+from components.discovery.recrawl import RecrawlScheduler
+from components.discovery.distributed import Broker, CrawlWorker, InMemoryBroker, broker_from_url, run_distributed
+from components.discovery.ndjson_io import NDJSONWriter, save_records
+from components.curation.feature_cache import FeatureCache
 from components.curation.feature_extractor import FeatureExtractor
-from components.curation.quality_scorer import HeuristicQualityScorer
+from components.curation.feature_store import HAS_PYARROW, FeatureStoreWriter, is_parquet, load_features
+from components.curation.loop_ids import loop_id_of
+from components.curation.quality_scorer import DECISIONS, HeuristicQualityScorer
+from components.curation.rescoring import ScoreState, rescore
+from components.curation.redundancy_detector import RedundancyDetector
 
 # Configure logging
 logging.basicConfig(
@@ -25,32 +36,97 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class JSONArraySink:
+    """Writes a JSON array one element at a time instead of all at once"""
+    
+    def __init__(self, filepath: Path):
+        self.file = open(filepath, 'w')
+        self.file.write('[')
+        self.count = 0
+    
+    def write(self, item: dict):
+        self.file.write(',\n' if self.count else '\n')
+        json.dump(item, self.file)
+        self.count += 1
+    
+    def close(self):
+        self.file.write('\n]\n')
+        self.file.close()
+
+
 class AGIOSPipeline:
     """Main pipeline orchestrator for AGI OS"""
     
-    def __init__(self, data_dir: str = "/home/ubuntu/loopfactory-agi-os/data"):
+    def __init__(
+        self,
+        data_dir: str = "/home/ubuntu/loopfactory-agi-os/data",
+        broker: Optional[Broker] = None,
+        crawl_timeout: float = 1800.0
+    ):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
+        # With a broker, crawl jobs are handed to distributed workers
+        self.broker = broker
+        # Seconds to wait for distributed crawl jobs before carrying on without them
+        self.crawl_timeout = crawl_timeout
         
         # Initialize components
-        self.scraper = ScraperOrchestrator()
-        self.feature_extractor = FeatureExtractor()
+        self.scraper = ScraperOrchestrator(
+            cache_path=str(self.data_dir / "http_cache.db"),
+            frontier_dir=str(self.data_dir / "frontier"),
+            enricher=DetailEnricher(cache_path=str(self.data_dir / "enrichment_cache.db")),
+            recrawl=RecrawlScheduler(str(self.data_dir / "recrawl.db")),
+            metrics_path=str(self.data_dir / "scraper_metrics.prom")
+        )
+        self.redundancy_detector = RedundancyDetector(str(self.data_dir / "redundancy_index.db"))
+        self.feature_extractor = FeatureExtractor(cache=FeatureCache(str(self.data_dir / "feature_cache.db")))
         self.quality_scorer = HeuristicQualityScorer()
         
         # File paths
         self.discoveries_file = self.data_dir / "discoveries.json"
-        self.features_file = self.data_dir / "extracted_features.json"
+        self.discoveries_log = self.data_dir / "discoveries.ndjson.gz"
+        # Columnar (Parquet) when pyarrow is installed
+        self.features_file = self.data_dir / ("extracted_features.parquet" if HAS_PYARROW else "extracted_features.json")
         self.scores_file = self.data_dir / "quality_scores.json"
+        self.score_state_file = self.data_dir / "score_components.npz"
+        self.rescore_report_file = self.data_dir / "rescore_report.json"
         self.approved_file = self.data_dir / "approved_loops.json"
+        self.duplicates_file = self.data_dir / "duplicate_loops.json"
         self.pipeline_stats_file = self.data_dir / "pipeline_stats.json"
     
+    def create_local_worker(self) -> CrawlWorker:
+        """Crawl worker for an in-process broker, sharing the scraper's transport, politeness and metrics"""
+        worker = CrawlWorker(
+            self.broker,
+            max_connections=self.scraper.max_connections,
+            max_per_host=self.scraper.max_per_host,
+            transport=self.scraper.transport,
+            metrics=self.scraper.metrics
+        )
+        worker.scheduler = self.scraper.scheduler
+        return worker
+    
+    async def crawl(self) -> list:
+        """One crawl of every due source: locally, or through the broker's workers"""
+        if self.broker is None:
+            return await self.scraper.run_all_agents()
+        if not isinstance(self.broker, InMemoryBroker):
+            return await run_distributed(self.scraper, self.broker, timeout=self.crawl_timeout)
+        
+        # No other process can reach an in-process broker, so its worker runs here
+        worker = asyncio.ensure_future(self.create_local_worker().run())
+        try:
+            return await run_distributed(self.scraper, self.broker, timeout=self.crawl_timeout)
+        finally:
+            worker.cancel()
+    
     async def run_discovery(self) -> int:
         """Step 1: Run web scraping to discover loops"""
         logger.info("="*60)
         logger.info("STEP 1: DISCOVERY - Running web scrapers...")
         logger.info("="*60)
         
-        discoveries = await self.scraper.run_all_agents()
+        discoveries = await self.crawl()
         
         # Save discoveries
         self.scraper.save_discoveries(str(self.discoveries_file))
@@ -58,6 +134,23 @@ class AGIOSPipeline:
         logger.info(f"✅ Discovery complete: {len(discoveries)} loops found")
         return len(discoveries)
     
+    def run_redundancy_detection(self) -> int:
+        """Step 1b: Drop near-duplicate loops before feature extraction"""
+        logger.info("="*60)
+        logger.info("STEP 1b: REDUNDANCY DETECTION - Clustering duplicates...")
+        logger.info("="*60)
+        
+        with open(self.discoveries_file, 'r') as f:
+            discoveries = json.load(f)
+        
+        unique, duplicates = self.redundancy_detector.filter_discoveries(discoveries)
+        
+        save_records(self.discoveries_file, unique)
+        save_records(self.duplicates_file, duplicates)
+        
+        logger.info(f"✅ Redundancy detection complete: {len(duplicates)} duplicates dropped, {len(unique)} unique loops")
+        return len(duplicates)
+    
     def run_feature_extraction(self) -> int:
         """Step 2: Extract features from discoveries"""
         logger.info("="*60)
@@ -82,6 +175,8 @@ class AGIOSPipeline:
             str(self.features_file),
             str(self.scores_file)
         )
+        # Component vectors let a later WEIGHTS or threshold change skip feature loading
+        ScoreState.from_scores(scores, self.quality_scorer).save(self.score_state_file)
         
         summary = self.quality_scorer.get_summary()
         
@@ -92,6 +187,54 @@ class AGIOSPipeline:
         
         return summary
     
+    def rescore_loops(self) -> dict:
+        """Re-apply the current WEIGHTS and thresholds to the stored component vectors"""
+        logger.info("="*60)
+        logger.info("RESCORING - Applying current weights and thresholds...")
+        logger.info("="*60)
+        
+        if not self.score_state_file.exists():
+            raise FileNotFoundError(
+                f"No component vectors at {self.score_state_file}: run quality scoring "
+                f"(or the streaming pipeline with --save-intermediate) before --rescore"
+            )
+        with open(self.scores_file, 'r') as f:
+            scores = json.load(f)
+        
+        # Both files must come from the same scoring run
+        state = ScoreState.load(self.score_state_file)
+        index = {loop_id: i for i, loop_id in enumerate(state.loop_id.tolist())}
+        missing = [score['loop_id'] for score in scores if score['loop_id'] not in index]
+        if missing or len(scores) != len(index):
+            raise ValueError(
+                f"{self.score_state_file} does not match {self.scores_file} "
+                f"({len(index)} stored loops, {len(scores)} scores, {len(missing)} scores without components, "
+                f"e.g. {missing[:3]}): re-run quality scoring before --rescore"
+            )
+        
+        state, report = rescore(state, self.quality_scorer)
+        
+        # Update the scores file in place; reason codes and components are unchanged
+        for score in scores:
+            i = index[score['loop_id']]
+            score['overall_score'] = float(state.overall_score[i])
+            score['approval_decision'] = DECISIONS[state.decision_code[i]]
+            score['confidence'] = float(state.confidence[i])
+        with open(self.scores_file, 'w') as f:
+            f.write('[')
+            for i, score in enumerate(scores):
+                f.write(',\n' if i else '\n')
+                f.write(json.dumps(score))
+            f.write('\n]\n')
+        
+        state.save(self.score_state_file)
+        report.save(self.rescore_report_file)
+        
+        logger.info(f"✅ Rescoring complete: {len(report.moved)} of {report.loops} decisions moved")
+        for transition, count in report.transitions.items():
+            logger.info(f"   {transition}: {count}")
+        return report.to_dict()
+    
     def filter_approved_loops(self) -> int:
         """Step 4: Filter and save approved loops"""
         logger.info("="*60)
@@ -102,16 +245,18 @@ class AGIOSPipeline:
         with open(self.scores_file, 'r') as f:
             scores = json.load(f)
         
-        # Load features
-        with open(self.features_file, 'r') as f:
-            features = json.load(f)
+        # Load features of approved loops only. Loop IDs are digests, so every row group's
+        # min/max spans them and none is skipped: the filter saves building the rejected rows
+        approved_ids = {score['loop_id'] for score in scores if score['approval_decision'] == 'approved'}
+        features = load_features(self.features_file, filters=[('loop_id', 'in', sorted(approved_ids))]) if approved_ids else []
         
         # Load original discoveries
         with open(self.discoveries_file, 'r') as f:
             discoveries = json.load(f)
         
-        # Create lookup dictionaries
+        # Create lookup dictionaries (one pass each, so the join is linear)
         features_by_id = {f['loop_id']: f for f in features}
+        discoveries_by_id = {loop_id_of(d): d for d in discoveries}
         
         # Filter approved loops
         approved_loops = []
@@ -122,11 +267,7 @@ class AGIOSPipeline:
                 # Find corresponding feature and discovery
                 feature = features_by_id.get(loop_id)
                 if feature:
-                    # Find original discovery by URL
-                    discovery = next(
-                        (d for d in discoveries if hash(d['source_url']) % 1000000 == int(loop_id.split('_')[1])),
-                        None
-                    )
+                    discovery = discoveries_by_id.get(loop_id)
                     
                     approved_loop = {
                         'loop_id': loop_id,
@@ -143,6 +284,125 @@ class AGIOSPipeline:
         logger.info(f"✅ Filtering complete: {len(approved_loops)} approved loops saved")
         return len(approved_loops)
     
+    async def run_streaming_pipeline(self, save_intermediate: bool = False, queue_size: int = 100) -> dict:
+        """Run discovery, feature extraction and scoring as concurrent stages
+        connected by bounded queues, so loops are approved while crawling continues"""
+        start_time = datetime.now()
+        
+        logger.info("\n" + "="*60)
+        logger.info("AGI OS PIPELINE - STREAMING EXECUTION")
+        logger.info("="*60 + "\n")
+        
+        features_queue = asyncio.Queue(maxsize=queue_size)
+        scoring_queue = asyncio.Queue(maxsize=queue_size)
+        counts = {'discoveries': 0, 'duplicates_dropped': 0, 'features_extracted': 0, 'approved_loops': 0}
+        # Scores written to the scores file, kept so --rescore has their component vectors
+        streamed_scores = []
+        first_approved_seconds = None
+        
+        # Intermediate files are optional sinks; approved loops are always written
+        sinks = {'approved': JSONArraySink(self.approved_file)}
+        if save_intermediate:
+            sinks['discoveries'] = JSONArraySink(self.discoveries_file)
+            sinks['features'] = FeatureStoreWriter(self.features_file) if is_parquet(self.features_file) else JSONArraySink(self.features_file)
+            sinks['scores'] = JSONArraySink(self.scores_file)
+        
+        async def discover():
+            async for discovery in self.scraper.stream_discoveries(queue_size):
+                counts['discoveries'] += 1
+                await features_queue.put(discovery)
+            await features_queue.put(None)
+        
+        async def extract():
+            while (discovery := await features_queue.get()) is not None:
+                discovery_dict = discovery.to_dict()
+                if 'discoveries' in sinks:
+                    sinks['discoveries'].write(discovery_dict)
+                if self.redundancy_detector.check_discovery(discovery_dict).is_duplicate:
+                    counts['duplicates_dropped'] += 1
+                    continue
+                try:
+                    features = self.feature_extractor.extract_features(discovery_dict).to_dict()
+                except Exception as e:
+                    logger.error(f"Error processing discovery {discovery.source_url}: {e}")
+                    continue
+                counts['features_extracted'] += 1
+                await scoring_queue.put((discovery_dict, features))
+            await scoring_queue.put(None)
+        
+        async def score():
+            nonlocal first_approved_seconds
+            while (item := await scoring_queue.get()) is not None:
+                discovery_dict, features = item
+                if 'features' in sinks:
+                    sinks['features'].write(features)
+                try:
+                    score = self.quality_scorer.score_loop(features)
+                except Exception as e:
+                    logger.error(f"Error scoring loop {features['loop_id']}: {e}")
+                    continue
+                if 'scores' in sinks:
+                    sinks['scores'].write(score.to_dict())
+                    streamed_scores.append(score)
+                
+                if score.approval_decision == 'approved':
+                    if first_approved_seconds is None:
+                        first_approved_seconds = (datetime.now() - start_time).total_seconds()
+                    counts['approved_loops'] += 1
+                    sinks['approved'].write({
+                        'loop_id': score.loop_id,
+                        'score': score.to_dict(),
+                        'features': features,
+                        'discovery': discovery_dict
+                    })
+        
+        try:
+            await asyncio.gather(discover(), extract(), score())
+        except BaseException:
+            # Loops still in flight were never scored: let the next run rediscover them
+            self.scraper.rollback_frontier()
+            raise
+        else:
+            self.scraper.commit_frontier()
+        finally:
+            self.redundancy_detector.commit()
+            self.feature_extractor.cache.commit()
+            for sink in sinks.values():
+                sink.close()
+            if 'scores' in sinks:
+                ScoreState.from_scores(streamed_scores, self.quality_scorer).save(self.score_state_file)
+        
+        scoring_summary = self.quality_scorer.get_summary()
+        end_time = datetime.now()
+        duration = (end_time - start_time).total_seconds()
+        
+        stats = {
+            'timestamp': end_time.isoformat(),
+            'duration_seconds': duration,
+            'mode': 'streaming',
+            'discoveries': counts['discoveries'],
+            'duplicates_dropped': counts['duplicates_dropped'],
+            'features_extracted': counts['features_extracted'],
+            'scoring_summary': scoring_summary,
+            'approved_loops': counts['approved_loops'],
+            'approval_rate': scoring_summary['approval_rate'],
+            'time_to_first_approved_seconds': first_approved_seconds,
+            'discovery_metrics': self.scraper.run_summary(),
+            'pipeline_status': 'success'
+        }
+        
+        self.save_pipeline_stats(stats)
+        
+        logger.info("\n" + "="*60)
+        logger.info("STREAMING PIPELINE COMPLETE")
+        logger.info("="*60)
+        logger.info(f"Duration: {duration:.1f} seconds")
+        logger.info(f"Discoveries: {counts['discoveries']}")
+        logger.info(f"Approved: {counts['approved_loops']} ({scoring_summary['approval_rate']*100:.1f}%)")
+        logger.info("="*60 + "\n")
+        
+        return stats
+    
     def save_pipeline_stats(self, stats: dict):
         """Save pipeline statistics"""
         with open(self.pipeline_stats_file, 'w') as f:
@@ -156,17 +416,26 @@ class AGIOSPipeline:
         logger.info("AGI OS PIPELINE - FULL EXECUTION")
         logger.info("="*60 + "\n")
         
-        # Step 1: Discovery
-        num_discoveries = await self.run_discovery()
-        
-        # Step 2: Feature Extraction
-        num_features = self.run_feature_extraction()
-        
-        # Step 3: Quality Scoring
-        scoring_summary = self.run_quality_scoring()
-        
-        # Step 4: Filter Approved
-        num_approved = self.filter_approved_loops()
+        try:
+            # Step 1: Discovery
+            num_discoveries = await self.run_discovery()
+            
+            # Step 1b: Redundancy Detection
+            num_duplicates = self.run_redundancy_detection()
+            
+            # Step 2: Feature Extraction
+            num_features = self.run_feature_extraction()
+            
+            # Step 3: Quality Scoring
+            scoring_summary = self.run_quality_scoring()
+            
+            # Step 4: Filter Approved
+            num_approved = self.filter_approved_loops()
+        except Exception:
+            # Nothing was curated: the next run must see these URLs again
+            self.scraper.rollback_frontier()
+            raise
+        self.scraper.commit_frontier()
         
         # Calculate statistics
         end_time = datetime.now()
@@ -176,10 +445,12 @@ class AGIOSPipeline:
             'timestamp': end_time.isoformat(),
             'duration_seconds': duration,
             'discoveries': num_discoveries,
+            'duplicates_dropped': num_duplicates,
             'features_extracted': num_features,
             'scoring_summary': scoring_summary,
             'approved_loops': num_approved,
             'approval_rate': scoring_summary['approval_rate'],
+            'discovery_metrics': self.scraper.run_summary(),
             'pipeline_status': 'success'
         }
         
@@ -196,14 +467,63 @@ class AGIOSPipeline:
         logger.info("="*60 + "\n")
         
         return stats
+    
+    async def run_daemon(self, max_cycles: Optional[int] = None):
+        """Crawl continuously, each source as often as it changes, and run the
+        curation steps on every cycle that found new loops"""
+        logger.info("\n" + "="*60)
+        logger.info("AGI OS PIPELINE - DAEMON MODE")
+        logger.info("="*60 + "\n")
+        
+        # Every cycle's discoveries are appended to one compressed log as they are found
+        self.scraper.sink = NDJSONWriter(self.discoveries_log)
+        try:
+            async for discoveries in self.scraper.crawl_forever(cycles=max_cycles, crawl=self.crawl):
+                if not discoveries:
+                    logger.info("No new loops this cycle")
+                    continue
+                
+                try:
+                    self.scraper.save_discoveries(str(self.discoveries_file))
+                    self.run_redundancy_detection()
+                    self.run_feature_extraction()
+                    self.run_quality_scoring()
+                    num_approved = self.filter_approved_loops()
+                except Exception:
+                    self.scraper.rollback_frontier()
+                    raise
+                self.scraper.commit_frontier()
+                logger.info(f"Cycle complete: {len(discoveries)} new loops, {num_approved} approved")
+        finally:
+            self.scraper.sink.close()
+            self.scraper.sink = None
 
 
 # Main execution
 if __name__ == "__main__":
-    pipeline = AGIOSPipeline()
+    # --broker URL hands crawl jobs to workers (python -m components.discovery.distributed)
+    broker_url = sys.argv[sys.argv.index("--broker") + 1] if "--broker" in sys.argv else None
+    pipeline = AGIOSPipeline(broker=broker_from_url(broker_url) if broker_url else None)
+    # --metrics-port PORT serves the scraper metrics for Prometheus to scrape
+    if "--metrics-port" in sys.argv:
+        pipeline.scraper.metrics.serve(int(sys.argv[sys.argv.index("--metrics-port") + 1]))
+    
+    # --rescore re-applies changed WEIGHTS or thresholds to the last scoring run
+    if "--rescore" in sys.argv:
+        report = pipeline.rescore_loops()
+        num_approved = pipeline.filter_approved_loops()
+        print(f"\n🔁 {len(report['moved'])} decisions moved, {num_approved} loops approved")
+        print(f"📁 Report saved to: {pipeline.rescore_report_file}")
+        sys.exit(0)
     
-    # Run the full pipeline
-    stats = asyncio.run(pipeline.run_full_pipeline())
+    # Run the full pipeline (--stream runs the stages concurrently, --daemon recrawls continuously)
+    if "--daemon" in sys.argv:
+        asyncio.run(pipeline.run_daemon())
+        sys.exit(0)
+    if "--stream" in sys.argv:
+        stats = asyncio.run(pipeline.run_streaming_pipeline(save_intermediate="--save-intermediate" in sys.argv))
+    else:
+        stats = asyncio.run(pipeline.run_full_pipeline())
     
     print("\n🎉 AGI OS Pipeline execution complete!")
     print(f"📊 {stats['approved_loops']} loops ready for deployment")
@@ -0,0 +1,170 @@
+"""
+Unit tests for distributed crawl workers and brokers
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from components.discovery.distributed import (
+    DEAD_LETTER_QUEUE,
+    JOBS_QUEUE,
+    RESULTS_QUEUE,
+    CrawlWorker,
+    InMemoryBroker,
+    SQLiteBroker,
+    run_distributed
+)
+from components.discovery.web_scraper import RedditScraperAgent, ScraperOrchestrator
+
+
+def reddit_handler(request):
+    sub = request.url.path.split("/")[2]
+    return httpx.Response(
+        200,
+        text=f'<div class="thing"><a class="title" href="/r/{sub}/comments/a/">python script for {sub}</a></div>'
+    )
+
+
+class TestBrokers:
+    """Test broker delivery semantics"""
+
+    def test_unacked_message_is_redelivered(self):
+        """Test that a message comes back if its consumer never acks"""
+        broker = InMemoryBroker(visibility_timeout=0)
+        broker.publish("q", {"n": 1})
+
+        first = broker.reserve("q")
+        again = broker.reserve("q")
+        assert again.body == {"n": 1}
+        assert again.attempts == 2
+
+        broker.ack("q", again)
+        assert broker.reserve("q") is None
+        assert first.attempts == 1
+
+    def test_sqlite_consumers_share_queue(self, tmp_path):
+        """Test that two connections (processes) never get the same message"""
+        producer = SQLiteBroker(str(tmp_path / "broker.db"))
+        consumer = SQLiteBroker(str(tmp_path / "broker.db"))
+        producer.publish("q", {"n": 1})
+        producer.publish("q", {"n": 2})
+
+        a, b = producer.reserve("q"), consumer.reserve("q")
+        assert {a.body["n"], b.body["n"]} == {1, 2}
+        assert consumer.reserve("q") is None
+
+        consumer.ack("q", b)
+        producer.ack("q", a)
+        assert producer.reserve("q") is None
+
+    def test_delete_drops_queue(self, tmp_path):
+        """Test that a deleted queue loses its ready and reserved messages"""
+        for broker in (InMemoryBroker(visibility_timeout=0), SQLiteBroker(str(tmp_path / "broker.db"), visibility_timeout=0)):
+            broker.publish("q", {"n": 1})
+            broker.publish("q", {"n": 2})
+            broker.publish("other", {"n": 3})
+            broker.reserve("q")
+
+            broker.delete("q")
+            assert broker.reserve("q") is None
+            assert broker.reserve("other").body == {"n": 3}
+
+    def test_sqlite_redelivery(self, tmp_path):
+        """Test that an expired reservation is handed out again"""
+        broker = SQLiteBroker(str(tmp_path / "broker.db"), visibility_timeout=0)
+        broker.publish("q", {"n": 1})
+        broker.reserve("q")
+
+        assert broker.reserve("q").attempts == 2
+
+
+class TestDistributedCrawl:
+    """Test coordinator and workers end to end"""
+
+    def run_crawl(self, broker, workers=2, handler=reddit_handler):
+        orchestrator = ScraperOrchestrator(parse_workers=0)
+        orchestrator.agents = [RedditScraperAgent()]
+
+        async def run():
+            crawl_workers = [
+                CrawlWorker(broker, concurrency=2, poll_interval=0.01, transport=httpx.MockTransport(handler))
+                for _ in range(workers)
+            ]
+            for worker in crawl_workers:
+                worker.scheduler = None
+            discoveries, *_ = await asyncio.gather(
+                run_distributed(orchestrator, broker, poll_interval=0.01, timeout=5),
+                *(worker.run(idle_timeout=0.2) for worker in crawl_workers)
+            )
+            return discoveries, crawl_workers
+
+        return asyncio.run(run())
+
+    def test_workers_crawl_all_targets(self):
+        """Test that every target URL is crawled exactly once across workers"""
+        broker = InMemoryBroker()
+        discoveries, workers = self.run_crawl(broker)
+
+        assert len(discoveries) == 4
+        assert sum(worker.jobs_done for worker in workers) == 4
+        # The run's results queue is deleted once the run ends
+        assert not [queue for queue in broker._ready if queue.startswith(RESULTS_QUEUE)]
+
+    def test_redelivered_jobs_counted_once(self, tmp_path):
+        """Test that duplicate results from redelivered jobs are ignored"""
+        broker = SQLiteBroker(str(tmp_path / "broker.db"))
+        original_publish = broker.publish
+
+        def publish_twice(queue, body):
+            original_publish(queue, body)
+            if queue == JOBS_QUEUE:
+                original_publish(queue, body)
+
+        broker.publish = publish_twice
+        discoveries, workers = self.run_crawl(broker)
+
+        assert sum(worker.jobs_done for worker in workers) == 8
+        assert len(discoveries) == 4
+
+    def test_page_status_cleared_after_jobs(self):
+        """Test that workers keep no status for the listing or cursor pages of finished jobs"""
+        def paged_handler(request):
+            response = reddit_handler(request)
+            if "after" in request.url.params:
+                return response
+            next_link = f'<span class="next-button"><a href="{request.url.path}?after=t3_x">next</a></span>'
+            return httpx.Response(200, text=response.text + next_link)
+
+        discoveries, workers = self.run_crawl(InMemoryBroker(), handler=paged_handler)
+
+        assert len(discoveries) == 8
+        assert all(not agent.page_status for worker in workers for agent in worker._agents.values())
+
+    def test_poison_job_is_dead_lettered(self):
+        """Test that a job failing max_attempts times is parked and reported, not retried forever"""
+        broker = InMemoryBroker(visibility_timeout=0)
+        broker.publish(JOBS_QUEUE, {
+            "job_id": "run-0", "source": "nowhere", "mode": "html", "url": "https://x.test/", "reply_to": "replies"
+        })
+        worker = CrawlWorker(broker, concurrency=1, poll_interval=0.01, max_attempts=3)
+        asyncio.run(worker.run(idle_timeout=0.1))
+
+        dead = broker.reserve(DEAD_LETTER_QUEUE)
+        assert dead.body["job"]["job_id"] == "run-0"
+        assert dead.body["attempts"] == 3
+        assert worker.jobs_dead == 1 and worker.jobs_done == 0
+        assert broker.reserve(JOBS_QUEUE) is None
+        assert broker.reserve("replies").body["failed"]
+
+    def test_exhausted_delivery_is_dead_lettered_unrun(self):
+        """Test that a job redelivered past max_attempts is not run again"""
+        broker = InMemoryBroker(visibility_timeout=0)
+        broker.publish(JOBS_QUEUE, {"job_id": "run-0", "source": "reddit", "mode": "html", "url": "https://x.test/"})
+        for _ in range(2):
+            broker.reserve(JOBS_QUEUE)  # consumers that died without acking
+        worker = CrawlWorker(broker, concurrency=1, poll_interval=0.01, max_attempts=2)
+        asyncio.run(worker.run(idle_timeout=0.1))
+
+        assert broker.reserve(DEAD_LETTER_QUEUE).body["attempts"] == 3
+        assert worker.jobs_done == 0
@@ -0,0 +1,137 @@
+"""
+Unit tests for detail-page enrichment
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from components.discovery.enrichment import DetailEnricher, EnrichmentCache
+from components.discovery.http_cache import HTTPCache
+from components.discovery.http_engine import AsyncFetchEngine
+from components.discovery.web_scraper import LoopDiscovery
+
+
+README_PAGE = """
+<html><body>
+<article class="markdown-body">
+  <h1>auto-bot</h1>
+  <p>Automates the boring parts of your inbox.</p>
+  <pre>import auto_bot
+auto_bot.run(schedule="daily", retries=3, notify=True)</pre>
+</article>
+</body></html>
+"""
+
+
+def make_discovery(url, source_type="github"):
+    return LoopDiscovery(
+        source_url=url,
+        source_type=source_type,
+        content_type="text_description",
+        raw_content="Workflow automation bot",
+        metadata={}
+    )
+
+
+def run_enrich(enricher, discoveries, handler, cache=None):
+    async def run():
+        async with AsyncFetchEngine(transport=httpx.MockTransport(handler), cache=cache) as engine:
+            return await enricher.enrich_all(engine, discoveries)
+
+    return asyncio.run(run())
+
+
+class TestDetailEnricher:
+    """Test DetailEnricher functionality"""
+
+    def test_detail_url(self):
+        """Test that only repository and post pages are fetched"""
+        assert DetailEnricher.detail_url(make_discovery("https://github.com/octo/auto-bot"))
+        assert DetailEnricher.detail_url(make_discovery("https://github.com/trending")) is None
+        reddit = make_discovery("https://old.reddit.com/r/Python/comments/a/b/", "reddit")
+        assert DetailEnricher.detail_url(reddit)
+
+    def test_enrich_adds_readme_and_code(self):
+        """Test that README text and code blocks are folded into the discovery"""
+        discovery = make_discovery("https://github.com/octo/auto-bot")
+        run_enrich(DetailEnricher(), [discovery], lambda request: httpx.Response(200, text=README_PAGE))
+
+        assert "Automates the boring parts" in discovery.raw_content
+        assert "auto_bot.run" in discovery.raw_content
+        assert discovery.metadata["code_blocks"] == 1
+        assert discovery.content_type == "code_snippet"
+
+    def test_bounded_concurrency(self):
+        """Test that no more than max_concurrency detail pages are in flight"""
+        in_flight = peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return httpx.Response(200, text=README_PAGE)
+
+        discoveries = [make_discovery(f"https://github.com/octo/repo-{i}") for i in range(6)]
+        run_enrich(DetailEnricher(max_concurrency=2), discoveries, handler)
+        assert peak <= 2
+
+    def test_reused_across_event_loops(self):
+        """Test that one enricher keeps enriching when each run has its own event loop"""
+        async def handler(request):
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, text=README_PAGE)
+
+        enricher = DetailEnricher(max_concurrency=1)
+        for run in range(2):
+            discoveries = [make_discovery(f"https://github.com/octo/repo-{run}-{i}") for i in range(3)]
+            run_enrich(enricher, discoveries, handler)
+            assert all(d.metadata.get("enriched") for d in discoveries)
+
+    def test_byte_cap(self):
+        """Test that detail bodies are truncated at max_bytes"""
+        async def run():
+            handler = lambda request: httpx.Response(200, content=b"x" * 10000)
+            async with AsyncFetchEngine(transport=httpx.MockTransport(handler)) as engine:
+                return await engine.fetch("https://github.com/octo/big", max_bytes=1000)
+
+        assert len(asyncio.run(run()).content) == 1000
+
+    def test_failed_fetch_keeps_discovery(self):
+        """Test that an error leaves the discovery untouched"""
+        discovery = make_discovery("https://github.com/octo/gone")
+        run_enrich(DetailEnricher(), [discovery], lambda request: httpx.Response(404))
+
+        assert discovery.raw_content == "Workflow automation bot"
+        assert "enriched" not in discovery.metadata
+
+    def test_revalidated_page_uses_cache(self, tmp_path):
+        """Test that a 304 reuses details cached under the same revision"""
+        def handler(request):
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text=README_PAGE, headers={"ETag": '"v1"'})
+
+        enricher = DetailEnricher(cache_path=str(tmp_path / "details.db"))
+        http_cache = HTTPCache(str(tmp_path / "http.db"))
+        run_enrich(enricher, [make_discovery("https://github.com/octo/auto-bot")], handler, http_cache)
+        again = make_discovery("https://github.com/octo/auto-bot")
+        run_enrich(enricher, [again], handler, http_cache)
+
+        assert enricher.cache.hits == 1
+        assert "Automates the boring parts" in again.raw_content
+
+
+class TestEnrichmentCache:
+    """Test EnrichmentCache functionality"""
+
+    def test_new_revision_replaces_old(self, tmp_path):
+        """Test that only the latest revision of a URL is kept"""
+        cache = EnrichmentCache(str(tmp_path / "details.db"))
+        cache.put("https://a.test/", "v1", {"body": "old", "code_blocks": []})
+        cache.put("https://a.test/", "v2", {"body": "new", "code_blocks": []})
+
+        assert cache.get("https://a.test/", "v1") is None
+        assert cache.get("https://a.test/", "v2")["body"] == "new"
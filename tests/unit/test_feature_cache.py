@@ -0,0 +1,80 @@
+"""
+Unit tests for the content-addressed feature cache
+"""
+
+import time
+
+import pytest
+from components.curation.feature_cache import FeatureCache
+from components.curation.feature_extractor import ExtractedFeatures, FeatureExtractor
+
+
+def make_discovery(i, text="Automation bot that schedules tasks"):
+    return {
+        "source_url": f"https://github.com/octo/repo-{i}",
+        "source_type": "github",
+        "content_type": "text_description",
+        "raw_content": text,
+        "metadata": {"title": f"octo / repo-{i}", "stars": "10 stars today", "author": "octo"},
+        "discovery_timestamp": f"2025-10-2{i % 10}T00:00:00"
+    }
+
+
+@pytest.fixture
+def extractor(tmp_path):
+    return FeatureExtractor(workers=0, cache=FeatureCache(str(tmp_path / "feature_cache.db")))
+
+
+class TestFeatureCache:
+    """Test FeatureCache functionality"""
+
+    def test_key_ignores_timestamp_and_tracks_content(self):
+        """Test that only feature inputs and the version change the key"""
+        a = make_discovery(1)
+        recrawled = {**a, "discovery_timestamp": "2030-01-01T00:00:00"}
+        edited = {**a, "raw_content": "Edited description"}
+
+        assert FeatureCache.key(a, 1) == FeatureCache.key(recrawled, 1)
+        assert FeatureCache.key(a, 1) != FeatureCache.key(edited, 1)
+        assert FeatureCache.key(a, 1) != FeatureCache.key(a, 2)
+
+    def test_lru_eviction(self, tmp_path):
+        """Test that the least recently used entries are evicted first"""
+        cache = FeatureCache(str(tmp_path / "feature_cache.db"), max_entries=10)
+        cache.put_many((f"k{i}", {"i": i}) for i in range(10))
+        time.sleep(0.01)
+        cache.get("k0")
+        cache.put_many([("k10", {"i": 10})])
+
+        assert cache.size == 9
+        assert cache.get("k0") == {"i": 0}
+        assert cache.get("k1") is None
+
+
+class TestCachedExtraction:
+    """Test FeatureExtractor with a cache"""
+
+    def test_extract_features_hit(self, extractor, monkeypatch):
+        """Test that an unchanged discovery returns stored features without extraction"""
+        first = extractor.extract_features(make_discovery(1))
+        monkeypatch.setattr(extractor, "compute_features", lambda d: pytest.fail("re-extracted"))
+
+        again = extractor.extract_features(make_discovery(1))
+        assert isinstance(again, ExtractedFeatures)
+        assert again == first
+
+    def test_extract_all_only_extracts_changes(self, extractor, tmp_path):
+        """Test that a rerun extracts only new or edited discoveries, in order"""
+        discoveries = [make_discovery(i) for i in range(5)]
+        first = extractor.extract_all(discoveries)
+        extractor.cache.close()
+
+        rerun = FeatureExtractor(workers=0, cache=FeatureCache(str(tmp_path / "feature_cache.db")))
+        discoveries[3] = make_discovery(3, "Edited: a scraper for invoices")
+        second = rerun.extract_all(discoveries)
+
+        assert rerun.cache.hits == 4
+        assert rerun.cache.misses == 1
+        assert second[:3] == first[:3]
+        assert second[3]["primary_category"] == "web_scraping"
+        assert second == FeatureExtractor(workers=0).extract_all(discoveries)
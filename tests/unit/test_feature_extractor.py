@@ -24,6 +24,14 @@ class TestCodeAnalyzer:
         code = "function test() { return true; }"
         assert CodeAnalyzer.detect_language(code) == 'javascript'
     
+    def test_detect_language_substrings(self):
+        """Test that detection matches substrings, not whole tokens"""
+        assert CodeAnalyzer.detect_language("a subclass of list") == 'python'
+        assert CodeAnalyzer.detect_language("functions => results") == 'javascript'
+        assert CodeAnalyzer.detect_language("private int count;") == 'java'
+        assert CodeAnalyzer.detect_language("int x = 0; // main loop") == 'unknown'
+        assert CodeAnalyzer.detect_language("int main() { return 0; }") == 'c++'
+    
     def test_count_lines(self):
         """Test line counting"""
         code = "line1\nline2\n\nline3\n  \nline4"
@@ -34,6 +42,43 @@ class TestCodeAnalyzer:
         code = "x = 1\ny = 2"
         complexity = CodeAnalyzer.calculate_complexity(code, 'python')
         assert 0 <= complexity <= 1
+    
+    def test_code_metrics(self):
+        """Test the metrics vector from one AST pass"""
+        code = (
+            "import os\n"
+            "from json import loads\n"
+            "async def main(paths):\n"
+            "    for p in paths:\n"
+            "        if p and os.path.exists(p):\n"
+            "            print([x for x in p if x])\n"
+        )
+        metrics = CodeAnalyzer.code_metrics(code)
+        
+        assert metrics.functions == 1
+        assert metrics.comprehensions == 1
+        assert metrics.bool_ops == 1
+        assert metrics.calls == 2
+        assert metrics.max_depth == 3
+        assert metrics.imports == {'os', 'json'}
+        # 1 + for + if + and + comprehension with one if
+        assert metrics.cyclomatic == 6
+    
+    def test_code_metrics_syntax_error(self):
+        """Test that unparseable code falls back to line-based complexity"""
+        code = "def broken(:\n    pass"
+        assert CodeAnalyzer.code_metrics(code) is None
+        assert CodeAnalyzer.calculate_complexity(code, 'python') == 0.02
+    
+    def test_analyze_matches_individual_methods(self):
+        """Test that analyze agrees with the individual methods"""
+        code = "import os\n\ndef main():\n    return os.getcwd()"
+        language, complexity, lines, metrics = CodeAnalyzer.analyze(code)
+        
+        assert language == CodeAnalyzer.detect_language(code)
+        assert complexity == CodeAnalyzer.calculate_complexity(code, language)
+        assert lines == CodeAnalyzer.count_lines(code) == 3
+        assert metrics.functions == 1
 
 
 class TestTextAnalyzer:
@@ -128,3 +173,65 @@ class TestQualityScorer:
         assert 0 <= value <= 1
         assert value > 0.5  # High scores should give high value
 
+
+
+def make_discovery(i):
+    return {
+        "source_url": f"https://github.com/octo/repo-{i}",
+        "source_type": "github",
+        "content_type": "text_description",
+        "raw_content": f"Automation bot {i}\nimport os\ndef main():\n    return [p for p in os.listdir('.') if p]\n" * 2,
+        "metadata": {"title": f"octo / repo-{i}", "stars": f"{i} stars today", "author": "octo"},
+        "discovery_timestamp": "2025-10-21T00:00:00"
+    }
+
+
+class TestCodeFeatures:
+    """Test that code metrics reach the extracted features"""
+    
+    def test_metrics_in_features(self):
+        """Test cyclomatic complexity, depth, calls and imports of Python code"""
+        code = "import os\nfrom json import loads\n\ndef main(paths):\n    for p in paths:\n        if p:\n            print(loads(p))\n"
+        discovery = dict(make_discovery(1), raw_content=code * 2)
+        features = FeatureExtractor(workers=0).extract_features(discovery).to_dict()
+        
+        # Two functions, each: 1 + for + if
+        assert features['code_language'] == 'python'
+        assert features['code_cyclomatic'] == 5
+        assert features['code_max_depth'] == 3
+        assert features['code_calls'] == 4
+        assert features['code_imports'] == ['json', 'os']
+    
+    def test_no_metrics_without_code(self):
+        """Test that discoveries without code get zero metrics"""
+        discovery = dict(make_discovery(1), raw_content="Automation bot for your workflow")
+        features = FeatureExtractor(workers=0).extract_features(discovery).to_dict()
+        
+        assert not features['has_code']
+        assert (features['code_cyclomatic'], features['code_max_depth'], features['code_calls']) == (0, 0, 0)
+        assert features['code_imports'] == []
+
+
+class TestBatchExtraction:
+    """Test FeatureExtractor batch mode"""
+    
+    def test_errors_are_isolated(self):
+        """Test that a bad discovery is skipped without losing its chunk"""
+        discoveries = [make_discovery(i) for i in range(5)]
+        del discoveries[2]["metadata"]
+        
+        features = FeatureExtractor(workers=0, chunk_size=2).extract_all(discoveries)
+        assert [f["source_url"] for f in features] == [
+            d["source_url"] for i, d in enumerate(discoveries) if i != 2
+        ]
+    
+    def test_pool_matches_inline(self):
+        """Test that worker processes return the inline result, in input order"""
+        discoveries = [make_discovery(i) for i in range(40)]
+        discoveries[7] = {"source_url": "broken"}
+        
+        inline = FeatureExtractor(workers=0).extract_all(discoveries)
+        pooled = FeatureExtractor(workers=3, chunk_size=4).extract_all(discoveries)
+        
+        assert len(pooled) == 39
+        assert pooled == inline
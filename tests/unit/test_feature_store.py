@@ -0,0 +1,95 @@
+"""
+Unit tests for the columnar feature store
+"""
+
+import json
+from dataclasses import fields
+
+import pytest
+from components.curation.feature_extractor import ExtractedFeatures, FeatureExtractor
+from components.curation.feature_store import FEATURE_COLUMNS, load_features, save_features
+
+
+def make_features(n):
+    discoveries = [
+        {
+            "source_url": f"https://github.com/octo/repo-{i}",
+            "source_type": "github" if i % 2 else "reddit",
+            "content_type": "text_description",
+            "raw_content": "A scraper bot" if i % 3 else "import os\ndef main():\n    pass\n" * 10,
+            "metadata": {"title": f"repo {i}", "stars": "5 stars today", "upvotes": "7", "author": "octo"},
+            "discovery_timestamp": "2025-10-21T00:00:00"
+        }
+        for i in range(n)
+    ]
+    return FeatureExtractor(workers=0).extract_all(discoveries)
+
+
+class TestFeatureSchema:
+    """Test the typed feature schema"""
+
+    def test_schema_covers_extracted_features(self):
+        """Test that the store has one column per ExtractedFeatures field"""
+        assert [name for name, _ in FEATURE_COLUMNS] == [f.name for f in fields(ExtractedFeatures)]
+
+
+class TestJSONFallback:
+    """Test projection and filtering on JSON feature files"""
+
+    def test_project_and_filter(self, tmp_path):
+        """Test that JSON files honour columns and filters like Parquet"""
+        features = make_features(6)
+        save_features(tmp_path / "features.json", features)
+
+        rows = load_features(tmp_path / "features.json", columns=["loop_id"], filters=[("source_type", "==", "github")])
+        assert rows == [{"loop_id": f["loop_id"]} for f in features if f["source_type"] == "github"]
+
+    def test_in_filter_accepts_any_collection(self, tmp_path):
+        """Test that 'in' filters match the same rows for a list, set or generator"""
+        features = make_features(6)
+        save_features(tmp_path / "features.json", features)
+        wanted = [features[1]["loop_id"], features[4]["loop_id"]]
+
+        for options in (wanted, set(wanted), (loop_id for loop_id in wanted)):
+            rows = load_features(tmp_path / "features.json", columns=["loop_id"], filters=[("loop_id", "in", options)])
+            assert rows == [{"loop_id": loop_id} for loop_id in wanted]
+
+
+class TestParquetStore:
+    """Test the Parquet feature store"""
+
+    @pytest.fixture(autouse=True)
+    def pyarrow(self):
+        return pytest.importorskip("pyarrow")
+
+    def test_round_trip(self, tmp_path):
+        """Test that every field comes back with its type"""
+        features = make_features(10)
+        save_features(tmp_path / "features.parquet", features)
+
+        assert load_features(tmp_path / "features.parquet") == features
+
+    def test_row_groups_and_pushdown(self, tmp_path):
+        """Test that rows are written in groups and read by projection and predicate"""
+        from components.curation.feature_store import FeatureStore, FeatureStoreWriter
+
+        features = make_features(25)
+        with FeatureStoreWriter(tmp_path / "features.parquet", row_group_size=10) as writer:
+            writer.write_all(features)
+
+        store = FeatureStore(tmp_path / "features.parquet")
+        assert store.num_rows == 25
+        assert store.num_row_groups == 3
+
+        wanted = [features[3]["loop_id"], features[17]["loop_id"]]
+        table = store.read_table(columns=["loop_id", "primary_category"], filters=[("loop_id", "in", wanted)])
+        assert table.column_names == ["loop_id", "primary_category"]
+        assert table.column("loop_id").to_pylist() == wanted
+
+    def test_smaller_than_json(self, tmp_path):
+        """Test that the columnar file is much smaller than indented JSON"""
+        features = make_features(300)
+        save_features(tmp_path / "features.parquet", features)
+        save_features(tmp_path / "features.json", features)
+
+        assert (tmp_path / "features.parquet").stat().st_size * 3 < (tmp_path / "features.json").stat().st_size
@@ -0,0 +1,111 @@
+"""
+Unit tests for feed-based scraper agents
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from components.discovery.feed_scraper import RedditFeedAgent
+from components.discovery.http_engine import AsyncFetchEngine
+from components.discovery.web_scraper import RedditScraperAgent, ScraperOrchestrator
+
+
+def reddit_json(after=None):
+    """Build a Reddit .json listing with one matching and one unrelated post"""
+    posts = [
+        {"title": "My python script to rename files", "permalink": "/r/Python/comments/a1/my_script/",
+         "score": 42, "author": "alice", "subreddit_name_prefixed": "r/Python"},
+        {"title": "What is your favourite editor?", "permalink": "/r/Python/comments/a2/editor/",
+         "score": 7, "author": "bob", "subreddit_name_prefixed": "r/Python"}
+    ]
+    return json.dumps({"kind": "Listing", "data": {"after": after, "children": [{"kind": "t3", "data": p} for p in posts]}})
+
+
+REDDIT_ATOM = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Python</title>
+  <link rel="next" href="https://old.reddit.com/r/Python/.rss?after=t3_b2"/>
+  <entry>
+    <author><name>/u/carol</name></author>
+    <category term="Python" label="r/Python"/>
+    <content type="html">&lt;p&gt;body&lt;/p&gt;</content>
+    <link href="https://www.reddit.com/r/Python/comments/b1/bot/"/>
+    <title>Telegram bot tutorial</title>
+  </entry>
+  <entry>
+    <link href="https://www.reddit.com/r/Python/comments/b2/news/"/>
+    <title>Release notes</title>
+  </entry>
+</feed>
+"""
+
+
+class TestRedditFeedAgent:
+    """Test RedditFeedAgent functionality"""
+
+    def test_json_listing(self):
+        """Test that JSON posts become discoveries with the HTML agent's metadata shape"""
+        agent = RedditFeedAgent('json')
+        url = agent.target_urls[0]
+        discoveries, next_url = agent.parse(url, reddit_json(after="t3_a2").encode())
+
+        assert len(discoveries) == 1
+        assert discoveries[0].source_url == "https://old.reddit.com/r/Python/comments/a1/my_script/"
+        assert discoveries[0].metadata == {
+            "title": "My python script to rename files",
+            "author": "alice",
+            "upvotes": "42",
+            "subreddit": "r/Python"
+        }
+        assert next_url == "https://old.reddit.com/r/Python/.json?after=t3_a2"
+
+    def test_atom_feed(self):
+        """Test that Atom entries are parsed incrementally, including the next link"""
+        agent = RedditFeedAgent('rss')
+        agent.CHUNK_SIZE = 64
+        discoveries, next_url = agent.parse(agent.target_urls[0], REDDIT_ATOM.encode())
+
+        assert [d.source_url for d in discoveries] == ["https://old.reddit.com/r/Python/comments/b1/bot/"]
+        assert discoveries[0].metadata["author"] == "carol"
+        assert discoveries[0].metadata["subreddit"] == "r/Python"
+        assert next_url == "https://old.reddit.com/r/Python/.rss?after=t3_b2"
+
+    def test_crawl_follows_after_cursor(self):
+        """Test that the JSON cursor drives pagination"""
+        def handler(request):
+            after = request.url.params.get("after")
+            return httpx.Response(200, text=reddit_json(after=None if after else "t3_a2"))
+
+        async def run():
+            async with AsyncFetchEngine(transport=httpx.MockTransport(handler)) as engine:
+                agent = RedditFeedAgent('json')
+                return [page async for page in agent.crawl_source(engine, agent.target_urls[0])]
+
+        assert len(asyncio.run(run())) == 2
+
+    def test_unknown_format(self):
+        """Test that only JSON and RSS feeds are accepted"""
+        with pytest.raises(ValueError):
+            RedditFeedAgent('csv')
+
+
+class TestSourceModes:
+    """Test per-source ingestion mode selection"""
+
+    def test_default_modes(self):
+        """Test that sources are scraped as HTML by default"""
+        agents = ScraperOrchestrator(parse_workers=0).agents
+        assert any(isinstance(agent, RedditScraperAgent) for agent in agents)
+
+    def test_feed_mode(self):
+        """Test that a source can be switched to its feed"""
+        agents = ScraperOrchestrator(parse_workers=0, source_modes={"reddit": "json"}).agents
+        assert sum(isinstance(agent, RedditFeedAgent) for agent in agents) == 1
+        assert len(agents) == 2
+
+    def test_unsupported_mode(self):
+        """Test that sources without a feed reject feed modes"""
+        with pytest.raises(ValueError):
+            ScraperOrchestrator(source_modes={"github": "rss"})
@@ -0,0 +1,78 @@
+"""
+Unit tests for the crawl frontier
+"""
+
+import pytest
+from components.discovery.frontier import BloomFilter, CrawlFrontier
+from components.discovery.web_scraper import LoopDiscovery
+
+
+def make_discovery(url):
+    return LoopDiscovery(
+        source_url=url,
+        source_type="github",
+        content_type="text_description",
+        raw_content="",
+        metadata={}
+    )
+
+
+class TestBloomFilter:
+    """Test BloomFilter functionality"""
+
+    def test_membership(self):
+        """Test that added keys are always reported present"""
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"https://a.test/{i}")
+
+        assert all(f"https://a.test/{i}" in bloom for i in range(1000))
+        false_positives = sum(f"https://b.test/{i}" in bloom for i in range(1000))
+        assert false_positives < 50
+
+    def test_save_and_load(self, tmp_path):
+        """Test that the filter round-trips through disk"""
+        bloom = BloomFilter(capacity=100)
+        bloom.add("https://a.test/")
+        bloom.save(tmp_path / "seen.bloom")
+
+        loaded = BloomFilter.load(tmp_path / "seen.bloom")
+        assert "https://a.test/" in loaded
+        assert loaded.count == 1
+        assert loaded.num_bits == bloom.num_bits
+
+
+class TestCrawlFrontier:
+    """Test CrawlFrontier functionality"""
+
+    def test_filter_new_dedupes_within_run(self, tmp_path):
+        """Test that repeated URLs in one batch are kept once"""
+        frontier = CrawlFrontier(str(tmp_path))
+        discoveries = [make_discovery("https://a.test/1"), make_discovery("https://a.test/1")]
+
+        assert len(frontier.filter_new(discoveries)) == 1
+        assert frontier.skipped == 1
+
+    def test_survives_restart(self, tmp_path):
+        """Test that seen URLs are remembered after reopening"""
+        frontier = CrawlFrontier(str(tmp_path))
+        frontier.add("https://a.test/1")
+        frontier.close()
+
+        reopened = CrawlFrontier(str(tmp_path))
+        assert "https://a.test/1" in reopened
+        assert "https://a.test/2" not in reopened
+
+    def test_rollback_forgets_uncommitted(self, tmp_path):
+        """Test that URLs marked after the last commit can be seen again"""
+        frontier = CrawlFrontier(str(tmp_path))
+        frontier.add("https://a.test/1")
+        frontier.commit()
+        frontier.add("https://a.test/2")
+
+        frontier.rollback()
+        assert "https://a.test/1" in frontier
+        assert "https://a.test/2" not in frontier
+
+        reopened = CrawlFrontier(str(tmp_path))
+        assert "https://a.test/2" not in reopened
@@ -0,0 +1,123 @@
+"""
+Unit tests for the HTML parser backends
+"""
+
+import pytest
+from components.discovery.html_parsers import (
+    LxmlParserBackend,
+    SoupParserBackend,
+    get_parser_backend
+)
+from components.discovery.web_scraper import GitHubScraperAgent, RedditScraperAgent
+
+
+GITHUB_PAGE = b"""
+<html><head><script>var x = "<article class='Box-row'>";</script></head><body>
+<article class="Box-row">
+  <h2 class="h3 lh-condensed"><a href="/octo/auto-bot"> octo / <span>auto-bot</span> </a></h2>
+  <p class="col-9 color-fg-muted">Workflow <!-- hidden --> automation bot</p>
+  <span class="d-inline-block float-sm-right">1,204 stars today</span>
+</article>
+<article class="Box-row">
+  <h2 class="h3"><a href="/octo/paint">octo / paint</a></h2>
+</article>
+<article class="Box-row">
+  <h2 class="h3">no link scheduler</h2>
+</article>
+</body></html>
+"""
+
+REDDIT_PAGE = b"""
+<html><body><div id="siteTable">
+<div class="thing id-t3_a odd link">
+  <div class="score unvoted">42</div>
+  <a class="title may-blank" href="/r/Python/comments/a/">Automate the boring stuff</a>
+  <a class="author may-blank">alice</a>
+  <a class="subreddit hover">r/Python</a>
+</div>
+<div class="thing id-t3_b even link">
+  <a class="title" href="https://example.com/post">Python script for backups</a>
+</div>
+</div></body></html>
+"""
+
+CODE_PAGE = b"""
+<html><body>
+<pre>import os
+for name in os.listdir('.'):
+    print(name)  # list the files</pre>
+<code>x = 1</code>
+</body></html>
+"""
+
+BACKENDS = [SoupParserBackend(), LxmlParserBackend()]
+
+
+class TestParserBackends:
+    """Test that backends agree on extracted fields"""
+
+    @pytest.mark.parametrize("backend", BACKENDS, ids=lambda b: b.name)
+    def test_github_rows(self, backend):
+        """Test GitHub row extraction"""
+        rows = backend.extract_rows(GITHUB_PAGE, GitHubScraperAgent.ROW_SPEC)
+
+        assert len(rows) == 3
+        assert rows[0]["title"] == "octo /auto-bot"
+        assert rows[0]["href"] == "/octo/auto-bot"
+        assert rows[0]["description"] == "Workflowautomation bot"
+        assert rows[0]["stars"] == "1,204 stars today"
+        assert rows[1]["description"] is None
+        assert rows[2]["href"] is None
+
+    @pytest.mark.parametrize("backend", BACKENDS, ids=lambda b: b.name)
+    def test_reddit_rows_with_limit(self, backend):
+        """Test Reddit row extraction with a row limit"""
+        rows = backend.extract_rows(REDDIT_PAGE, RedditScraperAgent.ROW_SPEC, limit=1)
+
+        assert rows == [{
+            "title": "Automate the boring stuff",
+            "href": "/r/Python/comments/a/",
+            "upvotes": "42",
+            "author": "alice",
+            "subreddit": "r/Python"
+        }]
+
+    @pytest.mark.parametrize("backend", BACKENDS, ids=lambda b: b.name)
+    def test_code_blocks(self, backend):
+        """Test code block extraction and the minimum length filter"""
+        blocks = backend.extract_code_blocks(CODE_PAGE)
+
+        assert len(blocks) == 1
+        assert blocks[0].startswith("import os")
+
+    def test_backends_agree_on_empty_page(self):
+        """Test that an empty page yields no rows"""
+        for backend in BACKENDS:
+            assert backend.extract_rows(b"", RedditScraperAgent.ROW_SPEC) == []
+
+    def test_get_parser_backend(self):
+        """Test backend selection"""
+        assert get_parser_backend().name == "lxml"
+        assert get_parser_backend("bs4").name == "bs4"
+        with pytest.raises(ValueError):
+            get_parser_backend("regex")
+
+
+class TestAgentParsePage:
+    """Test agents parsing pages through the backend"""
+
+    def test_github_parse_page(self):
+        """Test that rows without a link are skipped"""
+        agent = GitHubScraperAgent()
+        discoveries = agent.parse_page("https://github.com/trending/python", GITHUB_PAGE)
+
+        assert [d.source_url for d in discoveries] == ["https://github.com/octo/auto-bot"]
+
+    def test_reddit_parse_page(self):
+        """Test URL normalisation and metadata defaults"""
+        agent = RedditScraperAgent()
+        discoveries = agent.parse_page("https://old.reddit.com/r/Python/", REDDIT_PAGE)
+
+        assert discoveries[0].source_url == "https://old.reddit.com/r/Python/comments/a/"
+        assert discoveries[1].metadata["author"] == "unknown"
+        assert discoveries[1].metadata["upvotes"] == "0"
@@ -0,0 +1,161 @@
+"""
+Unit tests for the async HTTP fetch engine
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from components.discovery.http_cache import HTTPCache
+from components.discovery.http_engine import AsyncFetchEngine
+from components.discovery.web_scraper import GitHubScraperAgent, RedditScraperAgent
+
+
+GITHUB_PAGE = """
+<html><body>
+<article class="Box-row">
+  <h2 class="h3"><a href="/octo/auto-bot">octo / auto-bot</a></h2>
+  <p class="col-9">Workflow automation bot</p>
+  <span class="d-inline-block float-sm-right">120 stars today</span>
+</article>
+<article class="Box-row">
+  <h2 class="h3"><a href="/octo/paint">octo / paint</a></h2>
+  <p class="col-9">A drawing program</p>
+</article>
+</body></html>
+"""
+
+
+class TestAsyncFetchEngine:
+    """Test AsyncFetchEngine functionality"""
+
+    def test_fetch_all_preserves_order(self):
+        """Test that concurrent fetches are returned in request order"""
+        def handler(request):
+            return httpx.Response(200, text=request.url.path)
+
+        async def run():
+            async with AsyncFetchEngine(transport=httpx.MockTransport(handler)) as engine:
+                return await engine.fetch_all(["https://a.test/1", "https://b.test/2"])
+
+        responses = asyncio.run(run())
+        assert [r.text for r in responses] == ["/1", "/2"]
+
+    def test_per_host_limit(self):
+        """Test that the per-host limit caps in-flight requests to a host"""
+        in_flight = {"now": 0, "peak": 0}
+
+        async def handler(request):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return httpx.Response(200)
+
+        async def run():
+            engine = AsyncFetchEngine(max_per_host=2, transport=httpx.MockTransport(handler))
+            async with engine:
+                await engine.fetch_all([f"https://a.test/{i}" for i in range(6)])
+
+        asyncio.run(run())
+        assert in_flight["peak"] == 2
+
+    def test_user_agent_header(self):
+        """Test that the bot User-Agent is sent"""
+        def handler(request):
+            return httpx.Response(200, text=request.headers["User-Agent"])
+
+        async def run():
+            async with AsyncFetchEngine(transport=httpx.MockTransport(handler)) as engine:
+                return await engine.fetch("https://a.test/")
+
+        assert "AGI-OS-Bot" in asyncio.run(run()).text
+
+
+class TestAgentScrapeAsync:
+    """Test agents running on the fetch engine"""
+
+    def test_github_scrape_async(self):
+        """Test GitHub agent fetching all target URLs through the engine"""
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            return httpx.Response(200, text=GITHUB_PAGE)
+
+        agent = GitHubScraperAgent()
+
+        async def run():
+            async with AsyncFetchEngine(transport=httpx.MockTransport(handler)) as engine:
+                return await agent.scrape_async(engine)
+
+        discoveries = asyncio.run(run())
+        assert len(requested) == len(agent.target_urls)
+        assert len(discoveries) == len(agent.target_urls)
+        assert discoveries[0].source_url == "https://github.com/octo/auto-bot"
+        assert discoveries[0].metadata["author"] == "octo"
+
+    def test_failed_url_is_isolated(self):
+        """Test that one failing URL does not lose the other pages"""
+        def handler(request):
+            if "learnpython" in str(request.url):
+                return httpx.Response(500)
+            return httpx.Response(200, text="<div class='thing'><a class='title' href='/r/x'>python script</a></div>")
+
+        agent = RedditScraperAgent()
+
+        async def run():
+            async with AsyncFetchEngine(transport=httpx.MockTransport(handler)) as engine:
+                return await agent.scrape_async(engine)
+
+        discoveries = asyncio.run(run())
+        assert len(discoveries) == len(agent.target_urls) - 1
+
+
+class TestHTTPCache:
+    """Test HTTPCache conditional-GET support"""
+
+    def test_revalidation_short_circuits_parsing(self, tmp_path):
+        """Test that a 304 sends validators and skips parsing"""
+        seen_headers = []
+
+        def handler(request):
+            seen_headers.append(dict(request.headers))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, text=GITHUB_PAGE, headers={"ETag": '"v1"'})
+
+        cache = HTTPCache(str(tmp_path / "cache.db"))
+        agent = GitHubScraperAgent()
+        agent.target_urls = agent.target_urls[:1]
+
+        async def run():
+            engine = AsyncFetchEngine(transport=httpx.MockTransport(handler), cache=cache)
+            async with engine:
+                first = await agent.scrape_url(engine, agent.target_urls[0])
+                second = await agent.scrape_url(engine, agent.target_urls[0])
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert len(first) == 1
+        assert second == []
+        assert seen_headers[1]["if-none-match"] == '"v1"'
+        assert cache.hits == 1
+        assert cache.get(agent.target_urls[0]) == GITHUB_PAGE.encode()
+
+    def test_size_eviction(self, tmp_path):
+        """Test that least recently used entries are evicted over max_bytes"""
+        cache = HTTPCache(str(tmp_path / "cache.db"), max_bytes=15)
+        for i in range(3):
+            response = httpx.Response(200, content=b"x" * 6, headers={"ETag": f'"{i}"'})
+            cache.update(f"https://a.test/{i}", response)
+
+        assert cache.total_size() <= 15
+        assert cache.get("https://a.test/0") is None
+        assert cache.get("https://a.test/2") is not None
+
+    def test_uncacheable_response(self, tmp_path):
+        """Test that responses without validators are not stored"""
+        cache = HTTPCache(str(tmp_path / "cache.db"))
+        cache.update("https://a.test/", httpx.Response(200, content=b"body"))
+        assert cache.validators("https://a.test/") == {}
@@ -0,0 +1,74 @@
+"""
+Unit tests for the HTTP record/replay harness and discovery benchmark
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from benchmarks.bench_discovery import main as run_benchmark, synthetic_archive
+from components.discovery.http_engine import AsyncFetchEngine
+from components.discovery.http_fixtures import FixtureArchive, RecordingTransport, ReplayTransport
+from components.discovery.web_scraper import ScraperOrchestrator
+
+
+class TestRecordReplay:
+    """Test recording responses and replaying them offline"""
+
+    def test_record_save_load_replay(self, tmp_path):
+        """Test that a recorded response replays byte-for-byte"""
+        def live(request):
+            return httpx.Response(200, text="<p>hello</p>", headers={"ETag": '"v1"'})
+
+        archive = FixtureArchive()
+
+        async def fetch(transport):
+            async with AsyncFetchEngine(transport=transport) as engine:
+                return await engine.fetch("https://a.test/page?x=1")
+
+        recorded = asyncio.run(fetch(RecordingTransport(archive, httpx.MockTransport(live))))
+        archive.save(str(tmp_path / "fixtures.json.gz"))
+
+        loaded = FixtureArchive.load(str(tmp_path / "fixtures.json.gz"))
+        replayed = asyncio.run(fetch(ReplayTransport(loaded)))
+
+        assert replayed.status_code == 200
+        assert replayed.content == recorded.content == b"<p>hello</p>"
+        assert replayed.headers["ETag"] == '"v1"'
+
+    def test_replay_miss(self):
+        """Test that unrecorded URLs return 404 and are counted"""
+        transport = ReplayTransport(FixtureArchive())
+
+        async def fetch():
+            async with AsyncFetchEngine(transport=transport) as engine:
+                return await engine.fetch("https://a.test/")
+
+        assert asyncio.run(fetch()).status_code == 404
+        assert transport.misses == 1
+
+    def test_orchestrator_runs_offline(self):
+        """Test the full orchestrator path against synthetic fixtures"""
+        archive = synthetic_archive(github_rows=4, reddit_rows=3, reddit_pages=2)
+        transport = ReplayTransport(archive)
+        orchestrator = ScraperOrchestrator(parse_workers=0, transport=transport)
+        orchestrator.scheduler = None
+
+        discoveries = asyncio.run(orchestrator.run_all_agents())
+
+        assert transport.misses == 0
+        assert transport.requests == len(archive)
+        assert {d.source_type for d in discoveries} == {"github", "reddit"}
+
+
+class TestDiscoveryBenchmark:
+    """Smoke test for the benchmark suite"""
+
+    def test_benchmark_reports_metrics(self):
+        """Test that the benchmark reports every headline metric"""
+        results = run_benchmark(["--repeat", "1", "--parse-workers", "0", "--json"])
+
+        assert results["orchestrator"]["pages"] == results["fixtures"]
+        assert results["orchestrator"]["items_per_second"] > 0
+        assert results["parse"]["parse_ms_per_page"] > 0
+        assert results["peak_rss_mb"] > 0
@@ -0,0 +1,38 @@
+"""
+Unit tests for the Aho-Corasick keyword matcher
+"""
+
+import pytest
+from components.curation.keyword_matcher import KeywordMatcher
+
+
+class TestKeywordMatcher:
+    """Test KeywordMatcher functionality"""
+
+    def test_overlapping_hits(self):
+        """Test that nested and overlapping keywords are all reported"""
+        matcher = KeywordMatcher(["test", "testing", "sting", "ai"])
+        hits = sorted(matcher.finditer("Unit TESTING with AI"))
+
+        assert hits == [(5, "test"), (5, "testing"), (7, "sting"), (18, "ai")]
+
+    def test_word_boundary(self):
+        """Test that word-boundary mode drops hits inside longer words"""
+        matcher = KeywordMatcher(["ai", "how to"])
+
+        assert matcher.find_all("send an email") == {"ai"}
+        assert matcher.find_all("send an email", word_boundary=True) == set()
+        assert matcher.find_all("AI: how to start", word_boundary=True) == {"ai", "how to"}
+
+    def test_group_hits(self):
+        """Test that a keyword shared by several groups counts for each"""
+        matcher = KeywordMatcher.from_groups({"beginner": ["tutorial", "learn"], "tutorial": ["tutorial", "guide"]})
+
+        assert matcher.group_hits("A tutorial") == {"beginner": {"tutorial"}, "tutorial": {"tutorial"}}
+        assert matcher.group_hits("nothing here") == {}
+
+    def test_search(self):
+        """Test any-hit search, including an empty keyword list"""
+        assert KeywordMatcher(["bot"]).search("Build a BOT")
+        assert not KeywordMatcher(["bot"]).search("Build a tool")
+        assert not KeywordMatcher([]).search("anything")
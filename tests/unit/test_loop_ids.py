@@ -0,0 +1,76 @@
+"""
+Unit tests for stable loop IDs
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+from components.curation.feature_extractor import FeatureExtractor
+from components.curation.feature_store import is_parquet, save_features
+from components.curation.loop_ids import loop_id_of, make_loop_id
+from components.discovery.web_scraper import LoopDiscovery
+from main import AGIOSPipeline
+
+
+def make_discovery(i):
+    return LoopDiscovery(
+        source_url=f"https://github.com/octo/repo-{i}",
+        source_type="github",
+        content_type="text_description",
+        raw_content="Automation bot that schedules tasks",
+        metadata={"title": f"octo / repo-{i}", "stars": "10 stars today", "author": "octo"}
+    )
+
+
+class TestLoopIds:
+    """Test loop ID generation"""
+
+    def test_reproducible_across_processes(self):
+        """Test that IDs do not depend on PYTHONHASHSEED"""
+        code = "from components.curation.loop_ids import make_loop_id; print(make_loop_id('github', 'https://x.test/a'))"
+        ids = {
+            subprocess.run(
+                [sys.executable, "-c", code],
+                env={**os.environ, "PYTHONHASHSEED": seed},
+                capture_output=True, text=True, check=True
+            ).stdout.strip()
+            for seed in ("1", "2")
+        }
+        assert ids == {make_loop_id("github", "https://x.test/a")}
+
+    def test_carried_through_features(self):
+        """Test that discoveries and their features share one ID"""
+        discovery = make_discovery(1).to_dict()
+        features = FeatureExtractor(workers=0).extract_features(discovery)
+
+        assert discovery["loop_id"] == features.loop_id == make_loop_id("github", discovery["source_url"])
+        del discovery["loop_id"]
+        assert loop_id_of(discovery) == features.loop_id
+
+
+class TestFilterApprovedLoops:
+    """Test the approved-loop join in the pipeline"""
+
+    @pytest.mark.parametrize("features_name", ["extracted_features.json", "extracted_features.parquet"])
+    def test_joins_scores_features_and_discoveries(self, tmp_path, features_name):
+        """Test that every approved score is matched to its own discovery, from JSON or Parquet features"""
+        if is_parquet(features_name):
+            pytest.importorskip("pyarrow")
+        pipeline = AGIOSPipeline(data_dir=str(tmp_path))
+        pipeline.features_file = tmp_path / features_name
+        discoveries = [make_discovery(i).to_dict() for i in range(50)]
+        features = [{"loop_id": d["loop_id"], "source_url": d["source_url"]} for d in discoveries]
+        scores = [
+            {"loop_id": d["loop_id"], "approval_decision": "approved" if i % 2 else "rejected"}
+            for i, d in enumerate(discoveries)
+        ]
+        save_features(pipeline.features_file, features)
+        for path, data in ((pipeline.discoveries_file, discoveries), (pipeline.scores_file, scores)):
+            path.write_text(json.dumps(data))
+
+        assert pipeline.filter_approved_loops() == 25
+        approved = json.loads(pipeline.approved_file.read_text())
+        assert all(loop["discovery"]["loop_id"] == loop["loop_id"] == loop["features"]["loop_id"] for loop in approved)
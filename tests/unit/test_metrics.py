@@ -0,0 +1,87 @@
+"""
+Unit tests for scraper metrics
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from components.discovery.http_engine import AsyncFetchEngine
+from components.discovery.metrics import ScraperMetrics
+from components.discovery.web_scraper import RedditScraperAgent, ScraperOrchestrator
+
+
+REDDIT_PAGE = (
+    '<div class="thing"><a class="title" href="/r/Python/comments/a/">My python script</a></div>'
+    '<div class="thing"><a class="title" href="/r/Python/comments/b/">Weekly thread</a></div>'
+)
+
+
+def handler(request):
+    if request.url.path.startswith("/r/automation/"):
+        return httpx.Response(500)
+    return httpx.Response(200, text=REDDIT_PAGE)
+
+
+@pytest.fixture
+def orchestrator(tmp_path):
+    orchestrator = ScraperOrchestrator(parse_workers=0, metrics_path=str(tmp_path / "scraper_metrics.prom"))
+    orchestrator.agents = [RedditScraperAgent()]
+    orchestrator.agents[0].max_pages = 1
+    orchestrator.create_engine = lambda: AsyncFetchEngine(transport=httpx.MockTransport(handler))
+    return orchestrator
+
+
+class TestScraperMetrics:
+    """Test ScraperMetrics functionality"""
+
+    def test_run_summary_is_per_run(self):
+        """Test that the summary only covers what happened since begin_run"""
+        metrics = ScraperMetrics()
+        metrics.observe_parse("a", 0.1, items=1, checked=4, matched=1)
+        metrics.begin_run()
+        metrics.observe_parse("a", 0.1, items=2, checked=4, matched=2)
+
+        summary = metrics.run_summary()["a"]
+        assert summary["items"] == 2
+        assert summary["keyword_match_ratio"] == 0.5
+
+    def test_registries_are_independent(self):
+        """Test that two instances never share or clash on metrics"""
+        a, b = ScraperMetrics(), ScraperMetrics()
+        a.record_error("agent", "fetch")
+
+        assert b.run_summary() == {}
+        assert b"scraper_errors_total" in a.exposition()
+
+
+class TestOrchestratorMetrics:
+    """Test metrics collected by a scraper run"""
+
+    def test_run_metrics(self, orchestrator):
+        """Test fetch, parse, keyword and error figures for one run"""
+        asyncio.run(orchestrator.run_all_agents())
+        summary = orchestrator.run_summary()["Reddit Scraper"]
+
+        assert summary["fetches"] == 4
+        assert summary["http_errors"] == 1
+        assert summary["pages_parsed"] == 3
+        assert summary["keyword_match_ratio"] == 0.5
+        assert summary["new_discoveries"] == 3
+        assert orchestrator.metrics.registry.get_sample_value(
+            "scraper_in_flight_requests", {"agent": "Reddit Scraper"}
+        ) == 0
+
+    def test_metrics_file(self, orchestrator, tmp_path):
+        """Test that each run dumps the registry in the Prometheus text format"""
+        asyncio.run(orchestrator.run_all_agents())
+
+        text = (tmp_path / "scraper_metrics.prom").read_text()
+        assert 'scraper_fetch_seconds_count{agent="Reddit Scraper"} 4.0' in text
+
+    def test_pool_keeps_keyword_counts(self, orchestrator):
+        """Test that keyword counts made in parse workers reach the registry"""
+        orchestrator.parse_workers = 1
+        asyncio.run(orchestrator.run_all_agents())
+
+        assert orchestrator.run_summary()["Reddit Scraper"]["keyword_checks"] == 6
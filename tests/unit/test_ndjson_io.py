@@ -0,0 +1,101 @@
+"""
+Unit tests for NDJSON discovery serialization
+"""
+
+import json
+
+import pytest
+from components.discovery.ndjson_io import NDJSONWriter, is_ndjson, load_records, read_ndjson, save_records
+from components.discovery.web_scraper import LoopDiscovery, ScraperOrchestrator
+
+
+def make_discovery(i):
+    return LoopDiscovery(
+        source_url=f"https://github.com/octo/repo-{i}",
+        source_type="github",
+        content_type="text_description",
+        raw_content=f"Automation bot number {i}",
+        metadata={"title": f"octo / repo-{i}"},
+        discovery_timestamp="2025-10-21T00:00:00"
+    )
+
+
+class TestNDJSON:
+    """Test NDJSONWriter and readers"""
+
+    @pytest.mark.parametrize("name", ["items.ndjson", "items.ndjson.gz"])
+    def test_round_trip(self, tmp_path, name):
+        """Test that written discoveries read back identically"""
+        with NDJSONWriter(tmp_path / name) as writer:
+            writer.write_all(make_discovery(i) for i in range(3))
+
+        records = list(read_ndjson(tmp_path / name))
+        assert records == [make_discovery(i).to_dict() for i in range(3)]
+
+    def test_append_compressed(self, tmp_path):
+        """Test that appending to a compressed log keeps earlier records"""
+        for i in range(2):
+            with NDJSONWriter(tmp_path / "log.ndjson.gz") as writer:
+                writer.write(make_discovery(i))
+
+        assert len(list(read_ndjson(tmp_path / "log.ndjson.gz"))) == 2
+
+    def test_flushes_as_written(self, tmp_path):
+        """Test that items are on disk before the writer is closed"""
+        writer = NDJSONWriter(tmp_path / "items.ndjson")
+        writer.write(make_discovery(0))
+
+        assert len(list(read_ndjson(tmp_path / "items.ndjson"))) == 1
+        writer.close()
+
+    def test_truncated_last_line_skipped(self, tmp_path):
+        """Test that a record cut off by a crash does not break reading"""
+        path = tmp_path / "items.ndjson"
+        path.write_text(json.dumps({"a": 1}) + "\n" + '{"a": ')
+
+        assert list(read_ndjson(path)) == [{"a": 1}]
+
+    def test_load_records(self, tmp_path):
+        """Test that JSON arrays and NDJSON files load the same way"""
+        (tmp_path / "items.json").write_text(json.dumps([{"a": 1}]))
+        (tmp_path / "items.jsonl").write_text(json.dumps({"a": 1}) + "\n")
+
+        assert list(load_records(tmp_path / "items.json")) == list(load_records(tmp_path / "items.jsonl"))
+        assert is_ndjson("x.ndjson.gz") and not is_ndjson("x.json.gz")
+
+    @pytest.mark.parametrize("name", ["items.json", "items.ndjson"])
+    def test_save_records(self, tmp_path, name):
+        """Test that records are written compactly, one per line, in either format"""
+        records = [{"a": i, "nested": {"b": [i, i]}} for i in range(3)]
+        assert save_records(tmp_path / name, iter(records)) == 3
+
+        lines = (tmp_path / name).read_text().splitlines()
+        assert len([line for line in lines if '"a"' in line]) == 3
+        assert list(load_records(tmp_path / name)) == records
+
+
+class TestCompactDiscovery:
+    """Test the slotted LoopDiscovery representation"""
+
+    def test_slots_and_interning(self):
+        """Test that discoveries carry no __dict__ and share type strings"""
+        a = make_discovery(1)
+        b = LoopDiscovery.from_dict(json.loads(json.dumps(a.to_dict())))
+
+        assert not hasattr(a, "__dict__")
+        assert a.source_type is b.source_type
+        assert a.content_type is b.content_type
+
+    def test_from_dict_round_trip(self):
+        """Test that from_dict restores every field, timestamp included"""
+        discovery = make_discovery(1)
+        assert LoopDiscovery.from_dict(discovery.to_dict()).to_dict() == discovery.to_dict()
+
+    @pytest.mark.parametrize("name", ["discoveries.json", "discoveries.ndjson"])
+    def test_save_discoveries(self, tmp_path, name):
+        """Test that both output formats hold the same records"""
+        orchestrator = ScraperOrchestrator(parse_workers=0)
+        orchestrator.all_discoveries = [make_discovery(i) for i in range(3)]
+        orchestrator.save_discoveries(str(tmp_path / name))
+
+        assert list(load_records(tmp_path / name)) == [make_discovery(i).to_dict() for i in range(3)]
@@ -0,0 +1,196 @@
+"""
+Unit tests for the main pipeline orchestrator
+"""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+from components.discovery.http_engine import AsyncFetchEngine
+from components.discovery.distributed import InMemoryBroker
+from components.discovery.ndjson_io import load_records
+from main import AGIOSPipeline
+
+
+GITHUB_PAGE = """
+<article class="Box-row">
+  <h2 class="h3"><a href="/octo/{slug}">octo / {slug}</a></h2>
+  <p class="col-9">{description}</p>
+  <span class="d-inline-block float-sm-right">2,000 stars today</span>
+</article>
+"""
+
+GITHUB_DESCRIPTIONS = {
+    "all": "Automate your workflow with this api wrapper bot and scraper for data processing. "
+           "Includes a step by step tutorial and full documentation so you can automate every task.",
+    "daily": "A scheduler that will automate invoices, reminders and reports for small teams. "
+             "Ships with documentation, a guide for beginners and a tutorial on deploying the bot.",
+    "weekly": "Telegram bot framework to automate group moderation and polls from one config file. "
+              "Read the docs for the plugin api; the tutorial walks through writing your first task."
+}
+
+REDDIT_PAGE = """
+<div class="thing"><a class="title" href="/r/{slug}/comments/a/">My python script to automate {slug} chores</a></div>
+"""
+
+
+def handler(request):
+    if request.url.host == "github.com":
+        since = request.url.params.get("since", "all")
+        page = GITHUB_PAGE.format(slug=f"{since}-bot", description=GITHUB_DESCRIPTIONS[since])
+        return httpx.Response(200, text=page)
+    return httpx.Response(200, text=REDDIT_PAGE.format(slug=request.url.path.split("/")[2]))
+
+
+def mock_engine():
+    return AsyncFetchEngine(transport=httpx.MockTransport(handler))
+
+
+@pytest.fixture
+def pipeline(tmp_path):
+    pipeline = AGIOSPipeline(data_dir=str(tmp_path))
+    pipeline.scraper.create_engine = mock_engine
+    return pipeline
+
+
+class TestStreamingPipeline:
+    """Test the streaming pipeline mode"""
+
+    def test_stream_discoveries(self, pipeline):
+        """Test that the orchestrator yields every parsed discovery"""
+        async def collect():
+            return [d async for d in pipeline.scraper.stream_discoveries(queue_size=1)]
+
+        discoveries = asyncio.run(collect())
+        assert len(discoveries) == 7
+        assert pipeline.scraper.all_discoveries == []
+
+    def test_streaming_pipeline(self, pipeline):
+        """Test that loops flow through extraction and scoring"""
+        stats = asyncio.run(pipeline.run_streaming_pipeline(queue_size=2))
+
+        assert stats["discoveries"] == 7
+        assert stats["features_extracted"] == 7
+        assert stats["approved_loops"] == 3
+        assert stats["time_to_first_approved_seconds"] is not None
+        assert not pipeline.features_file.exists()
+
+        with open(pipeline.pipeline_stats_file) as f:
+            assert json.load(f)["discovery_metrics"]["GitHub Scraper"]["new_discoveries"] == 3
+
+        with open(pipeline.approved_file) as f:
+            approved = json.load(f)
+        assert len(approved) == 3
+        assert approved[0]["discovery"]["source_url"].startswith("https://github.com/octo/")
+
+    def test_frontier_skips_seen_urls(self, pipeline, tmp_path):
+        """Test that a second run skips URLs seen by the first"""
+        asyncio.run(pipeline.run_streaming_pipeline())
+
+        rerun = AGIOSPipeline(data_dir=str(tmp_path))
+        rerun.scraper.create_engine = mock_engine
+        # Recrawl every source regardless of its next-due time
+        rerun.scraper.recrawl = None
+        stats = asyncio.run(rerun.run_streaming_pipeline())
+
+        assert stats["discoveries"] == 0
+        assert rerun.scraper.frontier.skipped == 7
+
+    def test_failed_run_keeps_urls_unseen(self, pipeline, tmp_path):
+        """Test that loops from a run that failed before scoring are rediscovered"""
+        def broken():
+            raise RuntimeError("extractor down")
+
+        pipeline.scraper.recrawl = None
+        pipeline.run_feature_extraction = broken
+        with pytest.raises(RuntimeError):
+            asyncio.run(pipeline.run_full_pipeline())
+
+        rerun = AGIOSPipeline(data_dir=str(tmp_path))
+        rerun.scraper.create_engine = mock_engine
+        rerun.scraper.recrawl = None
+        assert asyncio.run(rerun.run_discovery()) == 7
+
+    def test_streaming_pipeline_drops_duplicates(self, pipeline):
+        """Test that cross-posted loops are dropped before scoring"""
+        def cross_posted():
+            def handler(request):
+                return httpx.Response(200, text=REDDIT_PAGE.format(slug="Python").replace(
+                    "/r/Python/", request.url.path
+                ))
+
+            return AsyncFetchEngine(transport=httpx.MockTransport(handler))
+
+        pipeline.scraper.agents = pipeline.scraper.agents[1:]
+        pipeline.scraper.create_engine = cross_posted
+        stats = asyncio.run(pipeline.run_streaming_pipeline())
+
+        assert stats["discoveries"] == 4
+        assert stats["duplicates_dropped"] == 3
+        assert stats["features_extracted"] == 1
+
+    def test_streaming_pipeline_sinks(self, pipeline):
+        """Test that intermediate JSON sinks are valid arrays"""
+        asyncio.run(pipeline.run_streaming_pipeline(save_intermediate=True))
+
+        with open(pipeline.scores_file) as f:
+            assert len(json.load(f)) == 7
+        with open(pipeline.discoveries_file) as f:
+            assert len(json.load(f)) == 7
+
+    def test_rescore_after_streaming(self, pipeline):
+        """Test that a streaming run saves the component vectors --rescore needs"""
+        asyncio.run(pipeline.run_streaming_pipeline(save_intermediate=True))
+        pipeline.quality_scorer.APPROVAL_THRESHOLD = 0.0
+
+        report = pipeline.rescore_loops()
+        with open(pipeline.scores_file) as f:
+            scores = json.load(f)
+        assert report["loops"] == 7
+        assert all(score["approval_decision"] == "approved" for score in scores)
+
+    def test_rescore_rejects_stale_state(self, pipeline):
+        """Test that component vectors from another run fail clearly instead of with a KeyError"""
+        asyncio.run(pipeline.run_streaming_pipeline(save_intermediate=True))
+        with open(pipeline.scores_file) as f:
+            scores = json.load(f)
+        scores[0]["loop_id"] = "github_not_in_state"
+        with open(pipeline.scores_file, "w") as f:
+            json.dump(scores, f)
+
+        with pytest.raises(ValueError, match="does not match"):
+            pipeline.rescore_loops()
+
+    def test_rescore_without_state(self, pipeline):
+        """Test that --rescore before any scoring run explains what is missing"""
+        with pytest.raises(FileNotFoundError, match="before --rescore"):
+            pipeline.rescore_loops()
+
+
+class TestDistributedDiscovery:
+    """Test discovery through a broker"""
+
+    def test_memory_broker_runs_local_worker(self, tmp_path):
+        """Test that an in-process broker gets a worker instead of waiting forever"""
+        pipeline = AGIOSPipeline(data_dir=str(tmp_path), broker=InMemoryBroker(), crawl_timeout=10)
+        pipeline.scraper.transport = httpx.MockTransport(handler)
+        pipeline.scraper.scheduler = None
+        pipeline.scraper.enricher = None
+
+        assert asyncio.run(pipeline.run_discovery()) == 7
+
+    def test_daemon_uses_broker(self, tmp_path):
+        """Test that daemon cycles hand crawl jobs to the broker's workers"""
+        pipeline = AGIOSPipeline(data_dir=str(tmp_path), broker=InMemoryBroker(), crawl_timeout=10)
+        pipeline.scraper.transport = httpx.MockTransport(handler)
+        pipeline.scraper.scheduler = None
+        pipeline.scraper.enricher = None
+
+        async def crawl_locally():
+            raise AssertionError("daemon crawled locally despite --broker")
+
+        pipeline.scraper.run_all_agents = crawl_locally
+        asyncio.run(pipeline.run_daemon(max_cycles=1))
+
+        assert len(list(load_records(pipeline.discoveries_log))) == 7
@@ -0,0 +1,92 @@
+"""
+Unit tests for the politeness scheduler
+"""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+from components.discovery.http_engine import AsyncFetchEngine
+from components.discovery.politeness import PolitenessScheduler, TokenBucket
+
+
+class TestTokenBucket:
+    """Test TokenBucket functionality"""
+
+    def test_burst_then_wait(self):
+        """Test that a drained bucket reports the refill delay"""
+        bucket = TokenBucket(rate=2.0, capacity=2)
+        now = bucket.updated
+        for _ in range(2):
+            assert bucket.delay(now) == 0.0
+            bucket.consume()
+        assert bucket.delay(now) == pytest.approx(0.5)
+        assert bucket.delay(now + 0.5) == 0.0
+
+
+class TestPolitenessScheduler:
+    """Test PolitenessScheduler functionality"""
+
+    def test_host_rates(self):
+        """Test that known hosts get their own rate"""
+        scheduler = PolitenessScheduler(default_rate=3.0)
+        assert scheduler.bucket("old.reddit.com").rate == 0.5
+        assert scheduler.bucket("example.com").rate == 3.0
+
+    def test_retry_after_seconds(self):
+        """Test Retry-After parsing and the exponential fallback"""
+        scheduler = PolitenessScheduler(max_backoff=60)
+        assert scheduler.retry_after(httpx.Response(429, headers={"Retry-After": "7"}), 0) == 7
+        assert scheduler.retry_after(httpx.Response(429, headers={"Retry-After": "9999"}), 0) == 60
+        assert scheduler.retry_after(httpx.Response(429), 2) == 4
+
+    def test_429_is_retried(self):
+        """Test that a 429 backs off and retries instead of losing the page"""
+        calls = []
+
+        def handler(request):
+            calls.append(request.url.host)
+            if len(calls) == 1:
+                return httpx.Response(429, headers={"Retry-After": "0"})
+            return httpx.Response(200, text="ok")
+
+        scheduler = PolitenessScheduler(default_rate=100.0)
+
+        async def run():
+            engine = AsyncFetchEngine(transport=httpx.MockTransport(handler), scheduler=scheduler)
+            async with engine:
+                return await engine.fetch("https://a.test/")
+
+        response = asyncio.run(run())
+        assert response.status_code == 200
+        assert len(calls) == 2
+        assert scheduler.bucket("a.test").rate < 100.0
+
+    def test_throttled_host_does_not_stall_others(self):
+        """Test that a blocked host leaves other hosts free to proceed"""
+        scheduler = PolitenessScheduler(default_rate=100.0)
+        scheduler.penalize("https://slow.test/", 0.5)
+        finished = []
+
+        async def fetch(url):
+            await scheduler.acquire(url)
+            finished.append((scheduler.host_of(url), time.monotonic()))
+
+        async def run():
+            await asyncio.gather(fetch("https://slow.test/"), fetch("https://fast.test/"))
+
+        start = time.monotonic()
+        asyncio.run(run())
+        assert finished[0][0] == "fast.test"
+        assert finished[0][1] - start < 0.25
+
+    def test_reused_across_event_loops(self):
+        """Test that a scheduler whose host lock was contended works in a later event loop"""
+        scheduler = PolitenessScheduler(default_rate=100.0, burst=1)
+
+        async def run():
+            await asyncio.gather(*(scheduler.acquire("https://a.test/") for _ in range(3)))
+
+        asyncio.run(run())
+        asyncio.run(run())
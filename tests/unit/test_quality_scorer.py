@@ -0,0 +1,99 @@
+"""
+Unit tests for Quality Scorer component
+"""
+
+import json
+import random
+
+from components.curation.quality_scorer import HeuristicQualityScorer, QualityScore
+
+
+CATEGORIES = ['automation', 'web_scraping', 'bot', 'general', 'ml_ai', 'devops', 'testing']
+
+
+def random_features(n, seed=7):
+    rng = random.Random(seed)
+    return [
+        {
+            'loop_id': f"github_{i:020x}",
+            'popularity_score': rng.choice([0.0, 0.2, 0.7, 1.0, rng.random()]),
+            'has_code': rng.random() < 0.5,
+            'code_complexity': rng.random(),
+            'code_lines': rng.choice([0, 3, 100, 250, rng.randrange(400)]),
+            'description_length': rng.choice([0, 49, 50, 199, 200, rng.randrange(1000)]),
+            'has_tutorial': rng.random() < 0.4,
+            'has_documentation': rng.random() < 0.4,
+            'primary_category': rng.choice(CATEGORIES),
+            'recency_score': rng.random(),
+            'author_reputation': rng.choice([0.3, 0.6, rng.random()])
+        }
+        for i in range(n)
+    ]
+
+
+class TestScoreBatch:
+    """Test the vectorized scoring engine"""
+
+    def test_matches_score_loop_exactly(self):
+        """Test that every score, decision and confidence equals score_loop's"""
+        features = random_features(5000)
+        expected = [HeuristicQualityScorer().score_loop(f) for f in features]
+        batch = HeuristicQualityScorer().score_batch(HeuristicQualityScorer.feature_batch(features))
+
+        assert list(batch.loop_id) == [s.loop_id for s in expected]
+        assert batch.overall_score.tolist() == [s.overall_score for s in expected]
+        assert batch.confidence.tolist() == [s.confidence for s in expected]
+        assert list(batch.approval_decision) == [s.approval_decision for s in expected]
+
+    def test_components(self):
+        """Test that plain-list columns work and components are 0-1 subscores"""
+        features = random_features(50)
+        columns = {column: [f[column] for f in features] for column in HeuristicQualityScorer.FEATURE_COLUMNS}
+        scores = HeuristicQualityScorer().score_batch(columns)
+
+        assert len(scores) == 50
+        assert set(scores.components) == set(HeuristicQualityScorer.WEIGHTS)
+        assert all(((c >= 0) & (c <= 1)).all() for c in scores.components.values())
+
+    def test_summary_counts(self):
+        """Test that batch scoring updates the same counters as score_loop"""
+        features = random_features(300)
+        one_by_one, batched = HeuristicQualityScorer(), HeuristicQualityScorer()
+        for f in features:
+            one_by_one.score_loop(f)
+        batched.score_batch(HeuristicQualityScorer.feature_batch(features))
+
+        assert batched.get_summary() == one_by_one.get_summary()
+
+
+class TestLazyReasoning:
+    """Test reason codes and on-demand explanations"""
+
+    def test_explain(self):
+        """Test that explain renders the codes with the values they quote"""
+        features = random_features(1)[0]
+        features.update(popularity_score=0.8, has_code=True, code_complexity=0.42, primary_category='bot')
+        score = HeuristicQualityScorer().score_loop(features)
+
+        assert score.reason_codes[:2] == ['high_popularity', 'has_code']
+        assert score.explain()[:2] == ["High popularity (score: 0.80)", "Contains code (complexity: 0.42)"]
+        assert "High-value category: bot" in score.explain()
+        assert score.explain()[-1] == f"Overall score: {score.overall_score:.2f} → {score.approval_decision}"
+
+    def test_serialized_score_explains_itself(self):
+        """Test that scores read back from JSON render the same text, without storing it"""
+        score = HeuristicQualityScorer().score_loop(random_features(1)[0])
+        data = json.loads(json.dumps(score.to_dict()))
+
+        assert "reasoning" not in data
+        assert QualityScore.from_dict(data).explain() == score.explain()
+
+    def test_components_match_score_batch(self):
+        """Test that per-loop components equal the batch component arrays"""
+        features = random_features(200)
+        batch = HeuristicQualityScorer().score_batch(HeuristicQualityScorer.feature_batch(features))
+        scorer = HeuristicQualityScorer()
+
+        for i, f in enumerate(features):
+            components = scorer.score_loop(f).components
+            assert components == {name: batch.components[name][i] for name in components}
@@ -0,0 +1,99 @@
+"""
+Unit tests for the adaptive recrawl scheduler
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from components.discovery.http_engine import AsyncFetchEngine
+from components.discovery.recrawl import RecrawlScheduler
+from components.discovery.web_scraper import RedditScraperAgent, ScraperOrchestrator
+
+
+HOUR = 3600.0
+
+
+def simulate(scheduler, url, change_every, checks, start=0.0):
+    """Crawl a URL whenever it is due; its listing changes every change_every seconds"""
+    now = start
+    for _ in range(checks):
+        scheduler.record(url, str(int(now // change_every)), now=now)
+        now = scheduler.next_due(url)
+    return now
+
+
+class TestRecrawlScheduler:
+    """Test RecrawlScheduler functionality"""
+
+    def test_fast_sources_polled_more_often(self, tmp_path):
+        """Test that intervals follow each source's observed change rate"""
+        scheduler = RecrawlScheduler(str(tmp_path / "recrawl.db"))
+        simulate(scheduler, "https://old.reddit.com/r/Python/", change_every=600, checks=20)
+        simulate(scheduler, "https://github.com/trending/python?since=weekly", change_every=7 * 24 * HOUR, checks=20)
+
+        assert scheduler.interval("https://old.reddit.com/r/Python/") < HOUR
+        assert scheduler.interval("https://github.com/trending/python?since=weekly") > 12 * HOUR
+
+    def test_new_urls_due_first(self, tmp_path):
+        """Test that never-crawled URLs are due and ranked ahead of known ones"""
+        scheduler = RecrawlScheduler(str(tmp_path / "recrawl.db"))
+        scheduler.record("https://a.test/", "v1", now=0.0)
+
+        assert scheduler.due(["https://a.test/", "https://b.test/"], now=10.0) == ["https://b.test/"]
+        assert scheduler.due(["https://a.test/", "https://b.test/"], now=10 * HOUR) == ["https://b.test/", "https://a.test/"]
+        assert scheduler.due(["https://a.test/", "https://b.test/"], budget=1, now=10 * HOUR) == ["https://b.test/"]
+
+    def test_not_modified_counts_as_unchanged(self, tmp_path):
+        """Test that a 304 (no fingerprint) keeps the last fingerprint"""
+        scheduler = RecrawlScheduler(str(tmp_path / "recrawl.db"))
+        scheduler.record("https://a.test/", "v1", now=0.0)
+        scheduler.record("https://a.test/", None, now=HOUR)
+        scheduler.record("https://a.test/", "v1", now=2 * HOUR)
+
+        assert scheduler.interval("https://a.test/") > HOUR
+
+    def test_history_persists(self, tmp_path):
+        """Test that estimates survive reopening the database"""
+        scheduler = RecrawlScheduler(str(tmp_path / "recrawl.db"))
+        simulate(scheduler, "https://a.test/", change_every=600, checks=10)
+        interval = scheduler.interval("https://a.test/")
+        scheduler.close()
+
+        assert RecrawlScheduler(str(tmp_path / "recrawl.db")).interval("https://a.test/") == interval
+
+
+class TestOrchestratorRecrawl:
+    """Test recrawl scheduling in ScraperOrchestrator"""
+
+    @pytest.fixture
+    def orchestrator(self, tmp_path):
+        def handler(request):
+            return httpx.Response(
+                200,
+                text='<div class="thing"><a class="title" href="/r/Python/comments/a/">python script</a></div>'
+            )
+
+        orchestrator = ScraperOrchestrator(parse_workers=0, recrawl=RecrawlScheduler(str(tmp_path / "recrawl.db")))
+        orchestrator.agents = [RedditScraperAgent()]
+        orchestrator.create_engine = lambda: AsyncFetchEngine(transport=httpx.MockTransport(handler))
+        return orchestrator
+
+    def test_only_due_sources_crawled(self, orchestrator):
+        """Test that a second run skips sources that are not due yet"""
+        asyncio.run(orchestrator.run_all_agents())
+        assert orchestrator.due_sources() == {}
+
+    def test_request_budget(self, orchestrator):
+        """Test that at most request_budget sources are crawled per run"""
+        orchestrator.request_budget = 2
+        assert sum(len(urls) for urls in orchestrator.due_sources().values()) == 2
+
+    def test_crawl_forever(self, orchestrator):
+        """Test that the daemon loop yields one batch per cycle"""
+        async def run():
+            return [batch async for batch in orchestrator.crawl_forever(cycles=1)]
+
+        batches = asyncio.run(run())
+        assert len(batches) == 1
+        assert len(batches[0]) == 4
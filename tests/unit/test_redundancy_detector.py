@@ -0,0 +1,76 @@
+"""
+Unit tests for Redundancy Detector component
+"""
+
+import pytest
+from components.curation.redundancy_detector import MinHasher, RedundancyDetector
+
+
+README = (
+    "A lightweight workflow automation framework for Python. Schedule tasks, "
+    "retry failed jobs, send Slack alerts and keep an audit log of every run. "
+    "Ships with a command line interface and a web dashboard."
+)
+
+
+def discovery(url, title, content):
+    return {"source_url": url, "raw_content": content, "metadata": {"title": title}}
+
+
+class TestMinHasher:
+    """Test MinHasher functionality"""
+
+    def test_identical_texts(self):
+        """Test that identical texts have identical signatures"""
+        hasher = MinHasher()
+        assert MinHasher.similarity(hasher.signature(README), hasher.signature(README)) == 1.0
+
+    def test_similarity_tracks_overlap(self):
+        """Test that near-duplicates score higher than unrelated text"""
+        hasher = MinHasher()
+        base = hasher.signature(README)
+        fork = hasher.signature(README + " Forked with Docker support.")
+        other = hasher.signature("Interactive tutorial for learning pandas dataframes step by step")
+
+        assert MinHasher.similarity(base, fork) > 0.7
+        assert MinHasher.similarity(base, other) < 0.2
+
+
+class TestRedundancyDetector:
+    """Test RedundancyDetector functionality"""
+
+    def test_fork_is_clustered(self, tmp_path):
+        """Test that a fork is flagged as a duplicate of the original"""
+        detector = RedundancyDetector(str(tmp_path / "index.db"))
+        unique, duplicates = detector.filter_discoveries([
+            discovery("https://github.com/a/flow", "a / flow", README),
+            discovery("https://github.com/b/flow", "b / flow", README),
+            discovery("https://github.com/c/pandas-course", "c / pandas-course", "Learn pandas step by step")
+        ])
+
+        assert [d["source_url"] for d in unique] == ["https://github.com/a/flow", "https://github.com/c/pandas-course"]
+        assert duplicates[0]["duplicate_of"] == "https://github.com/a/flow"
+
+    def test_index_persists(self, tmp_path):
+        """Test that the index is reused after reopening"""
+        detector = RedundancyDetector(str(tmp_path / "index.db"))
+        detector.filter_discoveries([discovery("https://github.com/a/flow", "a / flow", README)])
+        detector.close()
+
+        reopened = RedundancyDetector(str(tmp_path / "index.db"))
+        result = reopened.check_discovery(discovery("https://reddit.com/r/Python/x", "", README))
+        assert result.duplicate_of == "https://github.com/a/flow"
+
+    def test_recheck_is_stable(self, tmp_path):
+        """Test that checking the same item twice gives the same answer"""
+        detector = RedundancyDetector(str(tmp_path / "index.db"))
+        first = detector.check("https://a.test/1", README)
+        again = detector.check("https://a.test/1", README)
+
+        assert not first.is_duplicate
+        assert not again.is_duplicate
+
+    def test_invalid_bands(self, tmp_path):
+        """Test that bands must divide num_perm"""
+        with pytest.raises(ValueError):
+            RedundancyDetector(str(tmp_path / "index.db"), num_perm=64, bands=10)
@@ -0,0 +1,83 @@
+"""
+Unit tests for incremental rescoring
+"""
+
+import numpy as np
+
+from components.curation.quality_scorer import DECISIONS, HeuristicQualityScorer
+from components.curation.rescoring import ScoreState, rescore
+from test_quality_scorer import random_features
+
+
+def scored_state(n=2000):
+    scorer = HeuristicQualityScorer()
+    features = random_features(n)
+    return features, ScoreState.from_scores([scorer.score_loop(f) for f in features], scorer)
+
+
+class TestRescore:
+    """Test rescoring from stored component vectors"""
+
+    def test_weight_change_matches_full_rescore(self):
+        """Test that new weights give exactly what scoring from scratch gives"""
+        features, state = scored_state()
+        scorer = HeuristicQualityScorer()
+        scorer.WEIGHTS = dict(scorer.WEIGHTS, popularity=0.35, recency=0.05)
+
+        new_state, report = rescore(state, scorer)
+        expected = [scorer.score_loop(f) for f in features]
+
+        assert report.weights_changed and report.rebucketed == len(features)
+        assert new_state.overall_score.tolist() == [s.overall_score for s in expected]
+        assert [DECISIONS[c] for c in new_state.decision_code] == [s.approval_decision for s in expected]
+        assert new_state.confidence.tolist() == [s.confidence for s in expected]
+
+    def test_threshold_change_rebuckets_band_only(self):
+        """Test that only loops between the old and new threshold are re-decided"""
+        features, state = scored_state()
+        scorer = HeuristicQualityScorer()
+        scorer.APPROVAL_THRESHOLD = 0.5
+
+        new_state, report = rescore(state, scorer)
+        expected = [scorer.score_loop(f) for f in features]
+        band = (state.overall_score >= 0.5) & (state.overall_score < 0.6)
+
+        assert not report.weights_changed and report.thresholds_changed
+        assert report.rebucketed == int(band.sum())
+        assert [DECISIONS[c] for c in new_state.decision_code] == [s.approval_decision for s in expected]
+        assert new_state.confidence.tolist() == [s.confidence for s in expected]
+        assert set(report.transitions) == {"needs_review -> approved"}
+        assert len(report.moved) == report.transitions["needs_review -> approved"] == int(band.sum())
+        assert all(m["new_decision"] == "approved" for m in report.moved)
+
+    def test_unchanged_settings_move_nothing(self):
+        """Test that rescoring with the same settings is a no-op"""
+        _, state = scored_state(200)
+        new_state, report = rescore(state, HeuristicQualityScorer())
+
+        assert report.rebucketed == 0 and report.moved == []
+        assert np.array_equal(new_state.decision_code, state.decision_code)
+
+    def test_save_load_roundtrip(self, tmp_path):
+        """Test that a saved state loads back unchanged"""
+        _, state = scored_state(100)
+        path = tmp_path / "score_components.npz"
+        state.save(path)
+        loaded = ScoreState.load(path)
+
+        assert loaded.names == state.names
+        assert loaded.weights == state.weights
+        assert loaded.approval_threshold == state.approval_threshold
+        assert np.array_equal(loaded.loop_id, state.loop_id)
+        assert np.array_equal(loaded.components, state.components)
+        assert np.array_equal(loaded.decision_code, state.decision_code)
+
+    def test_from_batch_matches_from_scores(self):
+        """Test that a state built from score_batch equals one built from score_loop"""
+        features, state = scored_state(300)
+        scorer = HeuristicQualityScorer()
+        batch_state = ScoreState.from_batch(scorer.score_batch(scorer.feature_batch(features)), scorer)
+
+        assert np.array_equal(batch_state.components, state.components)
+        assert np.array_equal(batch_state.overall_score, state.overall_score)
+        assert np.array_equal(batch_state.decision_code, state.decision_code)
@@ -2,12 +2,19 @@
 Unit tests for Web Scraper component
 """
 
+import asyncio
+import pickle
+import time
+
+import httpx
 import pytest
+from components.discovery.http_engine import AsyncFetchEngine
 from components.discovery.web_scraper import (
     LoopDiscovery,
     BaseScraperAgent,
     GitHubScraperAgent,
-    RedditScraperAgent
+    RedditScraperAgent,
+    ScraperOrchestrator
 )
 
 
@@ -114,3 +121,133 @@ class TestRedditScraperAgent:
         assert len(agent.keywords) > 0
         assert "automation" in agent.keywords
 
+
+def reddit_listing(page, has_next=True):
+    """Build an old.reddit listing page with two posts"""
+    posts = "".join(
+        f'<div class="thing"><a class="title" href="/r/Python/comments/{page}{i}/">python script {page}{i}</a></div>'
+        for i in range(2)
+    )
+    next_link = f'<span class="next-button"><a href="/r/Python/?after={page}">next</a></span>' if has_next else ""
+    return f"<html><body>{posts}{next_link}</body></html>"
+
+
+def run_crawl(agent, handler, url):
+    async def run():
+        async with AsyncFetchEngine(transport=httpx.MockTransport(handler)) as engine:
+            return [page async for page in agent.crawl_source(engine, url)]
+
+    return asyncio.run(run())
+
+
+class TestPagination:
+    """Test paginated crawling of a single source"""
+
+    def test_follows_next_links_up_to_max_pages(self):
+        """Test cursor pagination stops at the depth limit"""
+        requested = []
+
+        def handler(request):
+            requested.append(str(request.url))
+            return httpx.Response(200, text=reddit_listing(len(requested)))
+
+        agent = RedditScraperAgent()
+        agent.max_pages = 3
+        agent.max_items = None
+        pages = run_crawl(agent, handler, "https://old.reddit.com/r/Python/")
+
+        assert len(pages) == 3
+        assert requested[1] == "https://old.reddit.com/r/Python/?after=1"
+
+    def test_stops_without_next_link(self):
+        """Test cursor pagination stops on the last page"""
+        def handler(request):
+            return httpx.Response(200, text=reddit_listing(1, has_next=False))
+
+        pages = run_crawl(RedditScraperAgent(), handler, "https://old.reddit.com/r/Python/")
+        assert len(pages) == 1
+
+    def test_item_budget(self):
+        """Test that the per-source item budget truncates the crawl"""
+        def handler(request):
+            return httpx.Response(200, text=reddit_listing(request.url.params.get("after", "0")))
+
+        agent = RedditScraperAgent()
+        agent.max_items = 3
+        pages = run_crawl(agent, handler, "https://old.reddit.com/r/Python/")
+
+        assert sum(len(page) for page in pages) == 3
+
+    def test_numbered_pages_fetched_concurrently(self):
+        """Test that numbered pages are all in flight at once"""
+        in_flight = {"now": 0, "peak": 0}
+
+        async def handler(request):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return httpx.Response(200, text=reddit_listing(request.url.params.get("page", "1")))
+
+        class NumberedAgent(RedditScraperAgent):
+            def page_urls(self, url):
+                return [f"{url}?page={n}" for n in range(2, 10)]
+
+        agent = NumberedAgent()
+        agent.max_items = None
+        pages = run_crawl(agent, handler, "https://old.reddit.com/r/Python/")
+
+        assert len(pages) == agent.max_pages
+        assert in_flight["peak"] == agent.max_pages
+
+
+class TestParsePool:
+    """Test the process-pool parse phase"""
+
+    def test_agent_pickles_config_only(self):
+        """Test that agents ship to workers without their results"""
+        agent = RedditScraperAgent()
+        agent.discovered_loops.append("result")
+        clone = pickle.loads(pickle.dumps(agent))
+
+        assert clone.discovered_loops == []
+        assert clone.keywords == agent.keywords
+        assert clone.parser is agent.parser
+
+    def test_pool_matches_inline_parse(self):
+        """Test that parsing in worker processes gives the same discoveries"""
+        def handler(request):
+            return httpx.Response(200, text=reddit_listing(request.url.path.split("/")[2], has_next=False))
+
+        def crawl(parse_workers):
+            orchestrator = ScraperOrchestrator(parse_workers=parse_workers)
+            orchestrator.agents = [RedditScraperAgent()]
+            orchestrator.create_engine = lambda: AsyncFetchEngine(transport=httpx.MockTransport(handler))
+            return [d.source_url for d in asyncio.run(orchestrator.run_all_agents())]
+
+        assert crawl(parse_workers=2) == crawl(parse_workers=0)
+
+    def test_pool_shutdown_does_not_block_loop(self):
+        """Test that other coroutines keep running while the parse pool shuts down"""
+        orchestrator = ScraperOrchestrator(parse_workers=1)
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        async def run():
+            ticker = asyncio.ensure_future(tick())
+            async with orchestrator.parse_pool() as pool:
+                pool.submit(time.sleep, 0.5)
+                await asyncio.sleep(0.05)
+            closed = time.monotonic()
+            ticker.cancel()
+            return closed
+
+        start = time.monotonic()
+        closed = asyncio.run(run())
+        # The running task held shutdown for ~0.45s; the ticker ran throughout
+        assert closed - start >= 0.4
+        assert len([t for t in ticks if start + 0.1 < t < closed]) > 10